@@ -8,7 +8,7 @@ mock_impl.py (testing).
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 
 class MeshBuilder(ABC):
@@ -530,6 +530,27 @@ class AnimationBuilder(ABC):
         """
         ...
 
+    @abstractmethod
+    def add_keyframes(
+        self,
+        fcurve: Any,
+        points: Sequence[Tuple[float, float]],
+        interpolation: str = "BEZIER",
+        handles: Optional[
+            Sequence[Optional[Tuple[Tuple[float, float], Tuple[float, float]]]]
+        ] = None,
+    ) -> None:
+        """
+        Add several keyframes to an FCurve in one batch.
+
+        :param fcurve: FCurve to add keyframes to.
+        :param points: (frame, value) of each keyframe.
+        :param interpolation: Interpolation type for all keyframes.
+        :param handles: Per keyframe (handle_left, handle_right) positions, or
+                        None for automatic handles. None for all automatic.
+        """
+        ...
+
     @abstractmethod
     def set_action_frame_range(
         self,
@@ -6,7 +6,7 @@ These classes wrap real Blender APIs and handle version compatibility.
 """
 
 import array
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import bpy
 import bmesh
@@ -314,6 +314,41 @@ class BlenderAnimationBuilder(AnimationBuilder):
 
         return kf
 
+    def add_keyframes(
+        self,
+        fcurve: bpy.types.FCurve,
+        points: Sequence[Tuple[float, float]],
+        interpolation: str = "BEZIER",
+        handles: Optional[
+            Sequence[Optional[Tuple[Tuple[float, float], Tuple[float, float]]]]
+        ] = None,
+    ) -> None:
+        keyframe_points = fcurve.keyframe_points
+        start = len(keyframe_points)
+        keyframe_points.add(len(points))
+
+        coords = array.array("f", [c for point in points for c in point])
+        if start == 0:
+            keyframe_points.foreach_set("co", coords)
+        else:
+            for kf, (frame, value) in zip(keyframe_points[start:], points):
+                kf.co = (frame, value)
+
+        new_points = keyframe_points[start:]
+        for kf in new_points:
+            kf.interpolation = interpolation
+
+        if handles is not None:
+            for kf, handle in zip(new_points, handles):
+                if handle is None:
+                    continue
+                kf.handle_left_type = "FREE"
+                kf.handle_right_type = "FREE"
+                kf.handle_left, kf.handle_right = handle
+
+        # Sort keyframes and recompute automatic handles
+        fcurve.update()
+
     def set_action_frame_range(
         self,
         action: bpy.types.Action,
@@ -7,7 +7,7 @@ to run without requiring Blender to be installed.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .api import (
     MeshBuilder,
@@ -479,6 +479,23 @@ class MockAnimationBuilder(AnimationBuilder):
         fcurve.keyframe_points.append(kf)
         return kf
 
+    def add_keyframes(
+        self,
+        fcurve: MockFCurve,
+        points: Sequence[Tuple[float, float]],
+        interpolation: str = "BEZIER",
+        handles: Optional[
+            Sequence[Optional[Tuple[Tuple[float, float], Tuple[float, float]]]]
+        ] = None,
+    ) -> None:
+        if handles is None:
+            handles = [None] * len(points)
+        for (frame, value), handle in zip(points, handles):
+            handle_left, handle_right = handle if handle is not None else (None, None)
+            self.add_keyframe(
+                fcurve, frame, value, interpolation, handle_left, handle_right
+            )
+
     def set_action_frame_range(
         self,
         action: MockAction,
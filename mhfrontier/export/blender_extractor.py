@@ -203,6 +203,29 @@ class SkeletonExtractor:
     - Blender armatures
     """
 
+    @staticmethod
+    def flatten_hierarchy(root: Any) -> Tuple[List[Any], List[int]]:
+        """
+        Flatten an object hierarchy into parallel object and parent-index lists.
+
+        Objects are listed in depth-first pre-order, so every parent comes
+        before its children. The root has parent index -1.
+
+        :param root: Root object of the hierarchy.
+        :return: Tuple of (objects, parent index of each object).
+        """
+        objects: List[Any] = []
+        parents: List[int] = []
+        stack = [(root, -1)]
+        while stack:
+            obj, parent_index = stack.pop()
+            index = len(objects)
+            objects.append(obj)
+            parents.append(parent_index)
+            # Reversed so that children are visited in their original order
+            stack.extend((child, index) for child in reversed(obj.children))
+        return objects, parents
+
     def extract_from_empties(self, root_empty: Any) -> List[ExtractedBone]:
         """
         Extract bones from empty object hierarchy.
@@ -211,55 +234,57 @@ class SkeletonExtractor:
         :return: List of extracted bones.
         """
         bones = []
-        bone_map: Dict[str, int] = {}
+        objects, parents = self.flatten_hierarchy(root_empty)
+
+        # Per flattened object: is it a bone, and the node ID its children attach to
+        is_bone_at = [False] * len(objects)
+        attach_id_at = [-1] * len(objects)
 
         # First pass: collect all bones and assign IDs
-        def collect_bones(obj: Any, parent_id: int = -1) -> None:
+        for index, obj in enumerate(objects):
+            parent_index = parents[index]
+            parent_id = attach_id_at[parent_index] if parent_index >= 0 else -1
+
             # Check if this is a bone empty (has "id" custom property or "Bone." prefix)
+            has_id = "id" in obj
             is_bone = (
-                "id" in obj
+                has_id
                 or obj.name.startswith("Bone.")
-                or (obj.parent is not None and obj.parent.name in bone_map)
+                or (parent_index >= 0 and is_bone_at[parent_index])
             )
 
-            if is_bone:
-                # Extract bone ID from custom property or name
-                if "id" in obj:
-                    node_id = int(obj["id"])
-                elif obj.name.startswith("Bone."):
-                    try:
-                        node_id = int(obj.name.split(".")[1])
-                    except (IndexError, ValueError):
-                        node_id = len(bones)
-                else:
-                    node_id = len(bones)
+            if not is_bone:
+                attach_id_at[index] = parent_id
+                continue
 
-                bone_map[obj.name] = node_id
-
-                # Get local position from matrix
-                local_matrix = obj.matrix_local
-                position = (
-                    local_matrix[0][3] * EXPORT_SCALE,
-                    local_matrix[2][3] * EXPORT_SCALE,
-                    local_matrix[1][3] * EXPORT_SCALE,
-                    1.0,
-                )
-
-                bones.append(ExtractedBone(
-                    node_id=node_id,
-                    parent_id=parent_id,
-                    position=position,
-                ))
-
-                # Process children
-                current_id = node_id
+            # Extract bone ID from custom property or name
+            if has_id:
+                node_id = int(obj["id"])
+            elif obj.name.startswith("Bone."):
+                try:
+                    node_id = int(obj.name.split(".")[1])
+                except (IndexError, ValueError):
+                    node_id = len(bones)
             else:
-                current_id = parent_id
+                node_id = len(bones)
+
+            is_bone_at[index] = True
+            attach_id_at[index] = node_id
 
-            for child in obj.children:
-                collect_bones(child, current_id)
+            # Get local position from matrix
+            local_matrix = obj.matrix_local
+            position = (
+                local_matrix[0][3] * EXPORT_SCALE,
+                local_matrix[2][3] * EXPORT_SCALE,
+                local_matrix[1][3] * EXPORT_SCALE,
+                1.0,
+            )
 
-        collect_bones(root_empty)
+            bones.append(ExtractedBone(
+                node_id=node_id,
+                parent_id=parent_id,
+                position=position,
+            ))
 
         # Second pass: compute left_child and right_sibling relationships
         self._compute_bone_tree_structure(bones)
@@ -499,19 +524,19 @@ class MotionExtractor:
         # Parse bone name from data path (e.g., 'pose.bones["Bone.001"].location')
         bone_id = self._extract_bone_id(data_path)
         if bone_id is None:
-            self._logger.debug(f"Skipping non-bone FCurve: {data_path}")
+            self._logger.debug("Skipping non-bone FCurve: %s", data_path)
             return
 
         # Extract property name (location, rotation_euler, scale)
         prop_name = self._extract_property_name(data_path)
         if prop_name is None:
-            self._logger.debug(f"Unknown property in FCurve: {data_path}")
+            self._logger.debug("Unknown property in FCurve: %s", data_path)
             return
 
         # Map to Frontier channel type
         channel_key = (prop_name, array_index)
         if channel_key not in BLENDER_TO_FRONTIER_CHANNEL:
-            self._logger.debug(f"Unknown channel mapping: {channel_key}")
+            self._logger.debug("Unknown channel mapping: %s", channel_key)
             return
 
         channel_type = BLENDER_TO_FRONTIER_CHANNEL[channel_key]
@@ -14,6 +14,9 @@ from ..fmod.fblock import BlockType
 # Block header size: type (4) + count (4) + size (4) = 12 bytes
 HEADER_SIZE = 12
 
+# Little-endian block header: type, count, size
+_HEADER = struct.Struct("<III")
+
 
 class BlockBuilder:
     """
@@ -98,30 +101,40 @@ class BlockBuilder:
 
     def serialize_header(self) -> bytes:
         """Serialize the block header."""
-        return struct.pack(
-            "<III",  # Little-endian: type, count, size
-            self.block_type,
-            self.count,
-            self.total_size(),
-        )
+        return _HEADER.pack(self.block_type, self.count, self.total_size())
 
-    def serialize(self) -> bytes:
+    def serialize_into(self, buffer: bytearray) -> None:
         """
-        Serialize the entire block including header and content.
+        Append the entire block to a buffer.
 
-        :return: Complete block data as bytes.
+        The header is reserved first and its size field is filled in once the
+        content has been written, so sizes are not recomputed per level.
+
+        :param buffer: Buffer to append the block to.
         """
-        parts = [self.serialize_header()]
+        start = len(buffer)
+        buffer += bytes(HEADER_SIZE)
 
         # Serialize children first
         for child in self.children:
-            parts.append(child.serialize())
+            child.serialize_into(buffer)
 
         # Append raw data
-        if self.raw_data:
-            parts.append(self.raw_data)
+        buffer += self.raw_data
+
+        _HEADER.pack_into(
+            buffer, start, self.block_type, self.count, len(buffer) - start
+        )
 
-        return b"".join(parts)
+    def serialize(self) -> bytes:
+        """
+        Serialize the entire block including header and content.
+
+        :return: Complete block data as bytes.
+        """
+        buffer = bytearray()
+        self.serialize_into(buffer)
+        return bytes(buffer)
 
 
 class DataBlockBuilder(BlockBuilder):
@@ -20,6 +20,14 @@ _logger = get_logger("export.fskl")
 # rotation(16) + position(16) + sentinel(4) + chainID(4) + reserved(184)
 BONE_BLOCK_SIZE = 252
 
+# nodeID, parentID, leftChild, rightSibling, scale, rotation, position,
+# sentinel, chainID, then 184 reserved zero bytes
+_BONE_BLOCK = struct.Struct("<iiii4f4f4fII184x")
+_BONE_SENTINEL = 0xFFFFFFFF
+
+# Complete BONE block: block header (type, count, size) followed by the bone
+_BONE_RECORD = struct.Struct("<III" + _BONE_BLOCK.format[1:])
+
 
 def serialize_bone_block(bone: ExtractedBone) -> bytes:
     """
@@ -28,36 +36,17 @@ def serialize_bone_block(bone: ExtractedBone) -> bytes:
     :param bone: Extracted bone data.
     :return: 252-byte binary representation.
     """
-    parts = []
-
-    # nodeID, parentID, leftChild, rightSibling (4 int32 each)
-    parts.append(struct.pack(
-        "<iiii",
+    return _BONE_BLOCK.pack(
         bone.node_id,
         bone.parent_id,
         bone.left_child,
         bone.right_sibling,
-    ))
-
-    # scale (4 floats)
-    parts.append(struct.pack("<ffff", *bone.scale))
-
-    # rotation (4 floats)
-    parts.append(struct.pack("<ffff", *bone.rotation))
-
-    # position (4 floats)
-    parts.append(struct.pack("<ffff", *bone.position))
-
-    # sentinel (always 0xFFFFFFFF)
-    parts.append(struct.pack("<I", 0xFFFFFFFF))
-
-    # chainID
-    parts.append(struct.pack("<I", bone.chain_id))
-
-    # reserved (46 uint32 = 184 bytes of zeros)
-    parts.append(b"\x00" * 184)
-
-    return b"".join(parts)
+        *bone.scale,
+        *bone.rotation,
+        *bone.position,
+        _BONE_SENTINEL,
+        bone.chain_id,
+    )
 
 
 def build_bone_block(bone: ExtractedBone) -> BlockBuilder:
@@ -105,10 +94,31 @@ def build_fskl_file(bones: List[ExtractedBone]) -> bytes:
     # Add metadata block first
     skeleton.add_child(build_metadata_block())
 
-    # Sort bones by node_id and add each as a BONE block
+    # Sort bones by node_id and pack all BONE blocks into one buffer,
+    # without building a BlockBuilder per bone
     sorted_bones = sorted(bones, key=lambda b: b.node_id)
-    for bone in sorted_bones:
-        skeleton.add_child(build_bone_block(bone))
+    record_size = _BONE_RECORD.size
+    bone_data = bytearray(record_size * len(sorted_bones))
+    pack_into = _BONE_RECORD.pack_into
+    bone_type = int(BlockType.BONE)
+    for i, bone in enumerate(sorted_bones):
+        pack_into(
+            bone_data,
+            i * record_size,
+            bone_type,
+            1,
+            record_size,
+            bone.node_id,
+            bone.parent_id,
+            bone.left_child,
+            bone.right_sibling,
+            *bone.scale,
+            *bone.rotation,
+            *bone.position,
+            _BONE_SENTINEL,
+            bone.chain_id,
+        )
+    skeleton.set_raw_data(bytes(bone_data))
 
     return skeleton.serialize()
 
@@ -6,16 +6,18 @@ High-level export orchestration that extracts data from Blender collections
 and builds stage container (.pac) files.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, List, Optional, Sequence, Tuple
 
 from .blender_extractor import ExtractedMaterial, ExtractedMesh, MeshExtractor, MaterialExtractor
 from .fmod_export import build_fmod_file
 from ..logging_config import get_logger
-from ..stage.jkr_compress import compress_jkr_hfi, CompressionType, compress_jkr
+from ..stage.jkr_compress import compress_jkr_hfi, CompressionType, compress_jkr, LZEncoder
 from ..stage.stage_export import (
     StageSegmentBuilder,
     build_stage_container,
+    build_stage_container_parts,
     build_segment_from_fmod,
     build_segment_from_texture,
     build_segment_from_audio,
@@ -34,6 +36,7 @@ class StageExportOptions:
     include_textures: bool = True
     include_audio: bool = True
     apply_modifiers: bool = True
+    validate: bool = False
 
 
 @dataclass
@@ -47,6 +50,53 @@ class ExtractedStageData:
     audio: List[bytes] = field(default_factory=list)
 
 
+def collect_mesh_objects(collection: Any) -> Tuple[Any, ...]:
+    """
+    Snapshot the mesh objects of a collection, including nested collections.
+
+    collection.all_objects walks every child collection on each access, so
+    callers should take this snapshot once and pass it along.
+
+    :param collection: Blender Collection object.
+    :return: Mesh objects, in collection order.
+    """
+    return tuple(obj for obj in collection.all_objects if obj.type == "MESH")
+
+
+def validate_meshes(meshes: List[ExtractedMesh]) -> None:
+    """
+    Check that extracted meshes are consistent before building the FMOD.
+
+    Each face must index existing vertices, and per-vertex attributes
+    must have one entry per vertex.
+
+    :param meshes: Extracted meshes.
+    :raises ValueError: If a mesh is inconsistent.
+    """
+    for mesh in meshes:
+        vertex_count = len(mesh.vertices)
+        if len(mesh.normals) != vertex_count:
+            raise ValueError(
+                f"Mesh '{mesh.name}' has {len(mesh.normals)} normals "
+                f"for {vertex_count} vertices"
+            )
+        for attribute in ("uvs", "vertex_colors"):
+            values = getattr(mesh, attribute)
+            if values is not None and len(values) != vertex_count:
+                raise ValueError(
+                    f"Mesh '{mesh.name}' has {len(values)} {attribute} "
+                    f"for {vertex_count} vertices"
+                )
+        if mesh.faces:
+            highest = max(max(face) for face in mesh.faces)
+            lowest = min(min(face) for face in mesh.faces)
+            if lowest < 0 or highest >= vertex_count:
+                raise ValueError(
+                    f"Mesh '{mesh.name}' has a face index out of range "
+                    f"(0..{vertex_count - 1})"
+                )
+
+
 class StageExtractor:
     """
     Extract stage data from a Blender collection.
@@ -68,12 +118,15 @@ class StageExtractor:
         self,
         collection: Any,
         depsgraph: Optional[Any] = None,
+        mesh_objects: Optional[Sequence[Any]] = None,
     ) -> ExtractedStageData:
         """
         Extract all stage data from a Blender collection.
 
         :param collection: Blender Collection object.
         :param depsgraph: Blender dependency graph (optional).
+        :param mesh_objects: Mesh objects of the collection, if the caller
+                             already collected them. Skips another collection walk.
         :return: Extracted stage data.
         """
         result = ExtractedStageData()
@@ -81,15 +134,28 @@ class StageExtractor:
         if collection is None:
             return result
 
+        if mesh_objects is None:
+            mesh_objects = collect_mesh_objects(collection)
+
         # Extract meshes from all objects in collection
         materials_dict = {}
+        # Extracted geometry of unmodified mesh data, shared by linked duplicates
+        mesh_cache = {}
+        apply_modifiers = self.options.apply_modifiers and depsgraph is not None
 
-        for obj in collection.all_objects:
-            if obj.type != "MESH":
-                continue
-
+        for obj in mesh_objects:
             try:
-                mesh = self._mesh_extractor.extract(obj, depsgraph)
+                if apply_modifiers and obj.modifiers:
+                    mesh = self._mesh_extractor.extract(obj, depsgraph)
+                else:
+                    key = (obj.data.as_pointer(), len(obj.vertex_groups))
+                    cached = mesh_cache.get(key)
+                    if cached is None:
+                        mesh = mesh_cache[key] = self._mesh_extractor.extract(
+                            obj, depsgraph
+                        )
+                    else:
+                        mesh = replace(cached, name=obj.name)
                 result.meshes.append(mesh)
 
                 # Collect materials
@@ -129,6 +195,46 @@ class StageExtractor:
         return meshes
 
 
+def compress_segment_data(
+    data: bytes,
+    compression_type: int = CompressionType.HFI,
+    max_workers: Optional[int] = None,
+) -> bytes:
+    """
+    JKR-compress segment data, optionally parsing large LZ77 input in workers.
+
+    Data is compressed in this process unless the caller opts in with
+    max_workers, as for decompress_segments on import: process pools are
+    not started by default because they can hang inside Blender. When opted
+    in, the LZ77 parse (the dominant cost, pure Python holding the GIL) of
+    data spanning several chunks runs in worker processes, and a failing
+    pool falls back to compressing in this process.
+
+    :param data: Uncompressed data.
+    :param compression_type: JKR compression type to use.
+    :param max_workers: Number of worker processes to use, None or 1 to
+                        compress in this process.
+    :return: Complete JKR file data.
+    """
+    uses_lz = compression_type in (CompressionType.LZ, CompressionType.HFI)
+    if (
+        not uses_lz
+        or max_workers is None
+        or max_workers < 2
+        or len(data) < 2 * LZEncoder.PARALLEL_CHUNK_SIZE
+    ):
+        return compress_jkr(data, compression_type)
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return compress_jkr(data, compression_type, executor)
+    except Exception as e:
+        _logger.warning(
+            "Parallel compression unavailable (%s), compressing sequentially", e
+        )
+        return compress_jkr(data, compression_type)
+
+
 def build_fmod_segment(
     meshes: List[ExtractedMesh],
     materials: List[ExtractedMaterial],
@@ -148,7 +254,7 @@ def build_fmod_segment(
     fmod_data = build_fmod_file(meshes, materials)
 
     if compress:
-        compressed = compress_jkr(fmod_data, compression_type)
+        compressed = compress_segment_data(fmod_data, compression_type)
         return StageSegmentBuilder(
             data=compressed,
             segment_type=SegmentType.JKR,
@@ -165,6 +271,7 @@ def export_stage(
     collection: Any,
     depsgraph: Optional[Any] = None,
     options: Optional[StageExportOptions] = None,
+    mesh_objects: Optional[Sequence[Any]] = None,
 ) -> None:
     """
     Export a Blender collection as a stage container (.pac file).
@@ -173,6 +280,7 @@ def export_stage(
     :param collection: Blender collection to export.
     :param depsgraph: Blender dependency graph.
     :param options: Export options.
+    :param mesh_objects: Mesh objects of the collection, if already collected.
     """
     options = options or StageExportOptions()
 
@@ -180,7 +288,7 @@ def export_stage(
 
     # Extract data from collection
     extractor = StageExtractor(options)
-    stage_data = extractor.extract_from_collection(collection, depsgraph)
+    stage_data = extractor.extract_from_collection(collection, depsgraph, mesh_objects)
 
     if not stage_data.meshes:
         _logger.warning("No meshes found in collection")
@@ -190,6 +298,9 @@ def export_stage(
             f.write(container_data)
         return
 
+    if options.validate:
+        validate_meshes(stage_data.meshes)
+
     # Build segments
     segments = []
 
@@ -230,16 +341,16 @@ def export_stage(
         if i < 3 or len(seg.data) > 0:
             filtered_segments.append(seg)
 
-    # Build container
-    container_data = build_stage_container(filtered_segments)
+    # Build container and write the chunks without joining them
+    container_parts = build_stage_container_parts(filtered_segments)
 
-    # Write to file
     with open(filepath, "wb") as f:
-        f.write(container_data)
+        f.writelines(container_parts)
 
     _logger.info(
         f"Stage export complete: {len(stage_data.meshes)} meshes, "
-        f"{len(filtered_segments)} segments, {len(container_data)} bytes"
+        f"{len(filtered_segments)} segments, "
+        f"{sum(len(part) for part in container_parts)} bytes"
     )
 
 
@@ -284,9 +395,11 @@ def export_stage_from_meshes(
     segments.append(StageSegmentBuilder(data=b"", segment_type=SegmentType.UNKNOWN))
 
     # Build container
-    container_data = build_stage_container(segments)
+    container_parts = build_stage_container_parts(segments)
 
     with open(filepath, "wb") as f:
-        f.write(container_data)
+        f.writelines(container_parts)
 
-    _logger.info(f"Stage export complete: {len(container_data)} bytes")
+    _logger.info(
+        f"Stage export complete: {sum(len(part) for part in container_parts)} bytes"
+    )
@@ -13,7 +13,7 @@ Motion file structure:
 import struct
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from ..stage.jkr_decompress import decompress_jkr, is_jkr_file
 
@@ -50,6 +50,12 @@ BLOCK_ANIMATION_HEADER = 0x80000002
 BLOCK_KEYFRAME_TYPE_MASK = 0xFFFF0000
 BLOCK_KEYFRAME_TYPE = 0x80120000
 
+# Pre-compiled structs for the hot read paths
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+_ANIMATION_HEADER = struct.Struct("<IIII")
+_KEYFRAME = struct.Struct("<hhhH")
+
 
 @dataclass
 class Keyframe:
@@ -85,17 +91,12 @@ class MotionData:
 
 def _read_uint32(data: bytes, offset: int) -> int:
     """Read unsigned 32-bit integer at offset."""
-    return struct.unpack_from("<I", data, offset)[0]
-
-
-def _read_int16(data: bytes, offset: int) -> int:
-    """Read signed 16-bit integer at offset."""
-    return struct.unpack_from("<h", data, offset)[0]
+    return _U32.unpack_from(data, offset)[0]
 
 
 def _read_uint16(data: bytes, offset: int) -> int:
     """Read unsigned 16-bit integer at offset."""
-    return struct.unpack_from("<H", data, offset)[0]
+    return _U16.unpack_from(data, offset)[0]
 
 
 def _find_animation_blocks(data: bytes) -> List[int]:
@@ -108,17 +109,41 @@ def _find_animation_blocks(data: bytes) -> List[int]:
     :param data: Raw motion file data.
     :return: List of offsets to animation blocks.
     """
-    offsets = []
+    # Scan 4-byte aligned words for animation header blocks (0x80000002)
+    scan_len = max(len(data) - 8, 0)
+    words = _U32.iter_unpack(memoryview(data)[: (scan_len + 3) & ~3])
+    return [
+        index * 4
+        for index, (val,) in enumerate(words)
+        if val == BLOCK_ANIMATION_HEADER
+    ]
 
-    # Scan for animation header blocks (0x80000002)
-    pos = 0
-    while pos < len(data) - 8:
-        val = _read_uint32(data, pos)
-        if val == BLOCK_ANIMATION_HEADER:
-            offsets.append(pos)
-        pos += 4
 
-    return offsets
+def find_bin_animation_blocks(data: bytes) -> List[Tuple[int, int]]:
+    """
+    Find the animation blocks stored in a .bin motion container.
+
+    Scans every 4-byte aligned word for an animation header and reads the
+    block size stored 8 bytes after it. Candidates whose size runs past the
+    end of the data are false matches in other payloads and are rejected.
+
+    :param data: Raw .bin container data.
+    :return: List of (offset, size) tuples, in file order.
+    """
+    data_len = len(data)
+    # Headers are only considered when a full 16-byte header fits
+    scan_len = max(data_len - 16, 0)
+    words = _U32.iter_unpack(memoryview(data)[: (scan_len + 3) & ~3])
+    unpack_from = _U32.unpack_from
+
+    blocks = []
+    for index, (val,) in enumerate(words):
+        if val == BLOCK_ANIMATION_HEADER:
+            offset = index * 4
+            size = unpack_from(data, offset + 8)[0]
+            if offset + size <= data_len:
+                blocks.append((offset, size))
+    return blocks
 
 
 def _parse_keyframes_from_block(
@@ -152,27 +177,23 @@ def _parse_keyframes_from_block(
         return channel_anim, pos + 8
 
     # Read block header
-    block_type = _read_uint32(data, pos)
     count = _read_uint16(data, pos + 4)
 
-    # Parse keyframes
+    # Parse keyframes, clamped to the keyframes fully inside the data
     kf_pos = pos + 8
-    for i in range(count):
-        if kf_pos + 8 > len(data):
-            break
-
-        tangent_in = _read_int16(data, kf_pos)
-        tangent_out = _read_int16(data, kf_pos + 2)
-        value = _read_int16(data, kf_pos + 4)
-        frame = _read_uint16(data, kf_pos + 6)
-
-        kf = Keyframe(
-            frame=frame,
-            value=float(value),
-            tangent_in=float(tangent_in),
-            tangent_out=float(tangent_out),
+    count = min(count, (len(data) - kf_pos) // 8)
+    keyframes = channel_anim.keyframes
+    unpack_keyframe = _KEYFRAME.unpack_from
+    for _ in range(count):
+        tangent_in, tangent_out, value, frame = unpack_keyframe(data, kf_pos)
+        keyframes.append(
+            Keyframe(
+                frame=frame,
+                value=float(value),
+                tangent_in=float(tangent_in),
+                tangent_out=float(tangent_out),
+            )
         )
-        channel_anim.keyframes.append(kf)
         kf_pos += 8
 
     # Calculate next position (align to 4 bytes)
@@ -206,14 +227,12 @@ def _parse_animation_at_offset(data: bytes, start_offset: int) -> Optional[Motio
         return None
 
     # Read animation header
-    header_type = _read_uint32(data, start_offset)
+    header_type, anim_count, total_size, format_version = (
+        _ANIMATION_HEADER.unpack_from(data, start_offset)
+    )
     if header_type != BLOCK_ANIMATION_HEADER:
         return None
 
-    anim_count = _read_uint32(data, start_offset + 4)
-    total_size = _read_uint32(data, start_offset + 8)
-    format_version = _read_uint32(data, start_offset + 12)
-
     motion = MotionData()
     max_frame = 0
 
@@ -282,11 +301,11 @@ def _parse_animation_at_offset(data: bytes, start_offset: int) -> Optional[Motio
     return motion
 
 
-def load_motion_from_bytes(data: bytes) -> MotionData:
+def load_motion_from_bytes(data: Union[bytes, memoryview]) -> MotionData:
     """
     Load motion data from raw bytes.
 
-    :param data: Raw motion file data.
+    :param data: Raw motion file data, bytes or any read-only buffer view.
     :return: Parsed MotionData.
     """
     # Check for JKR compression and decompress if needed
@@ -11,6 +11,7 @@ Public API:
     - import_skeleton: Import FSKL skeleton files
     - import_motion: Import motion/animation files
     - import_stage: Import stage containers or directories
+    - iter_import_packed_stage: Import a stage container one segment at a time
     - clear_scene: Clear all objects from the scene
 """
 
@@ -19,6 +20,7 @@ from .skeleton import import_skeleton
 from .motion import import_motion, import_motion_from_bytes
 from .stage import (
     import_stage,
+    iter_import_packed_stage,
     import_fmod_file,
     import_jkr_file,
     import_fmod_from_bytes,
@@ -31,6 +33,7 @@ __all__ = [
     "import_motion",
     "import_motion_from_bytes",
     "import_stage",
+    "iter_import_packed_stage",
     "import_fmod_file",
     "import_jkr_file",
     "import_fmod_from_bytes",
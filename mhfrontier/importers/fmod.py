@@ -35,14 +35,12 @@ def import_model(
     builders.scene.set_render_engine("CYCLES")
     meshes, materials = fmod_parser.load_fmod_file(fmod_path)
 
-    # Create new materials
-    blender_materials: Dict[int, Any] = {}
-    for mesh in meshes:
-        for mat_id in mesh.material_list:
-            if mat_id not in blender_materials:
-                blender_materials[mat_id] = builders.material.create_material(
-                    name="FrontierMaterial-%03d" % mat_id
-                )
+    # Create new materials, once per unique material id
+    unique_mat_ids = sorted({mat_id for mesh in meshes for mat_id in mesh.material_list})
+    blender_materials: Dict[int, Any] = {
+        mat_id: builders.material.create_material(name="FrontierMaterial-%03d" % mat_id)
+        for mat_id in unique_mat_ids
+    }
 
     # Create meshes
     for ix, mesh in enumerate(meshes):
@@ -36,6 +36,11 @@ def import_textures(
     if builders is None:
         builders = get_builders()
 
+    # Find all available texture files once, the result is the same for every material
+    texture_files = find_all_textures(path)
+    # Images shared between materials are only loaded once
+    image_cache: Dict[str, Any] = {}
+
     for ix, mat in blender_materials.items():
         # Setup material for nodes
         node_tree = builders.material.enable_nodes(mat)
@@ -46,9 +51,6 @@ def import_textures(
         normal_ix = materials[ix].normal_id
         specular_ix = materials[ix].specular_id
 
-        # Find all available texture files
-        texture_files = find_all_textures(path)
-
         # Build shader node tree using abstracted setup
         _setup_principled_shader(
             node_tree,
@@ -57,9 +59,31 @@ def import_textures(
             normal_ix,
             specular_ix,
             builders,
+            image_cache,
         )
 
 
+def _load_image_cached(
+    filepath: str,
+    builders: Builders,
+    image_cache: Optional[Dict[str, Any]],
+) -> Any:
+    """
+    Load an image, reusing a previously loaded one for the same file.
+
+    :param filepath: Path to the image file.
+    :param builders: Builders for image loading.
+    :param image_cache: Images already loaded, by file path. None disables caching.
+    :return: Loaded image.
+    """
+    if image_cache is None:
+        return builders.image.load_image(filepath)
+    image = image_cache.get(filepath)
+    if image is None:
+        image = image_cache[filepath] = builders.image.load_image(filepath)
+    return image
+
+
 def _setup_principled_shader(
     node_tree: Any,
     texture_files: List[str],
@@ -67,6 +91,7 @@ def _setup_principled_shader(
     normal_ix: Optional[int],
     specular_ix: Optional[int],
     builders: Builders,
+    image_cache: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Set up a Principled BSDF shader with textures.
@@ -77,6 +102,7 @@ def _setup_principled_shader(
     :param normal_ix: Index of normal texture, or None.
     :param specular_ix: Index of specular texture, or None.
     :param builders: Builders for node operations.
+    :param image_cache: Optional cache of loaded images, by file path.
     """
     # Create main BSDF node
     bsdf_node = builders.material.create_principled_bsdf(node_tree)
@@ -85,7 +111,7 @@ def _setup_principled_shader(
 
     # Diffuse texture setup
     if diffuse_ix is not None and diffuse_ix < len(texture_files):
-        texture = builders.image.load_image(texture_files[diffuse_ix])
+        texture = _load_image_cached(texture_files[diffuse_ix], builders, image_cache)
         diffuse_tex_node = builders.material.create_texture_node(
             node_tree, texture, "Diffuse Texture", is_data=False
         )
@@ -110,7 +136,7 @@ def _setup_principled_shader(
 
     # Normal map setup
     if normal_ix is not None and normal_ix < len(texture_files):
-        texture = builders.image.load_image(texture_files[normal_ix])
+        texture = _load_image_cached(texture_files[normal_ix], builders, image_cache)
         normal_tex_node = builders.material.create_texture_node(
             node_tree, texture, "Normal Texture", is_data=True
         )
@@ -124,7 +150,7 @@ def _setup_principled_shader(
 
     # Specular map setup
     if specular_ix is not None and specular_ix < len(texture_files):
-        texture = builders.image.load_image(texture_files[specular_ix])
+        texture = _load_image_cached(texture_files[specular_ix], builders, image_cache)
         specular_tex_node = builders.material.create_texture_node(
             node_tree, texture, "Specular Texture", is_data=True
         )
@@ -163,16 +189,15 @@ def find_all_textures(path: str) -> List[str]:
     :return: List of texture file paths as strings.
     """
     model_path = Path(path)
-    in_children = [
-        f
-        for f in model_path.parents[1].glob("**/*")
-        if f.is_dir() and f > model_path.parent
-    ]
-    in_parents = [
-        f
-        for f in model_path.parents[1].glob("**/*")
-        if f.is_dir() and f < model_path.parent
+    # One walk lists every directory below the grandparent, using the
+    # entry types cached by the directory scan
+    subdirectories = [
+        Path(dirpath, name)
+        for dirpath, dirnames, _filenames in os.walk(model_path.parents[1])
+        for name in dirnames
     ]
+    in_children = [f for f in subdirectories if f > model_path.parent]
+    in_parents = [f for f in subdirectories if f < model_path.parent]
     directories = [
         model_path.parent,
         *sorted(in_children),
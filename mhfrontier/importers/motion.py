@@ -5,7 +5,7 @@ Abstraction layer for importing motion files to Blender animations.
 Converts parsed motion data to Blender Actions with FCurves.
 """
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..config import IMPORT_SCALE, ROTATION_SCALE
 from ..blender.builders import Builders, get_builders
@@ -215,6 +215,44 @@ def _set_bone_rotation_mode(armature: Any, bone_name: str, mode: str = "XYZ") ->
         bones[bone_name].rotation_mode = mode
 
 
+def _add_channel_keyframes(
+    fcurve: Any,
+    channel_anim: Any,
+    transform_type: str,
+    channel_type: int,
+    builders: Builders,
+) -> None:
+    """
+    Convert a channel's keyframes and add them to an FCurve in one batch.
+
+    :param fcurve: FCurve to add keyframes to.
+    :param channel_anim: ChannelAnimation with the Frontier keyframes.
+    :param transform_type: Transform type from _channel_to_property_info.
+    :param channel_type: Channel type identifier.
+    :param builders: Builders for animation operations.
+    """
+    points = []
+    handles = []
+    for kf in channel_anim.keyframes:
+        frame = float(kf.frame)
+        value = _transform_value(kf.value, transform_type, channel_type)
+        points.append((frame, value))
+
+        # Calculate handles if tangents are non-zero
+        if kf.tangent_in != 0 or kf.tangent_out != 0:
+            handles.append(
+                _calculate_bezier_handles(
+                    frame, value, kf.tangent_in, kf.tangent_out, transform_type
+                )
+            )
+        else:
+            handles.append(None)
+
+    builders.animation.add_keyframes(
+        fcurve, points, interpolation="BEZIER", handles=handles
+    )
+
+
 def import_motion(
     filepath: str,
     armature: Any,
@@ -252,7 +290,7 @@ def import_motion(
             if pose_bones is not None:
                 bones = getattr(pose_bones, "bones", {})
                 if bone_name not in bones:
-                    _logger.debug(f"Bone {bone_name} not in armature, skipping")
+                    _logger.debug("Bone %s not in armature, skipping", bone_name)
                     continue
                 # Set rotation mode to Euler for animation compatibility
                 _set_bone_rotation_mode(armature, bone_name, "XYZ")
@@ -273,32 +311,9 @@ def import_motion(
             fcurve = builders.animation.create_fcurve(action, data_path, index)
 
             # Add keyframes
-            for kf in channel_anim.keyframes:
-                # Transform value
-                value = _transform_value(kf.value, transform_type, channel_type)
-
-                # Calculate handles if tangents are non-zero
-                handle_left = None
-                handle_right = None
-
-                if kf.tangent_in != 0 or kf.tangent_out != 0:
-                    handle_left, handle_right = _calculate_bezier_handles(
-                        float(kf.frame),
-                        value,
-                        kf.tangent_in,
-                        kf.tangent_out,
-                        transform_type,
-                    )
-
-                # Add keyframe
-                builders.animation.add_keyframe(
-                    fcurve,
-                    float(kf.frame),
-                    value,
-                    interpolation="BEZIER",
-                    handle_left=handle_left,
-                    handle_right=handle_right,
-                )
+            _add_channel_keyframes(
+                fcurve, channel_anim, transform_type, channel_type, builders
+            )
 
     # Set frame range
     if motion_data.frame_count > 0:
@@ -317,7 +332,7 @@ def import_motion(
 
 
 def import_motion_from_bytes(
-    data: bytes,
+    data: Union[bytes, memoryview],
     armature: Any,
     name: str = "MHF_Motion",
     builders: Optional[Builders] = None,
@@ -325,17 +340,78 @@ def import_motion_from_bytes(
     """
     Import motion data from bytes and create a Blender Action.
 
-    :param data: Raw motion file bytes.
+    :param data: Raw motion file bytes, or a memoryview slice of a larger buffer.
     :param armature: Blender armature object to apply animation to.
     :param name: Name for the created action.
     :param builders: Optional builders (defaults to Blender implementation).
     :return: Created Action, or None if import failed.
     """
+    # Load motion data from bytes
+    motion_data = fmot.load_motion_from_bytes(data)
+    return import_motion_data(motion_data, armature, name, builders)
+
+
+def import_all_motions_from_bytes(
+    data: Union[bytes, memoryview],
+    blocks: List[Tuple[int, int]],
+    armature: Any,
+    name_prefix: str = "MHF_Motion",
+    builders: Optional[Builders] = None,
+) -> List[Any]:
+    """
+    Import every animation block of a .bin container as separate Actions.
+
+    Actions are created in block order and the first one is assigned to the
+    armature. A block that fails to parse is logged and skipped.
+
+    :param data: Raw .bin container data.
+    :param blocks: (offset, size) of each animation block.
+    :param armature: Blender armature object to apply animation to.
+    :param name_prefix: Prefix for action names, suffixed with "_anim_<index>".
+    :param builders: Optional builders (defaults to Blender implementation).
+    :return: Created Actions, skipping invalid blocks and those without
+             animation data.
+    """
+    view = memoryview(data)
+    actions = []
+    for idx, (offset, size) in enumerate(blocks):
+        try:
+            motion_data = fmot.load_motion_from_bytes(view[offset : offset + size])
+        except Exception as e:
+            _logger.warning("Skipping animation block %d at 0x%X: %s", idx, offset, e)
+            continue
+        action = import_motion_data(
+            motion_data,
+            armature,
+            f"{name_prefix}_anim_{idx}",
+            builders,
+            assign=not actions,
+        )
+        if action is not None:
+            actions.append(action)
+    return actions
+
+
+def import_motion_data(
+    motion_data: MotionData,
+    armature: Any,
+    name: str = "MHF_Motion",
+    builders: Optional[Builders] = None,
+    assign: bool = True,
+) -> Any:
+    """
+    Create a Blender Action from parsed motion data.
+
+    :param motion_data: Parsed motion data.
+    :param armature: Blender armature object to apply animation to.
+    :param name: Name for the created action.
+    :param builders: Optional builders (defaults to Blender implementation).
+    :param assign: Assign the created action to the armature.
+    :return: Created Action, or None if there is no animation data.
+    """
     if builders is None:
         builders = get_builders()
 
-    # Load motion data from bytes
-    motion_data = fmot.load_motion_from_bytes(data)
     motion_data.name = name
 
     if not motion_data.bone_animations:
@@ -362,34 +438,14 @@ def import_motion_from_bytes(
             data_path = f'pose.bones["{bone_name}"].{prop_name}'
             fcurve = builders.animation.create_fcurve(action, data_path, index)
 
-            for kf in channel_anim.keyframes:
-                value = _transform_value(kf.value, transform_type, channel_type)
-
-                handle_left = None
-                handle_right = None
-
-                if kf.tangent_in != 0 or kf.tangent_out != 0:
-                    handle_left, handle_right = _calculate_bezier_handles(
-                        float(kf.frame),
-                        value,
-                        kf.tangent_in,
-                        kf.tangent_out,
-                        transform_type,
-                    )
-
-                builders.animation.add_keyframe(
-                    fcurve,
-                    float(kf.frame),
-                    value,
-                    interpolation="BEZIER",
-                    handle_left=handle_left,
-                    handle_right=handle_right,
-                )
+            _add_channel_keyframes(
+                fcurve, channel_anim, transform_type, channel_type, builders
+            )
 
     if motion_data.frame_count > 0:
         builders.animation.set_action_frame_range(action, 0, motion_data.frame_count - 1)
 
-    if armature is not None:
+    if assign and armature is not None:
         builders.animation.assign_action_to_object(armature, action)
 
     return action
@@ -12,7 +12,7 @@ Created for MHFrontier stage import support.
 """
 
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 
 from ..fmod import fmod
 from ..blender.builders import Builders, get_builders
@@ -23,13 +23,33 @@ from .mesh import (
     create_texture_layer,
     set_weights,
 )
-from .stage_container import import_packed_stage, import_segments
+from .stage_container import (
+    import_packed_stage,
+    import_segments,
+    iter_import_segments,
+    load_packed_stage,
+)
 from .stage_directory import (
     import_unpacked_stage as _import_unpacked_stage,
     import_fmod_file as _import_fmod_file,
     import_jkr_file as _import_jkr_file,
 )
 
+# Zero-padded indices used in object and material names, formatted once
+_PADDED_INDICES = tuple(f"{i:03d}" for i in range(1000))
+
+
+def _padded_index(index: int) -> str:
+    """
+    Format an index as a zero-padded three digit string.
+
+    :param index: Non-negative index.
+    :return: Index padded to at least three digits.
+    """
+    if index < 1000:
+        return _PADDED_INDICES[index]
+    return str(index)
+
 
 def import_stage(
     stage_path: str,
@@ -94,6 +114,64 @@ def import_stage(
         )
 
 
+def iter_import_packed_stage(
+    stage_path: str,
+    import_textures: bool = True,
+    clear_scene: bool = True,
+    create_collection: bool = True,
+    import_audio: bool = True,
+    builders: Optional[Builders] = None,
+) -> Iterator[Tuple[int, int, List[Any]]]:
+    """
+    Import a packed stage .pac file incrementally, one segment per step.
+
+    The container is read and parsed when this is called; each step of the
+    returned iterator decompresses and imports one segment.
+
+    :param stage_path: Path to the stage .pac file.
+    :param import_textures: Import textures if available.
+    :param clear_scene: Clear scene before import.
+    :param create_collection: Create a collection for the stage objects.
+    :param import_audio: Import audio files (OGG) if available.
+    :param builders: Optional builders (defaults to Blender implementation).
+    :return: Iterator of (segments done, segment total, objects imported by the step).
+    """
+    if builders is None:
+        builders = get_builders()
+
+    stage_path = Path(stage_path)
+    segments = load_packed_stage(stage_path)
+
+    if clear_scene:
+        builders.scene.clear_scene()
+
+    def fmod_from_bytes_with_builders(
+        data: bytes,
+        name: str,
+        import_tex: bool,
+        collection: Optional[Any],
+        texture_search_path: Optional[str] = None,
+    ) -> List[Any]:
+        return import_fmod_from_bytes(
+            data,
+            name,
+            import_tex,
+            collection,
+            texture_search_path,
+            builders,
+        )
+
+    return iter_import_segments(
+        segments,
+        stage_path.stem,
+        import_textures,
+        create_collection,
+        fmod_from_bytes_with_builders,
+        import_audio,
+        builders,
+    )
+
+
 def import_unpacked_stage(
     stage_dir: Path,
     import_textures: bool,
@@ -231,17 +309,21 @@ def import_fmod_from_bytes(
 
     imported_objects: List[Any] = []
 
-    # Create materials
+    # Materials are created on first use, so materials of meshes not reached are not created
+    create_material = builders.material.create_material
+    material_prefix = f"{name}_Material-"
     blender_materials = {}
-    for mesh in meshes:
+
+    # Create meshes
+    unlink = builders.scene.unlink_object_from_collections
+    link = builders.scene.link_object_to_collection
+    for ix, mesh in enumerate(meshes):
         for mat_id in mesh.material_list:
             if mat_id not in blender_materials:
-                blender_materials[mat_id] = builders.material.create_material(
-                    name=f"{name}_Material-{mat_id:03d}"
+                blender_materials[mat_id] = create_material(
+                    name=material_prefix + _padded_index(mat_id)
                 )
 
-    # Create meshes
-    for ix, mesh in enumerate(meshes):
         obj = import_mesh_part(
             ix, mesh, name, blender_materials, builders
         )
@@ -249,8 +331,8 @@ def import_fmod_from_bytes(
 
         # Move to collection if specified
         if collection is not None:
-            builders.scene.unlink_object_from_collections(obj)
-            builders.scene.link_object_to_collection(obj, collection)
+            unlink(obj)
+            link(obj, collection)
 
     # Import textures if requested and path provided
     if import_textures and texture_search_path:
@@ -280,10 +362,11 @@ def import_mesh_part(
     """
     if builders is None:
         builders = get_builders()
+    mesh_builder = builders.mesh
 
     builders.object.deselect_all()
 
-    object_name = f"{name_prefix}_Part_{index:03d}"
+    object_name = f"{name_prefix}_Part_{_padded_index(index)}"
     blender_mesh = create_mesh(object_name, mesh.vertices, mesh.faces, builders)
     blender_object = create_blender_object(object_name, blender_mesh, builders)
 
@@ -292,7 +375,7 @@ def import_mesh_part(
 
     # UVs
     if mesh.uvs is not None:
-        builders.mesh.create_uv_layer(blender_mesh, "UV0")
+        mesh_builder.create_uv_layer(blender_mesh, "UV0")
         create_texture_layer(
             blender_mesh,
             mesh.uvs,
@@ -308,5 +391,5 @@ def import_mesh_part(
             mesh.bone_remap = list(range(max(mesh.weights.keys()) + 1))
         set_weights(mesh.weights, mesh.bone_remap, blender_object, builders)
 
-    builders.mesh.update_mesh(blender_mesh)
+    mesh_builder.update_mesh(blender_mesh)
     return blender_object
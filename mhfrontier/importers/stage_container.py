@@ -5,9 +5,12 @@ Stage container import for packed .pac files.
 Handles parsing and importing segments from packed stage containers.
 """
 
+import queue
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from ..stage.jkr_decompress import decompress_jkr
 from ..stage.stage_container import (
@@ -23,6 +26,9 @@ from ..logging_config import get_logger
 
 _logger = get_logger("stage")
 
+# Compressed bytes below which worker processes cost more than they save
+PARALLEL_MIN_PAYLOAD = 1 << 20
+
 
 def import_packed_stage(
     stage_path: Path,
@@ -43,11 +49,7 @@ def import_packed_stage(
     :param builders: Optional builders (defaults to Blender implementation).
     :return: List of imported Blender objects.
     """
-    with open(stage_path, "rb") as f:
-        data = f.read()
-
-    segments = parse_stage_container(data)
-    _logger.info(f"Parsed stage container: {len(segments)} segments")
+    segments = load_packed_stage(stage_path)
 
     return import_segments(
         segments,
@@ -60,6 +62,148 @@ def import_packed_stage(
     )
 
 
+def load_packed_stage(stage_path: Path) -> List[StageSegment]:
+    """
+    Read and parse a packed stage container file.
+
+    :param stage_path: Path to the stage .pac file.
+    :return: List of parsed segments.
+    """
+    with open(stage_path, "rb") as f:
+        data = f.read()
+
+    segments = parse_stage_container(data)
+    _logger.info(f"Parsed stage container: {len(segments)} segments")
+    return segments
+
+
+def _try_decompress(
+    data: Union[bytes, memoryview],
+) -> Tuple[Optional[Union[bytes, memoryview]], Optional[str]]:
+    """
+    Decompress one JKR payload, catching its errors.
+
+    :param data: Raw JKR file data.
+    :return: Decompressed data (None on failure) and the error message, if any.
+    """
+    try:
+        return decompress_jkr(data), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _decompress_to_bytes(data: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Decompress one JKR payload in a worker process.
+
+    The result is pickled back to the parent, so views returned for
+    uncompressed data are copied to bytes.
+
+    :param data: Raw JKR file data.
+    :return: Decompressed data (None on failure) and the error message, if any.
+    """
+    result, error = _try_decompress(data)
+    return (None if result is None else bytes(result)), error
+
+
+def decompress_segments(
+    segments: List[StageSegment],
+    max_workers: Optional[int] = None,
+) -> Dict[int, Optional[Union[bytes, memoryview]]]:
+    """
+    Decompress all JKR segments, optionally in worker processes.
+
+    Segments are decompressed in this process unless the caller opts in to
+    worker processes with max_workers. Process pools are not started by
+    default: inside Blender, spawned workers run the Blender binary before
+    2.91 and forked workers copy a multi-threaded process, either of which
+    can hang the import.
+    Even when opted in, small containers or a failing pool are decompressed
+    in this process. A segment that fails to decompress is logged and maps
+    to None. Uncompressed (RW) segments decompressed in this process are
+    views into the container data.
+
+    :param segments: List of parsed segments.
+    :param max_workers: Number of worker processes to use, None or 1 to
+                        decompress in this process.
+    :return: Decompressed data (None on failure) by segment index, for JKR segments.
+    """
+    jkr_segments = [s for s in segments if s.segment_type == SegmentType.JKR]
+    payloads = [s.data for s in jkr_segments]
+
+    results = None
+    if (
+        max_workers is not None
+        and max_workers > 1
+        and len(jkr_segments) > 1
+        and sum(len(data) for data in payloads) >= PARALLEL_MIN_PAYLOAD
+    ):
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # Segment data are memoryviews, which cannot be pickled
+                results = list(executor.map(_decompress_to_bytes, map(bytes, payloads)))
+        except Exception as e:
+            _logger.warning(
+                "Parallel decompression unavailable (%s), decompressing sequentially", e
+            )
+    if results is None:
+        results = [_try_decompress(data) for data in payloads]
+
+    decompressed = {}
+    for segment, (data, error) in zip(jkr_segments, results):
+        if error is not None:
+            _logger.error(f"Error decompressing segment {segment.index}: {error}")
+        decompressed[segment.index] = data
+    return decompressed
+
+
+def iter_decompressed_segments(
+    segments: List[StageSegment],
+    max_pending: int = 4,
+) -> Iterator[Tuple[int, Optional[Union[bytes, memoryview]]]]:
+    """
+    Decompress JKR segments on a worker thread, in segment order.
+
+    The worker decompresses ahead of the consumer while the caller edits
+    Blender data on the main thread (bpy is not thread-safe, so only the
+    decompression runs on the worker). At most max_pending results are
+    buffered to cap memory use. Closing the iterator stops the worker.
+
+    :param segments: List of parsed segments.
+    :param max_pending: Maximum number of decompressed segments held in memory.
+    :return: Iterator of (segment index, decompressed data or None on failure).
+    """
+    jkr_segments = [s for s in segments if s.segment_type == SegmentType.JKR]
+    results: queue.Queue = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def worker() -> None:
+        for segment in jkr_segments:
+            try:
+                item = (segment.index, decompress_jkr(segment.data), None)
+            except Exception as e:
+                item = (segment.index, None, e)
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set():
+                return
+
+    thread = threading.Thread(target=worker, name="jkr-decompress", daemon=True)
+    thread.start()
+    try:
+        for _ in jkr_segments:
+            index, data, error = results.get()
+            if error is not None:
+                _logger.error(f"Error decompressing segment {index}: {error}")
+            yield index, data
+    finally:
+        stop.set()
+
+
 def import_segments(
     segments: List[StageSegment],
     stage_name: str,
@@ -81,10 +225,55 @@ def import_segments(
     :param builders: Optional builders (defaults to Blender implementation).
     :return: List of imported Blender objects.
     """
+    # Decompress all JKR segments up front, Blender data is only edited below
+    decompressed_segments = decompress_segments(get_fmod_segments(segments))
+
+    imported_objects: List[Any] = []
+    for _done, _total, objects in iter_import_segments(
+        segments,
+        stage_name,
+        import_textures,
+        create_collection,
+        import_fmod_from_bytes_func,
+        import_audio,
+        builders,
+        decompressed_segments,
+    ):
+        imported_objects.extend(objects)
+
+    return imported_objects
+
+
+def iter_import_segments(
+    segments: List[StageSegment],
+    stage_name: str,
+    import_textures: bool,
+    create_collection: bool,
+    import_fmod_from_bytes_func: Callable,
+    import_audio: bool = True,
+    builders: Optional[Builders] = None,
+    decompressed_segments: Optional[Dict[int, Optional[Union[bytes, memoryview]]]] = None,
+) -> Iterator[Tuple[int, int, List[Any]]]:
+    """
+    Import segments from a parsed stage container, one segment per step.
+
+    Lets callers such as modal operators interleave the import with UI
+    updates, or stop early.
+
+    :param segments: List of parsed segments.
+    :param stage_name: Name for the stage (used for collection).
+    :param import_textures: Import textures if available.
+    :param create_collection: Create a collection for the stage objects.
+    :param import_fmod_from_bytes_func: Function to import FMOD data from bytes.
+    :param import_audio: Import audio files (OGG) if available.
+    :param builders: Optional builders (defaults to Blender implementation).
+    :param decompressed_segments: Already decompressed JKR data by segment index.
+                                  If None, segments are decompressed on a worker thread.
+    :return: Iterator of (segments done, segment total, objects imported by the step).
+    """
     if builders is None:
         builders = get_builders()
 
-    imported_objects: List[Any] = []
     collection = None
 
     if create_collection:
@@ -100,72 +289,86 @@ def import_segments(
 
     # Process FMOD segments (both direct and compressed)
     fmod_segments = get_fmod_segments(segments)
+    audio_segments = get_audio_segments(segments) if import_audio else []
+    total = len(fmod_segments) + len(audio_segments)
+    done = 0
 
-    for segment in fmod_segments:
-        try:
-            if segment.segment_type == SegmentType.JKR:
-                # Decompress first
-                decompressed = decompress_jkr(segment.data)
-                if decompressed is None:
-                    _logger.warning(f"Failed to decompress segment {segment.index}")
-                    continue
+    # Decompress ahead on a worker thread unless the caller already did
+    pending = None
+    if decompressed_segments is None:
+        pending = iter_decompressed_segments(fmod_segments)
 
-                # Try to import as FMOD
-                try:
+    try:
+        for segment in fmod_segments:
+            objects: List[Any] = []
+            try:
+                if segment.segment_type == SegmentType.JKR:
+                    if pending is None:
+                        decompressed = decompressed_segments[segment.index]
+                    else:
+                        _index, decompressed = next(pending)
+                    if decompressed is None:
+                        _logger.warning(f"Failed to decompress segment {segment.index}")
+                    else:
+                        # Try to import as FMOD
+                        try:
+                            objects = import_fmod_from_bytes_func(
+                                decompressed,
+                                f"Stage_{segment.index:04d}",
+                                import_textures,
+                                collection,
+                            )
+                        except Exception as e:
+                            _logger.warning(
+                                f"Segment {segment.index}: decompressed but couldn't parse as FMOD: {e}"
+                            )
+
+                elif segment.segment_type == SegmentType.FMOD:
                     objects = import_fmod_from_bytes_func(
-                        decompressed,
+                        segment.data,
                         f"Stage_{segment.index:04d}",
                         import_textures,
                         collection,
                     )
-                    imported_objects.extend(objects)
-                except Exception as e:
-                    _logger.warning(
-                        f"Segment {segment.index}: decompressed but couldn't parse as FMOD: {e}"
-                    )
 
-            elif segment.segment_type == SegmentType.FMOD:
-                objects = import_fmod_from_bytes_func(
-                    segment.data,
-                    f"Stage_{segment.index:04d}",
-                    import_textures,
-                    collection,
-                )
-                imported_objects.extend(objects)
+            except Exception as e:
+                _logger.error(f"Error processing segment {segment.index}: {e}")
 
-        except Exception as e:
-            _logger.error(f"Error processing segment {segment.index}: {e}")
+            done += 1
+            yield done, total, objects
+    finally:
+        if pending is not None:
+            pending.close()
 
     # Process audio segments (OGG)
-    if import_audio:
-        audio_segments = get_audio_segments(segments)
-        if audio_segments:
-            _logger.info(f"Found {len(audio_segments)} audio segments")
+    if audio_segments:
+        _logger.info(f"Found {len(audio_segments)} audio segments")
 
-        for segment in audio_segments:
-            try:
-                sound_name = f"{stage_name}_audio_{segment.index:04d}"
+    for segment in audio_segments:
+        try:
+            sound_name = f"{stage_name}_audio_{segment.index:04d}"
 
-                # Write to temp file (Blender requires file path to load sounds)
-                with tempfile.NamedTemporaryFile(
-                    suffix=".ogg", delete=False
-                ) as tmp_file:
-                    tmp_file.write(segment.data)
-                    tmp_path = tmp_file.name
+            # Write to temp file (Blender requires file path to load sounds)
+            with tempfile.NamedTemporaryFile(
+                suffix=".ogg", delete=False
+            ) as tmp_file:
+                tmp_file.write(segment.data)
+                tmp_path = tmp_file.name
 
-                # Load sound into Blender
-                sound = builders.scene.load_sound(tmp_path)
-                builders.scene.set_sound_name(sound, sound_name)
+            # Load sound into Blender
+            sound = builders.scene.load_sound(tmp_path)
+            builders.scene.set_sound_name(sound, sound_name)
 
-                # Pack the sound data into the blend file so temp file can be deleted
-                builders.scene.pack_sound(sound)
+            # Pack the sound data into the blend file so temp file can be deleted
+            builders.scene.pack_sound(sound)
 
-                # Clean up temp file
-                Path(tmp_path).unlink(missing_ok=True)
+            # Clean up temp file
+            Path(tmp_path).unlink(missing_ok=True)
 
-                _logger.info(f"Imported audio: {sound_name}")
+            _logger.info(f"Imported audio: {sound_name}")
 
-            except Exception as e:
-                _logger.error(f"Error importing audio segment {segment.index}: {e}")
+        except Exception as e:
+            _logger.error(f"Error importing audio segment {segment.index}: {e}")
 
-    return imported_objects
+        done += 1
+        yield done, total, []
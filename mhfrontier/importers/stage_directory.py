@@ -5,8 +5,9 @@ Stage directory import for unpacked stage files.
 Handles importing FMOD and JKR files from unpacked stage directories.
 """
 
+import os
 from pathlib import Path
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
 from ..stage.jkr_decompress import decompress_jkr
 from ..blender.builders import Builders, get_builders
@@ -46,9 +47,18 @@ def import_unpacked_stage(
         collection = builders.scene.create_collection(stage_dir.name)
         builders.scene.link_collection_to_scene(collection)
 
-    # Find all relevant files
-    fmod_files = list(stage_dir.glob("*.fmod"))
-    jkr_files = list(stage_dir.glob("*.jkr"))
+    # Find all relevant files in one directory scan
+    fmod_files: List[Path] = []
+    jkr_files: List[Path] = []
+    with os.scandir(stage_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            extension = os.path.splitext(entry.name)[1].lower()
+            if extension == ".fmod":
+                fmod_files.append(Path(entry.path))
+            elif extension == ".jkr":
+                jkr_files.append(Path(entry.path))
 
     _logger.info(f"Found {len(fmod_files)} FMOD files, {len(jkr_files)} JKR files")
 
@@ -94,6 +104,30 @@ def import_fmod_file(
     )
 
 
+def load_jkr_file(jkr_path: Path) -> Union[bytes, memoryview]:
+    """
+    Read a JKR file and fully decompress it.
+
+    If the file is not actually JKR-compressed (no JKR magic), the raw
+    file contents are returned.
+
+    :param jkr_path: Path to the JKR file.
+    :return: Decompressed data (a view into the file data when stored
+             uncompressed), or the raw data if not JKR-compressed.
+    """
+    with open(jkr_path, "rb") as f:
+        data = f.read()
+
+    # Try to decompress - returns None if not JKR format
+    decompressed = decompress_jkr(data)
+
+    if decompressed is None:
+        # Not JKR compressed - try using the raw data as FMOD
+        _logger.info(f"{jkr_path.name} is not JKR-compressed, trying as raw FMOD")
+        return data
+    return decompressed
+
+
 def import_jkr_file(
     jkr_path: Path,
     import_textures: bool,
@@ -103,8 +137,8 @@ def import_jkr_file(
     """
     Import a JKR compressed file (decompress and import as FMOD).
 
-    If the file is not actually JKR-compressed (no JKR magic), tries to
-    import it directly as FMOD data.
+    The whole file is decompressed first, then the decompressed data is
+    parsed and imported.
 
     :param jkr_path: Path to the JKR file.
     :param import_textures: Import textures if available.
@@ -112,17 +146,10 @@ def import_jkr_file(
     :param import_fmod_from_bytes_func: Function to import FMOD data from bytes.
     :return: List of imported Blender objects.
     """
-    with open(jkr_path, "rb") as f:
-        data = f.read()
-
-    # Try to decompress - returns None if not JKR format
-    decompressed = decompress_jkr(data)
-
-    if decompressed is None:
-        # Not JKR compressed - try using the raw data as FMOD
-        _logger.info(f"{jkr_path.name} is not JKR-compressed, trying as raw FMOD")
-        decompressed = data
+    # Phase 1: decompress
+    decompressed = load_jkr_file(jkr_path)
 
+    # Phase 2: parse and import
     return import_fmod_from_bytes_func(
         decompressed, jkr_path.stem, import_textures, collection
     )
@@ -13,8 +13,8 @@ logger = logging.getLogger("mhfrontier")
 
 # Only configure if not already configured (avoid duplicate handlers)
 if not logger.handlers:
-    # Set default level (can be changed by users)
-    logger.setLevel(logging.DEBUG)
+    # Set default level (can be changed by users, e.g. to logging.DEBUG)
+    logger.setLevel(logging.INFO)
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -10,6 +10,7 @@ import bpy_extras
 from ..export.blender_extractor import MeshExtractor, MaterialExtractor, ExtractedMaterial
 from ..export.fmod_export import export_fmod
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
@@ -56,10 +57,15 @@ class ExportFMOD(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
         # Extract mesh data
         mesh_extractor = MeshExtractor(apply_modifiers=self.apply_modifiers)
         material_extractor = MaterialExtractor()
-        depsgraph = context.evaluated_depsgraph_get()
+        # Evaluated meshes are only needed to apply modifiers
+        depsgraph = context.evaluated_depsgraph_get() if self.apply_modifiers else None
 
         meshes = []
         materials_dict = {}  # Track unique materials
+        # Models without any material skip material collection entirely
+        has_any_material = any(
+            mat for obj in objects for mat in obj.data.materials
+        )
 
         for obj in objects:
             try:
@@ -67,7 +73,7 @@ class ExportFMOD(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
                 meshes.append(mesh)
 
                 # Collect materials from this object
-                if obj.data.materials:
+                if has_any_material and obj.data.materials:
                     for mat in obj.data.materials:
                         if mat and mat.name not in materials_dict:
                             materials_dict[mat.name] = material_extractor.extract(mat)
@@ -104,6 +110,8 @@ class ExportFMOD(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
         layout.prop(self, "apply_modifiers")
 
 
-def menu_func_export(self, _context):
-    """Add the operator to the export menu."""
-    self.layout.operator(ExportFMOD.bl_idname, text="MHF FMOD (.fmod)")
+menu_func_export = make_menu_func(
+    ExportFMOD.bl_idname,
+    "MHF FMOD (.fmod)",
+    doc="Add the operator to the export menu.",
+)
@@ -11,6 +11,7 @@ import bpy_extras
 
 from ..importers import import_model, clear_scene
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
@@ -44,7 +45,7 @@ class ImportFMOD(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         try:
             bpy.ops.object.mode_set(mode="OBJECT")
         except RuntimeError as error:
-            _logger.debug(f"Mode switch warning: {error}")
+            _logger.debug("Mode switch warning: %s", error)
         bpy.ops.object.select_all(action="DESELECT")
 
         if self.clear_scene:
@@ -53,6 +54,8 @@ class ImportFMOD(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         return {"FINISHED"}
 
 
-def menu_func_import(self, _context):
-    """Add the operator."""
-    self.layout.operator(ImportFMOD.bl_idname, text="MHF FMOD (.fmod)")
+menu_func_import = make_menu_func(
+    ImportFMOD.bl_idname,
+    "MHF FMOD (.fmod)",
+    doc="Add the operator.",
+)
@@ -10,6 +10,7 @@ import bpy_extras
 from ..export.blender_extractor import MotionExtractor
 from ..export.fmot_export import export_fmot
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
@@ -77,6 +78,8 @@ class ExportFMOT(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
         return {"FINISHED"}
 
 
-def menu_func_export(self, _context):
-    """Add the operator to the export menu."""
-    self.layout.operator(ExportFMOT.bl_idname, text="MHF FMOT (.mot)")
+menu_func_export = make_menu_func(
+    ExportFMOT.bl_idname,
+    "MHF FMOT (.mot)",
+    doc="Add the operator to the export menu.",
+)
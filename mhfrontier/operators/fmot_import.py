@@ -6,15 +6,14 @@ Imports Monster Hunter Frontier animation files (.mot, .bin) and applies them
 to the active armature as Blender Actions.
 """
 
-import struct
-
 import bpy
 import bpy_extras
 
 from ..importers import import_motion
-from ..importers.motion import import_motion_from_bytes
-from ..fmod.fmot import BLOCK_ANIMATION_HEADER
+from ..importers.motion import import_all_motions_from_bytes, import_motion_from_bytes
+from ..fmod.fmot import find_bin_animation_blocks
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
@@ -41,6 +40,12 @@ class ImportFMOT(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         min=0,
     )
 
+    import_all: bpy.props.BoolProperty(
+        name="Import All Animations",
+        description="Import every animation of a .bin container as separate actions",
+        default=False,
+    )
+
     def execute(self, context):
         """Import the motion file and apply to active armature."""
         import os
@@ -65,7 +70,7 @@ class ImportFMOT(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         try:
             bpy.ops.object.mode_set(mode="OBJECT")
         except RuntimeError as error:
-            _logger.debug(f"Mode switch warning: {error}")
+            _logger.debug("Mode switch warning: %s", error)
 
         filepath = self.properties.filepath
         _, ext = os.path.splitext(filepath.lower())
@@ -105,11 +110,12 @@ class ImportFMOT(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         Import animation from a .bin container file.
 
         .bin files contain multiple animation blocks. This extracts the
-        animation at the specified index.
+        animation at the specified index, or every animation when
+        import_all is set.
 
         :param filepath: Path to .bin file.
         :param armature: Blender armature object.
-        :return: Created Action, or None.
+        :return: Created Action (the first one when importing all), or None.
         """
         import os
 
@@ -117,17 +123,20 @@ class ImportFMOT(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
             data = f.read()
 
         # Find all animation blocks
-        blocks = []
-        for i in range(0, len(data) - 16, 4):
-            val = struct.unpack_from("<I", data, i)[0]
-            if val == BLOCK_ANIMATION_HEADER:
-                size = struct.unpack_from("<I", data, i + 8)[0]
-                blocks.append((i, size))
+        blocks = find_bin_animation_blocks(data)
 
         if not blocks:
             _logger.warning(f"No animation blocks found in {filepath}")
             return None
 
+        # Generate action names from filename
+        basename = os.path.splitext(os.path.basename(filepath))[0]
+
+        if self.import_all:
+            actions = import_all_motions_from_bytes(data, blocks, armature, basename)
+            _logger.info("Imported %d of %d animations", len(actions), len(blocks))
+            return actions[0] if actions else None
+
         # Get requested animation index
         idx = self.animation_index
         if idx >= len(blocks):
@@ -137,15 +146,16 @@ class ImportFMOT(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
             idx = 0
 
         offset, size = blocks[idx]
-        anim_data = data[offset : offset + size]
+        # Zero-copy view of the selected animation
+        anim_data = memoryview(data)[offset : offset + size]
 
-        # Generate action name from filename
-        basename = os.path.splitext(os.path.basename(filepath))[0]
         action_name = f"{basename}_anim_{idx}"
 
         return import_motion_from_bytes(anim_data, armature, action_name)
 
 
-def menu_func_import(self, _context):
-    """Add the operator to the import menu."""
-    self.layout.operator(ImportFMOT.bl_idname, text="MHF Motion (.mot/.bin)")
+menu_func_import = make_menu_func(
+    ImportFMOT.bl_idname,
+    "MHF Motion (.mot/.bin)",
+    doc="Add the operator to the import menu.",
+)
@@ -10,8 +10,13 @@ Created on Tue Aug 18 22:47:34 2020
 import bpy
 from mathutils import Vector, Matrix
 
+from .menu import make_menu_func
+
 MACHINE_EPSILON = 2**-8
 
+# Blender 2.8 switched matrix products to "@" and reworked the scene API
+IS_BLENDER_28 = bpy.app.version >= (2, 8)
+
 
 class DummyBone:
     """Dummy for Blender bones."""
@@ -32,45 +37,63 @@ def create_root_bone(armature):
     return bone
 
 
-def create_bone_tree(armature, anchor, parent_bone=None):
+def create_bone_tree(armature, anchor, parent_bone=None, parent_matrix=None):
     """
     Create a new bone tree to the armature.
 
+    The anchor hierarchy is walked with an explicit stack instead of
+    recursion. Each bone's armature-space matrix is computed once and handed
+    down to its children, so edit bone matrices are never read back from
+    Blender.
+
     :param armature: Armature to edit.
     :param anchor: Skeleton anchor (Blender object) to use
-    :param parent_bone: Specify a parent bone (used for recursion)
+    :param parent_bone: Bone the tree will be attached to, if any
+    :param parent_matrix: Armature-space matrix of parent_bone, if known
 
     :return: Root of the created bone tree
     """
-    bone = armature.edit_bones.new(anchor.name)
-    bone.head = Vector([0, 0, 0])
-    bone.tail = Vector([0, MACHINE_EPSILON, 0])
-    if not parent_bone:
-        parent_bone = (
-            DummyBone()
+    if parent_matrix is None:
+        parent_matrix = (
+            parent_bone.matrix if parent_bone else DummyBone().matrix
         )  # matrix = Identity(4), #boneTail = 0,0,0, boneHead = 0,1,0
-    if bpy.app.version >= (2, 8):
-        bone.matrix = parent_bone.matrix @ anchor.matrix_local
-    else:
-        bone.matrix = parent_bone.matrix * anchor.matrix_local
-    for child in anchor.children:
-        new_bone = create_bone_tree(armature, child, bone)
-        new_bone.parent = bone
-    if "id" in anchor:
-        bone["id"] = anchor["id"]
-    return bone
+    root_bone = None
+    stack = [(anchor, None, parent_matrix)]
+    while stack:
+        node, parent, node_parent_matrix = stack.pop()
+        bone = armature.edit_bones.new(node.name)
+        bone.head = Vector([0, 0, 0])
+        bone.tail = Vector([0, MACHINE_EPSILON, 0])
+        if IS_BLENDER_28:
+            matrix = node_parent_matrix @ node.matrix_local
+        else:
+            matrix = node_parent_matrix * node.matrix_local
+        bone.matrix = matrix
+        if parent is None:
+            root_bone = bone
+        else:
+            bone.parent = parent
+        if "id" in node:
+            bone["id"] = node["id"]
+        # Pushed in reverse so children are created in their original order
+        stack.extend((child, bone, matrix) for child in reversed(node.children))
+    return root_bone
 
 
 def create_armature(context):
     """Create armature from skeleton and parent to model."""
+    # One scan collects both the skeleton roots and the meshes to bind
     bone_anchors = []
+    meshes = []
     for scene_object in context.scene.objects:
         if scene_object.type == "EMPTY" and scene_object.parent is None:
             bone_anchors.append(scene_object)
+        elif scene_object.type == "MESH":
+            meshes.append(scene_object)
     bpy.ops.object.select_all(action="DESELECT")
     blender_armature = bpy.data.armatures.new("Armature")
     arm_ob = bpy.data.objects.new("Armature", blender_armature)
-    if bpy.app.version >= (2, 8):
+    if IS_BLENDER_28:
         context.collection.objects.link(arm_ob)
         context.view_layer.update()
         arm_ob.select_set(True)
@@ -94,10 +117,9 @@ def create_armature(context):
 
     # Add the armature to the mesh if possible
     bpy.ops.object.editmode_toggle()
-    for obj in bpy.context.scene.objects:
-        if obj.type == "MESH":
-            modifier = obj.modifiers.new("Armature", "ARMATURE")
-            modifier.object = arm_ob
+    for obj in meshes:
+        modifier = obj.modifiers.new("Armature", "ARMATURE")
+        modifier.object = arm_ob
 
 
 class ConvertFSKL(bpy.types.Operator):
@@ -117,6 +139,7 @@ class ConvertFSKL(bpy.types.Operator):
         layout.label(text="Create Armature from FSKL Tree", icon="armature_data")
 
 
-def menu_func(self, _context):
-    """Add armature creation operator to the right click."""
-    self.layout.operator(ConvertFSKL.bl_idname)
+menu_func = make_menu_func(
+    ConvertFSKL.bl_idname,
+    doc="Add armature creation operator to the right click.",
+)
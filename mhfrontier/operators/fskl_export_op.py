@@ -10,6 +10,7 @@ import bpy_extras
 from ..export.blender_extractor import SkeletonExtractor
 from ..export.fskl_export import export_fskl
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
@@ -92,6 +93,8 @@ class ExportFSKL(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
         layout.prop(self, "source_type")
 
 
-def menu_func_export(self, _context):
-    """Add the operator to the export menu."""
-    self.layout.operator(ExportFSKL.bl_idname, text="MHF FSKL (.fskl)")
+menu_func_export = make_menu_func(
+    ExportFSKL.bl_idname,
+    "MHF FSKL (.fskl)",
+    doc="Add the operator to the export menu.",
+)
@@ -11,6 +11,7 @@ import bpy_extras
 
 from ..importers import import_skeleton
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
@@ -33,12 +34,14 @@ class ImportFSKL(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         try:
             bpy.ops.object.mode_set(mode="OBJECT")
         except RuntimeError as error:
-            _logger.debug(f"Mode switch warning: {error}")
+            _logger.debug("Mode switch warning: %s", error)
         bpy.ops.object.select_all(action="DESELECT")
         import_skeleton(self.properties.filepath)
         return {"FINISHED"}
 
 
-def menu_func_import(self, _context):
-    """Add the operator."""
-    self.layout.operator(ImportFSKL.bl_idname, text="MHF FSKL (.fskl)")
+menu_func_import = make_menu_func(
+    ImportFSKL.bl_idname,
+    "MHF FSKL (.fskl)",
+    doc="Add the operator.",
+)
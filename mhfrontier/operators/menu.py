@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Menu entry helpers shared by the operator modules.
+"""
+
+from typing import Callable, Optional
+
+
+def make_menu_func(
+    bl_idname: str,
+    text: Optional[str] = None,
+    doc: str = "Add the operator to the menu.",
+) -> Callable:
+    """
+    Create a menu draw function adding one operator entry.
+
+    The operator id and label are bound once, so drawing the menu only
+    adds the entry.
+
+    :param bl_idname: Operator identifier.
+    :param text: Entry label, or None to use the operator bl_label.
+    :param doc: Docstring of the created function.
+    :return: Function to append to a Blender menu.
+    """
+    if text is None:
+
+        def menu_func(self, _context):
+            self.layout.operator(bl_idname)
+
+    else:
+
+        def menu_func(self, _context):
+            self.layout.operator(bl_idname, text=text)
+
+    menu_func.__doc__ = doc
+    return menu_func
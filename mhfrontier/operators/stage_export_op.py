@@ -4,15 +4,26 @@ Exporter operator for stage container files (.pac).
 Provides File > Export > MHF Stage Container menu entry.
 """
 
+from types import MappingProxyType
+
 import bpy
 import bpy_extras
 
-from ..export.stage_export import export_stage, StageExportOptions
+from ..export.stage_export import collect_mesh_objects, export_stage, StageExportOptions
 from ..stage.jkr_decompress import CompressionType
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
+# Map compression type enum identifiers to JKR compression types (read-only)
+_COMPRESSION_MAP = MappingProxyType({
+    "RW": CompressionType.RW,
+    "HFI": CompressionType.HFI,
+    "LZ": CompressionType.LZ,
+    "HFIRW": CompressionType.HFIRW,
+})
+
 
 class ExportStage(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
     """Export collection to MHF Stage Container file format."""
@@ -71,13 +82,29 @@ class ExportStage(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
         default=True,
     )
 
+    validate_meshes: bpy.props.BoolProperty(
+        name="Validate Meshes",
+        description="Check mesh consistency before export (slower on large scenes)",
+        default=False,
+    )
+
     def execute(self, context):
         """Export the stage container to file."""
+        # Read operator properties once
+        collection_name = self.export_collection
+        compress_segments = self.compress_segments
+        compression_type = self.compression_type
+        include_textures = self.include_textures
+        include_audio = self.include_audio
+        apply_modifiers = self.apply_modifiers
+        validate = self.validate_meshes
+        filepath = self.filepath
+
         # Get collection to export
-        if self.export_collection:
-            collection = bpy.data.collections.get(self.export_collection)
+        if collection_name:
+            collection = bpy.data.collections.get(collection_name)
             if collection is None:
-                self.report({"ERROR"}, f"Collection '{self.export_collection}' not found")
+                self.report({"ERROR"}, f"Collection '{collection_name}' not found")
                 return {"CANCELLED"}
         else:
             # Use active collection or scene collection
@@ -87,37 +114,39 @@ class ExportStage(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
             self.report({"ERROR"}, "No collection selected for export")
             return {"CANCELLED"}
 
-        # Count mesh objects
-        mesh_count = sum(1 for obj in collection.all_objects if obj.type == "MESH")
+        # Collect mesh objects once, the exporter reuses the list
+        mesh_objects = collect_mesh_objects(collection)
+        mesh_count = len(mesh_objects)
+        # Textures and audio are not extracted from collections, so without
+        # meshes the container would be empty
         if mesh_count == 0:
-            self.report({"WARNING"}, f"No mesh objects in collection '{collection.name}'")
+            self.report(
+                {"WARNING"},
+                f"Nothing to export: no mesh objects in collection '{collection.name}'",
+            )
+            return {"CANCELLED"}
 
         # Map compression type string to enum
-        compression_map = {
-            "RW": CompressionType.RW,
-            "HFI": CompressionType.HFI,
-            "LZ": CompressionType.LZ,
-            "HFIRW": CompressionType.HFIRW,
-        }
-        compression = compression_map.get(self.compression_type, CompressionType.HFI)
+        compression = _COMPRESSION_MAP.get(compression_type, CompressionType.HFI)
 
         # Build export options
         options = StageExportOptions(
-            compress_segments=self.compress_segments,
+            compress_segments=compress_segments,
             compression_type=compression,
-            include_textures=self.include_textures,
-            include_audio=self.include_audio,
-            apply_modifiers=self.apply_modifiers,
+            include_textures=include_textures,
+            include_audio=include_audio,
+            apply_modifiers=apply_modifiers,
+            validate=validate,
         )
 
-        # Get dependency graph
-        depsgraph = context.evaluated_depsgraph_get()
+        # Evaluated meshes are only needed to apply modifiers
+        depsgraph = context.evaluated_depsgraph_get() if apply_modifiers else None
 
         try:
-            export_stage(self.filepath, collection, depsgraph, options)
+            export_stage(filepath, collection, depsgraph, options, mesh_objects)
             self.report(
                 {"INFO"},
-                f"Exported collection '{collection.name}' ({mesh_count} meshes) to {self.filepath}",
+                f"Exported collection '{collection.name}' ({mesh_count} meshes) to {filepath}",
             )
         except Exception as e:
             _logger.exception("Stage export failed")
@@ -163,7 +192,16 @@ class ExportStage(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
         box.label(text="Mesh Options")
         box.prop(self, "apply_modifiers")
 
+        layout.separator()
+
+        # Advanced options
+        box = layout.box()
+        box.label(text="Advanced")
+        box.prop(self, "validate_meshes")
+
 
-def menu_func_export(self, _context):
-    """Add the operator to the export menu."""
-    self.layout.operator(ExportStage.bl_idname, text="MHF Stage Container (.pac)")
+menu_func_export = make_menu_func(
+    ExportStage.bl_idname,
+    "MHF Stage Container (.pac)",
+    doc="Add the operator to the export menu.",
+)
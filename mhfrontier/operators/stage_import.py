@@ -5,20 +5,35 @@ Importer operator for MHF Stage/Map files.
 Supports both packed .pac containers and unpacked directories.
 """
 
+import os
+import stat
 import traceback
 from pathlib import Path
 
 import bpy
 import bpy_extras
 
-from ..importers import import_stage, import_fmod_file, import_jkr_file, clear_scene
+from ..importers import (
+    import_stage,
+    iter_import_packed_stage,
+    import_fmod_file,
+    import_jkr_file,
+    clear_scene,
+)
 from ..logging_config import get_logger
+from .menu import make_menu_func
 
 _logger = get_logger("operators")
 
 
 class ImportStage(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
-    """Import a Monster Hunter Frontier Stage/Map file."""
+    """
+    Import a Monster Hunter Frontier Stage/Map file.
+
+    When started from the file browser, packed .pac containers are imported
+    from a timer, one segment per tick, so the UI stays responsive and the
+    import can be cancelled with Esc. Calls from scripts run synchronously.
+    """
 
     bl_idname = "custom_import.import_mhf_stage"
     bl_label = "Load MHF Stage file"
@@ -62,29 +77,48 @@ class ImportStage(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         options={"HIDDEN"},
     )
 
+    # Modal import state
+    _use_modal = False
+    _timer = None
+    _steps = None
+    _imported = 0
+
+    def invoke(self, context, event):
+        """Open the file browser, then import step by step once confirmed."""
+        self._use_modal = True
+        return bpy_extras.io_utils.ImportHelper.invoke(self, context, event)
+
     def execute(self, context):
         """Import the stage to the scene."""
         try:
             bpy.ops.object.mode_set(mode="OBJECT")
         except RuntimeError as error:
-            _logger.debug(f"Mode switch warning: {error}")
+            _logger.debug("Mode switch warning: %s", error)
 
         bpy.ops.object.select_all(action="DESELECT")
 
         filepath = Path(self.properties.filepath)
 
-        # Check if user selected a directory or a file
-        if filepath.is_dir():
-            stage_path = filepath
-        elif filepath.is_file():
-            stage_path = filepath
-        else:
-            # Could be selecting a file inside a directory - use parent
-            if filepath.parent.is_dir():
-                stage_path = filepath.parent
+        # Check if user selected a directory or a file (single stat call)
+        is_container = False
+        try:
+            mode = os.stat(filepath).st_mode
+            is_container = stat.S_ISREG(mode)
+            if stat.S_ISDIR(mode) or is_container:
+                stage_path = filepath
             else:
-                self.report({"ERROR"}, f"Invalid path: {filepath}")
-                return {"CANCELLED"}
+                stage_path = None
+        except OSError:
+            # Could be selecting a file inside a directory - use parent
+            stage_path = filepath.parent if filepath.parent.is_dir() else None
+
+        if stage_path is None:
+            self.report({"ERROR"}, f"Invalid path: {filepath}")
+            return {"CANCELLED"}
+
+        # Step through packed containers from a timer when invoked from the UI
+        if is_container and self._use_modal and context.window is not None:
+            return self._start_modal(context, stage_path)
 
         try:
             imported_objects = import_stage(
@@ -107,6 +141,74 @@ class ImportStage(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
 
         return {"FINISHED"}
 
+    def _start_modal(self, context, stage_path):
+        """
+        Parse the container and start importing its segments from a timer.
+
+        :param context: Blender context.
+        :param stage_path: Path to the stage .pac file.
+        :return: Operator return set.
+        """
+        try:
+            self._steps = iter_import_packed_stage(
+                str(stage_path),
+                import_textures=self.import_textures,
+                clear_scene=self.clear_scene,
+                create_collection=self.create_collection,
+                import_audio=self.import_audio,
+            )
+        except Exception as e:
+            self.report({"ERROR"}, f"Import failed: {e}")
+            _logger.error(f"Import failed: {e}\n{traceback.format_exc()}")
+            return {"CANCELLED"}
+
+        self._imported = 0
+        window_manager = context.window_manager
+        self._timer = window_manager.event_timer_add(0.01, window=context.window)
+        window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        """Import one segment per timer tick, stop on Esc."""
+        if event.type == "ESC":
+            self._finish_modal(context)
+            self.report(
+                {"WARNING"},
+                f"Import cancelled, kept {self._imported} objects from stage",
+            )
+            return {"FINISHED"}
+
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        try:
+            done, total, objects = next(self._steps)
+        except StopIteration:
+            self._finish_modal(context)
+            self.report(
+                {"INFO"},
+                f"Imported {self._imported} objects from stage",
+            )
+            return {"FINISHED"}
+        except Exception as e:
+            self._finish_modal(context)
+            self.report({"ERROR"}, f"Import failed: {e}")
+            _logger.error(f"Import failed: {e}\n{traceback.format_exc()}")
+            return {"CANCELLED"}
+
+        self._imported += len(objects)
+        context.workspace.status_text_set(
+            f"Importing stage: {done}/{total} segments (Esc to cancel)"
+        )
+        return {"RUNNING_MODAL"}
+
+    def _finish_modal(self, context):
+        """Remove the timer and clear the status bar."""
+        context.window_manager.event_timer_remove(self._timer)
+        self._timer = None
+        self._steps = None
+        context.workspace.status_text_set(None)
+
     def draw(self, context):
         """Draw the import options panel."""
         layout = self.layout
@@ -162,14 +264,15 @@ class ImportStageDirect(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         try:
             bpy.ops.object.mode_set(mode="OBJECT")
         except RuntimeError as error:
-            _logger.debug(f"Mode switch warning: {error}")
+            _logger.debug("Mode switch warning: %s", error)
 
         bpy.ops.object.select_all(action="DESELECT")
 
         if self.clear_scene:
             clear_scene()
 
-        directory = Path(self.directory)
+        directory = self.directory
+        import_textures = self.import_textures
         total_objects = 0
 
         # Create a collection for all imports
@@ -178,32 +281,49 @@ class ImportStageDirect(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
             from ..blender import get_builders
 
             builders = get_builders()
-            collection = builders.scene.create_collection(directory.name)
+            collection = builders.scene.create_collection(Path(directory).name)
             builders.scene.link_collection_to_scene(collection)
 
+        importers = {".fmod": import_fmod_file, ".jkr": import_jkr_file}
+        # Failures are reported together once every file was tried
+        errors = []
+
         for file_elem in self.files:
-            filepath = directory / file_elem.name
+            name = file_elem.name
+            importer = importers.get(os.path.splitext(name)[1].lower())
+            if importer is None:
+                _logger.warning(f"Skipping unknown file type: {name}")
+                continue
 
             try:
-                if filepath.suffix.lower() == ".fmod":
-                    objects = import_fmod_file(
-                        filepath, self.import_textures, collection
-                    )
-                elif filepath.suffix.lower() == ".jkr":
-                    objects = import_jkr_file(
-                        filepath, self.import_textures, collection
-                    )
-                else:
-                    _logger.warning(f"Skipping unknown file type: {filepath.name}")
-                    continue
+                objects = importer(
+                    Path(os.path.join(directory, name)), import_textures, collection
+                )
 
                 total_objects += len(objects)
-                _logger.info(f"Imported {len(objects)} objects from {filepath.name}")
+                _logger.info(f"Imported {len(objects)} objects from {name}")
 
             except Exception as e:
-                _logger.error(f"Error importing {filepath.name}: {e}\n{traceback.format_exc()}")
-
-        self.report({"INFO"}, f"Imported {total_objects} objects from {len(self.files)} files")
+                errors.append((name, e))
+
+        if errors:
+            _logger.error(
+                "Failed to import %d of %d files:\n%s",
+                len(errors),
+                len(self.files),
+                "".join(
+                    f"{name}: {error}\n"
+                    + "".join(traceback.format_exception(type(error), error, error.__traceback__))
+                    for name, error in errors
+                ),
+            )
+            self.report(
+                {"WARNING"},
+                f"Imported {total_objects} objects from {len(self.files)} files, "
+                f"{len(errors)} failed (see console)",
+            )
+        else:
+            self.report({"INFO"}, f"Imported {total_objects} objects from {len(self.files)} files")
         return {"FINISHED"}
 
     def draw(self, context):
@@ -214,13 +334,13 @@ class ImportStageDirect(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         layout.prop(self, "create_collection")
 
 
-def menu_func_import(self, context):
-    """Add the operator to the import menu."""
-    self.layout.operator(ImportStage.bl_idname, text="MHF Stage (.pac)")
-
-
-def menu_func_import_direct(self, context):
-    """Add the direct import operator to the import menu."""
-    self.layout.operator(
-        ImportStageDirect.bl_idname, text="MHF Stage Files (FMOD/JKR)"
-    )
+menu_func_import = make_menu_func(
+    ImportStage.bl_idname,
+    "MHF Stage (.pac)",
+    doc="Add the operator to the import menu.",
+)
+menu_func_import_direct = make_menu_func(
+    ImportStageDirect.bl_idname,
+    "MHF Stage Files (FMOD/JKR)",
+    doc="Add the direct import operator to the import menu.",
+)
@@ -7,14 +7,61 @@ Monster Hunter Frontier. Stage files are .pac containers that contain
 compressed geometry, textures, and object placement data.
 """
 
-from .jkr_decompress import decompress_jkr, JKRHeader, CompressionType
-from .jkr_compress import compress_jkr, compress_jkr_hfi, compress_jkr_raw
-from .stage_container import parse_stage_container, StageSegment, SegmentType, FileMagic
-from .stage_export import (
-    StageSegmentBuilder,
-    build_stage_container,
-    segments_to_builders,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .jkr_decompress import decompress_jkr, JKRHeader, CompressionType
+    from .jkr_compress import compress_jkr, compress_jkr_hfi, compress_jkr_raw
+    from .stage_container import parse_stage_container, StageSegment, SegmentType, FileMagic
+    from .stage_export import (
+        StageSegmentBuilder,
+        build_stage_container,
+        build_stage_container_parts,
+        segments_to_builders,
+    )
+
+# Public names and the submodule defining them, imported on first access
+_LAZY_ATTRIBUTES = {
+    "decompress_jkr": "jkr_decompress",
+    "JKRHeader": "jkr_decompress",
+    "CompressionType": "jkr_decompress",
+    "compress_jkr": "jkr_compress",
+    "compress_jkr_hfi": "jkr_compress",
+    "compress_jkr_raw": "jkr_compress",
+    "parse_stage_container": "stage_container",
+    "StageSegment": "stage_container",
+    "SegmentType": "stage_container",
+    "FileMagic": "stage_container",
+    "StageSegmentBuilder": "stage_export",
+    "build_stage_container": "stage_export",
+    "build_stage_container_parts": "stage_export",
+    "segments_to_builders": "stage_export",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public names from their submodule on first access (PEP 562).
+
+    Keeps addon registration from loading the codecs until they are used.
+
+    :param name: Attribute name.
+    :return: The attribute from its submodule.
+    :raises AttributeError: If the name is not part of the package API.
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the package attributes, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     # Decompression
@@ -33,5 +80,6 @@ __all__ = [
     # Container building
     "StageSegmentBuilder",
     "build_stage_container",
+    "build_stage_container_parts",
     "segments_to_builders",
 ]
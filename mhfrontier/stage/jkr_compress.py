@@ -11,10 +11,15 @@ Supports 4 compression types:
 - Type 4 (HFI): Huffman + LZ77 compression (most common)
 """
 
+import heapq
 import struct
+import sys
+from concurrent.futures import Executor
+from operator import itemgetter
+from array import array
 from dataclasses import dataclass
 from io import BytesIO
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .jkr_decompress import CompressionType, JKR_MAGIC
 
@@ -45,45 +50,99 @@ class JKRHeaderBuilder:
 
 
 class BitWriter:
-    """Helper class for writing individual bits to a byte stream."""
+    """
+    Helper class for writing individual bits to a byte stream.
 
-    def __init__(self):
-        self._buffer = bytearray()
-        self._current_byte = 0
-        self._bit_position = 7  # Start from MSB
+    Bits accumulate MSB first in an integer and whole bytes are moved to
+    the buffer as soon as they are complete, so fewer than 8 bits are
+    ever pending.
+    """
+
+    def __init__(self, buffer: Optional[bytearray] = None):
+        """
+        Create a writer.
+
+        :param buffer: Buffer to append the bytes to (defaults to a new one).
+        """
+        self._buffer = bytearray() if buffer is None else buffer
+        self._acc = 0  # Pending bits, the oldest one is the most significant
+        self._nbits = 0  # Number of pending bits (0-7)
 
     def write_bit(self, bit: bool) -> None:
-        """Write a single bit."""
-        if bit:
-            self._current_byte |= 1 << self._bit_position
+        """
+        Write a single bit.
 
-        self._bit_position -= 1
-        if self._bit_position < 0:
-            self._buffer.append(self._current_byte)
-            self._current_byte = 0
-            self._bit_position = 7
+        :param bit: Bit value, a bool or 0/1 (OR-ed in without branching).
+        """
+        acc = (self._acc << 1) | bit
+        if self._nbits == 7:
+            self._buffer.append(acc)
+            self._acc = 0
+            self._nbits = 0
+        else:
+            self._acc = acc
+            self._nbits += 1
 
     def write_bits(self, value: int, num_bits: int) -> None:
         """Write multiple bits (MSB first)."""
-        for i in range(num_bits - 1, -1, -1):
-            self.write_bit(bool((value >> i) & 1))
+        acc = (self._acc << num_bits) | (value & ((1 << num_bits) - 1))
+        nbits = self._nbits + num_bits
+        if nbits >= 8:
+            buffer_append = self._buffer.append
+            while nbits >= 8:
+                nbits -= 8
+                buffer_append((acc >> nbits) & 0xFF)
+            acc &= (1 << nbits) - 1
+        self._acc = acc
+        self._nbits = nbits
 
     def write_byte(self, value: int) -> None:
         """Write a full byte."""
         self.write_bits(value, 8)
 
-    def flush(self) -> bytes:
-        """Flush remaining bits and return the buffer."""
-        if self._bit_position < 7:
-            self._buffer.append(self._current_byte)
-        return bytes(self._buffer)
+    def write_codes(
+        self,
+        symbols: Iterable[int],
+        codes: Sequence[Tuple[int, int]],
+    ) -> None:
+        """
+        Write the code of each symbol (MSB first).
+
+        Bulk version of write_bits for entropy coders: the accumulator is
+        kept in locals and drained 7 bytes at a time.
+
+        :param symbols: Symbols to write.
+        :param codes: (code, bit length) of each symbol, indexed by symbol.
+        """
+        buffer = self._buffer
+        acc = self._acc
+        nbits = self._nbits
+        for code, length in map(codes.__getitem__, symbols):
+            acc = (acc << length) | code
+            nbits += length
+            if nbits >= 56:
+                nbits -= 56
+                buffer += (acc >> nbits).to_bytes(7, "big")
+                acc &= (1 << nbits) - 1
+        while nbits >= 8:
+            nbits -= 8
+            buffer.append((acc >> nbits) & 0xFF)
+        self._acc = acc & ((1 << nbits) - 1)
+        self._nbits = nbits
+
+    def flush(self) -> bytearray:
+        """Flush remaining bits and return the buffer itself (not a copy)."""
+        if self._nbits:
+            self._buffer.append((self._acc << (8 - self._nbits)) & 0xFF)
+            self._acc = 0
+            self._nbits = 0
+        return self._buffer
 
     def get_bytes(self) -> bytes:
         """Get current buffer without flushing."""
-        result = bytearray(self._buffer)
-        if self._bit_position < 7:
-            result.append(self._current_byte)
-        return bytes(result)
+        if self._nbits:
+            return bytes(self._buffer) + bytes(((self._acc << (8 - self._nbits)) & 0xFF,))
+        return bytes(self._buffer)
 
 
 class LZInterleavedWriter:
@@ -98,51 +157,95 @@ class LZInterleavedWriter:
     The key insight: data bytes are associated with the flag byte that's
     active when they're read. When bits span flag boundaries, data bytes
     written BEFORE the boundary go with the old flag, and data bytes
-    written AFTER go with the new flag.
+    written AFTER go with the new flag. Each flag byte is reserved in the
+    output when its first bit is written and filled in once it is complete,
+    so data bytes are appended straight to the output.
 
     This matches the decoder's _jpk_bit_lz behavior.
     """
 
-    def __init__(self):
-        self._output = bytearray()
-        self._flag_bits = []  # Bits for current flag (max 8)
-        self._flag_data = []  # Data bytes for current flag
-
-    def _emit_flag(self) -> None:
-        """Emit current flag byte and its data bytes."""
-        if not self._flag_bits:
-            return
-
-        # Pad to 8 bits
-        while len(self._flag_bits) < 8:
-            self._flag_bits.append(False)
-
-        # Build flag byte (MSB first)
-        flag = 0
-        for i, bit in enumerate(self._flag_bits):
-            if bit:
-                flag |= 1 << (7 - i)
+    def __init__(self, buffer: Optional[bytearray] = None):
+        """
+        Create a writer.
 
-        self._output.append(flag)
-        self._output.extend(self._flag_data)
-        self._flag_bits = []
-        self._flag_data = []
+        :param buffer: Buffer to append the bytes to (defaults to a new one).
+        """
+        self._output = bytearray() if buffer is None else buffer
+        self._flag = 0  # Bits of the current flag, first bit highest
+        self._flag_count = 8  # Bits in the current flag (full: start a new one)
+        self._flag_pos = -1  # Output index reserved for the current flag byte
+
+    def _store_flag(self) -> None:
+        """Store the current flag byte at its reserved index."""
+        if self._flag_pos >= 0:
+            # Pad to 8 bits (MSB first)
+            self._output[self._flag_pos] = self._flag << (8 - self._flag_count)
+
+    def _start_flag(self) -> None:
+        """Store the current flag and reserve the byte of the next one."""
+        self._store_flag()
+        self._flag_pos = len(self._output)
+        self._output.append(0)
+        self._flag = 0
+        self._flag_count = 0
 
     def write_bit(self, bit: bool) -> None:
         """
         Write a control bit.
 
-        If the current flag is full (8 bits), emit it BEFORE adding
-        the new bit. This ensures data bytes are correctly associated
+        If the current flag is full (8 bits), start the next one BEFORE
+        adding the new bit. This ensures data bytes are correctly associated
         with the flag that's active when they're read.
+
+        :param bit: Bit value, a bool or 0/1 (OR-ed in without branching).
         """
-        if len(self._flag_bits) >= 8:
-            self._emit_flag()
-        self._flag_bits.append(bit)
+        if self._flag_count >= 8:
+            self._start_flag()
+        self._flag = (self._flag << 1) | bit
+        self._flag_count += 1
+
+    def write_bits(self, value: int, count: int) -> None:
+        """
+        Write several control bits (MSB first), as write_bit would.
+
+        :param value: Bits to write.
+        :param count: Number of bits.
+        """
+        while count:
+            if self._flag_count >= 8:
+                self._start_flag()
+            take = min(count, 8 - self._flag_count)
+            count -= take
+            self._flag = (self._flag << take) | ((value >> count) & ((1 << take) - 1))
+            self._flag_count += take
+
+    def write_literals(self, values: bytes) -> None:
+        """
+        Write a 0 control bit followed by its data byte for each value.
+
+        Values are added a whole flag's worth at a time: the bits of one
+        flag and their data bytes, which all go after that flag byte.
+
+        :param values: Literal bytes.
+        """
+        start = 0
+        end = len(values)
+        while start < end:
+            if self._flag_count >= 8:
+                self._start_flag()
+            take = min(end - start, 8 - self._flag_count)
+            self._flag <<= take
+            self._flag_count += take
+            self._output += values[start : start + take]
+            start += take
 
     def write_data_byte(self, value: int) -> None:
         """Write a data byte for the current flag."""
-        self._flag_data.append(value & 0xFF)
+        self._output.append(value & 0xFF)
+
+    def write_data_bytes(self, values: bytes) -> None:
+        """Write several data bytes for the current flag."""
+        self._output += values
 
     def end_operation(self) -> None:
         """Mark end of a complete operation. No-op in new design."""
@@ -151,8 +254,56 @@ class LZInterleavedWriter:
 
     def finish(self) -> bytes:
         """Finish and return the encoded data."""
-        self._emit_flag()
-        return bytes(self._output)
+        return bytes(self.finish_buffer())
+
+    def finish_buffer(self) -> bytearray:
+        """Finish and return the output buffer itself, without copying it."""
+        self._store_flag()
+        return self._output
+
+
+# Bytes compared per slice when extending a match
+_MATCH_CHUNK = 16
+_MATCH_PREFIX = 4
+
+
+def _match_length(data: bytes, candidate: int, pos: int, limit: int) -> int:
+    """
+    Count how many bytes at candidate match the bytes at pos.
+
+    The first few bytes are compared one at a time, which rejects most
+    candidates cheaply. Longer matches are extended with slice equality (a
+    C-level memcmp) over chunks that double while they keep matching. In
+    the first chunk that differs, the mismatching byte is located at once
+    from the lowest set bit of the two chunks XORed as little-endian
+    integers (SWAR). Overlapping matches (runs) need no special case since
+    the input is not modified while it is searched.
+
+    :param data: Input data.
+    :param candidate: Earlier position to compare from.
+    :param pos: Current position.
+    :param limit: Maximum length to report.
+    :return: Match length, at most limit.
+    """
+    length = 0
+    while length < limit and data[candidate + length] == data[pos + length]:
+        length += 1
+        if length == _MATCH_PREFIX:
+            break
+    else:
+        return length
+
+    chunk = _MATCH_CHUNK
+    while length < limit:
+        end = min(length + chunk, limit)
+        earlier = data[candidate + length : candidate + end]
+        current = data[pos + length : pos + end]
+        if earlier != current:
+            diff = int.from_bytes(earlier, "little") ^ int.from_bytes(current, "little")
+            return length + (((diff & -diff).bit_length() - 1) >> 3)
+        length = end
+        chunk <<= 1
+    return length
 
 
 class LZEncoder:
@@ -171,6 +322,7 @@ class LZEncoder:
 
     # Sliding window size
     WINDOW_SIZE = 8192  # 8KB window for back-references
+    WINDOW_MASK = WINDOW_SIZE - 1
     # Minimum match length is 3 because:
     # - Case 0: 3-6 bytes
     # - Case 1: 3-9 bytes (length=2 would encode as 0, triggering Case 2/3)
@@ -181,8 +333,79 @@ class LZEncoder:
     MAX_MATCH_MED = 25  # Case 2 max
     MAX_MATCH_LONG = 255 + 0x1A  # Case 3 max
 
-    def __init__(self):
+    # Hash chain index over 3-byte prefixes (zlib layout)
+    HASH_SIZE = 1 << 16
+    HASH_MASK = HASH_SIZE - 1
+
+    # Compression levels run from 1 (fastest) to 9 (smallest), as in zlib.
+    # Each maps to (max_chain, good_match, lazy): at most max_chain hash
+    # chain candidates are compared, the search stops at a match of
+    # good_match bytes, and lazy defers matches by one byte.
+    DEFAULT_LEVEL = 6
+    LEVELS = {
+        1: (4, 4, False),
+        2: (8, 8, True),
+        3: (16, 16, True),
+        4: (32, 16, True),
+        5: (64, 32, True),
+        6: (128, 32, True),
+        7: (256, 64, True),
+        8: (1024, 128, True),
+        9: (4096, MAX_MATCH_LONG, True),
+    }
+    # Literal run escape: bits 1,1 + hi,lo (13-bit count - 0x1B, length
+    # field 0) + bit 1 + 0xFF, then the raw bytes. It costs 27 bits, one
+    # flag bit per literal is saved, so it pays off from 28 literals.
+    MIN_LITERAL_RUN = 0x1B + 1
+    MAX_LITERAL_RUN = 0x1B + 0x1FFF
+    # Candidates tried when extending a match through the continuation hash
+    CONTINUATION_PROBES = 4
+    # After 2 ** SKIP_SHIFT consecutive misses, each search is followed by
+    # one more unsearched literal (lz4's skip-ahead), below level 9
+    SKIP_SHIFT = 5
+    # Skipped positions right before the next search that are still indexed
+    SKIP_INDEXED_TAIL = 4
+    # Bytes parsed per task when encoding with an executor
+    PARALLEL_CHUNK_SIZE = 1 << 18
+
+    def __init__(self, level: int = DEFAULT_LEVEL):
+        """
+        Create an encoder.
+
+        :param level: Compression level, 1 (greedy parsing) to 9.
+        """
+        if not 1 <= level <= 9:
+            raise ValueError(f"Compression level must be between 1 and 9, got {level}")
+        self.level = level
+        self._max_chain, self._good_match, self._lazy = self.LEVELS[level]
         self._writer = None
+        self._index_data = None
+        self._indexed = 0
+        self._head = None
+        self._prev = None
+
+    def _reset_index(self, data: bytes) -> None:
+        """
+        Start a new hash chain index for data.
+
+        head[hash] holds the most recent position whose 3-byte prefix has
+        that hash, prev[position & WINDOW_MASK] the previous one, or -1.
+        prev only spans the window: chain walks stop at the window start,
+        before reaching a slot reused by a newer position.
+
+        :param data: Data to index.
+        """
+        self._index_data = data
+        self._indexed = 0
+        self._head = array("i", [-1]) * self.HASH_SIZE
+        self._prev = array("i", [-1]) * self.WINDOW_SIZE
+
+    def _release_index(self) -> None:
+        """Drop the hash chain index and the data it references."""
+        self._index_data = None
+        self._indexed = 0
+        self._head = None
+        self._prev = None
 
     def _find_match(
         self,
@@ -192,6 +415,12 @@ class LZEncoder:
         """
         Find the longest match in the sliding window.
 
+        Candidates come from the hash chain of the 3 bytes at pos, nearest
+        first, so only window positions sharing that prefix are compared.
+        The compression level bounds the candidates compared and the match
+        length that ends the search. Positions before pos are indexed on
+        demand.
+
         :param data: Full input data.
         :param pos: Current position in data.
         :return: (offset, length) tuple. offset is 0 if no match found.
@@ -199,41 +428,150 @@ class LZEncoder:
         if pos < 1:
             return 0, 0
 
+        data_len = len(data)
+        if data is not self._index_data or pos < self._indexed:
+            self._reset_index(data)
+
+        head = self._head
+        prev = self._prev
+        mask = self.HASH_MASK
+        window_mask = self.WINDOW_MASK
+
+        # Index every position up to pos (those with a full 3-byte prefix)
+        end = min(pos, data_len - 2)
+        for p in range(self._indexed, end):
+            h = ((data[p] << 8 | data[p + 1]) ^ (data[p + 2] << 4)) & mask
+            prev[p & window_mask] = head[h]
+            head[h] = p
+        if end > self._indexed:
+            self._indexed = end
+
+        remaining = data_len - pos
+        if remaining < self.MIN_MATCH:
+            return 0, 0
+
         best_offset = 0
         best_length = 0
-        max_offset = min(pos, self.WINDOW_SIZE)
-        remaining = len(data) - pos
         max_length = min(remaining, self.MAX_MATCH_LONG)
-
-        # Search backwards through the window
-        for offset in range(1, max_offset + 1):
-            match_pos = pos - offset
-            length = 0
-
-            # Count matching bytes
-            while length < max_length and pos + length < len(data):
-                if data[match_pos + (length % offset)] == data[pos + length]:
-                    length += 1
-                else:
-                    break
+        min_pos = pos - self.WINDOW_SIZE
+        good_length = min(self._good_match, max_length)
+        chain = self._max_chain
+        min_match = self.MIN_MATCH
+        # Byte right after the best match, -1 while there is none
+        scan_end = -1
+
+        h = ((data[pos] << 8 | data[pos + 1]) ^ (data[pos + 2] << 4)) & mask
+        candidate = head[h]
+
+        # Walk the chain backwards through the window
+        while candidate >= 0 and candidate >= min_pos and chain:
+            chain -= 1
+            # A candidate can only beat the best match if it also matches
+            # the byte right after it (zlib's scan_end check)
+            if scan_end >= 0 and data[candidate + best_length] != scan_end:
+                candidate = prev[candidate & window_mask]
+                continue
+
+            # Count matching bytes (overlapping matches repeat the pattern)
+            length = _match_length(data, candidate, pos, max_length)
 
             # Keep track of best match (prefer longer matches, then shorter offsets)
-            if length >= self.MIN_MATCH and length > best_length:
-                best_offset = offset
+            if length >= min_match and length > best_length:
+                best_offset = pos - candidate
                 best_length = length
+                if length >= good_length:
+                    break
+                scan_end = data[pos + length]
+
+            candidate = prev[candidate & window_mask]
 
         return best_offset, best_length
 
-    def _encode_literal(self, byte_value: int) -> None:
+    def _extend_match(
+        self,
+        data: bytes,
+        pos: int,
+        offset: int,
+        length: int,
+    ) -> Tuple[int, int]:
+        """
+        Look for a longer match continuing past the end of a known one.
+
+        A longer match at pos must also match the 3 bytes at pos + length,
+        so a few candidates from the hash chain at that position are tried
+        with their start moved back by length (continuation hash). Only
+        already indexed positions are considered.
+
+        :param data: Full input data.
+        :param pos: Current position in data.
+        :param offset: Offset of the known match.
+        :param length: Length of the known match.
+        :return: (offset, length) of the longest match found.
+        """
+        data_len = len(data)
+        end = pos + length
+        max_length = min(data_len - pos, self.MAX_MATCH_LONG)
+        if data is not self._index_data or end + 2 >= data_len or length >= max_length:
+            return offset, length
+
+        prev = self._prev
+        min_pos = max(pos - self.WINDOW_SIZE, 0)
+        h = ((data[end] << 8 | data[end + 1]) ^ (data[end + 2] << 4)) & self.HASH_MASK
+        candidate = self._head[h]
+
+        for _ in range(self.CONTINUATION_PROBES):
+            start = candidate - length
+            if candidate < 0 or start < min_pos:
+                break
+            # The candidate must cover the known match and the byte after it
+            if data[start : start + length + 1] == data[pos : end + 1]:
+                candidate_length = _match_length(data, start, pos, max_length)
+                if candidate_length > length:
+                    offset = pos - start
+                    length = candidate_length
+                    end = pos + length
+                    if length == max_length:
+                        break
+            candidate = prev[candidate & self.WINDOW_MASK]
+
+        return offset, length
+
+    def _encode_literal_run(self, values: bytes) -> None:
         """
-        Encode a literal byte (no back-reference found).
+        Encode raw bytes with the literal run escape.
+
+        Format: bits 1,1 + hi,lo (length field 0, 13-bit count) + bit 1 +
+        0xFF length byte, then the bytes as data.
 
-        Format: 0-bit followed by the byte as data
+        :param values: MIN_LITERAL_RUN - 1 to MAX_LITERAL_RUN bytes.
         """
-        self._writer.write_bit(False)
-        self._writer.write_data_byte(byte_value)
+        count = len(values) - 0x1B
+        self._writer.write_bits(0b11, 2)
+        self._writer.write_data_byte(count >> 8)
+        self._writer.write_data_byte(count & 0xFF)
+        self._writer.write_bit(True)
+        self._writer.write_data_byte(0xFF)
+        self._writer.write_data_bytes(values)
         self._writer.end_operation()
 
+    def _encode_literals(self, data: bytes, start: int, end: int) -> None:
+        """
+        Encode data[start:end] as literals, in runs when they are long.
+
+        Short stretches are written as 0 bits with their data bytes, a flag
+        at a time.
+
+        :param data: Full input data.
+        :param start: First literal position.
+        :param end: Position after the last literal.
+        """
+        while end - start >= self.MIN_LITERAL_RUN:
+            run_end = min(end, start + self.MAX_LITERAL_RUN)
+            self._encode_literal_run(data[start:run_end])
+            start = run_end
+        if start < end:
+            self._writer.write_literals(data[start:end])
+
     def _encode_backref(self, offset: int, length: int) -> None:
         """
         Encode a back-reference.
@@ -246,12 +584,9 @@ class LZEncoder:
 
         # Case 0: length 3-6, offset <= 255
         if 3 <= length <= 6 and offset_enc <= 255:
-            self._writer.write_bit(True)   # 1
-            self._writer.write_bit(False)  # 0
-            # 2-bit length encoding: 00=3, 01=4, 10=5, 11=6
+            # Bits 1,0 then 2-bit length encoding: 00=3, 01=4, 10=5, 11=6
             length_enc = length - 3
-            self._writer.write_bit(bool(length_enc & 2))
-            self._writer.write_bit(bool(length_enc & 1))
+            self._writer.write_bits(0b1000 | length_enc, 4)
             self._writer.write_data_byte(offset_enc)
             self._writer.end_operation()
             return
@@ -260,8 +595,7 @@ class LZEncoder:
         # Note: length=2 would encode as length_field=0, which triggers Case 2/3 in decoder
         # So Case 1 only supports lengths 3-9 (length_field 1-7)
         if 3 <= length <= 9 and offset_enc <= 8191:
-            self._writer.write_bit(True)  # 1
-            self._writer.write_bit(True)  # 1
+            self._writer.write_bits(0b11, 2)
             # 2-byte encoding: hi byte = (length-2)<<5 | (offset>>8), lo byte = offset&0xFF
             length_enc = length - 2
             hi = (length_enc << 5) | ((offset_enc >> 8) & 0x1F)
@@ -275,20 +609,15 @@ class LZEncoder:
         # Format: bits 1,1 + hi,lo (with length_field=0) + bit 0 + 4 bits for length
         # Length = (4-bit value) + 10, so 4-bit value = length - 10
         if 10 <= length <= 25 and offset_enc <= 8191:
-            self._writer.write_bit(True)   # 1 - backref
-            self._writer.write_bit(True)   # 1 - not case 0
+            self._writer.write_bits(0b11, 2)  # backref, not case 0
             # hi has length_field=0 to trigger Case 2/3 branch
             hi = (offset_enc >> 8) & 0x1F
             lo = offset_enc & 0xFF
             self._writer.write_data_byte(hi)
             self._writer.write_data_byte(lo)
-            self._writer.write_bit(False)  # 0 - case 2 (not case 3)
-            # Write 4 bits for length (MSB first)
+            # Bit 0 (case 2, not case 3) then 4 bits for length (MSB first)
             length_enc = length - 10  # 0-15
-            self._writer.write_bit(bool(length_enc & 8))
-            self._writer.write_bit(bool(length_enc & 4))
-            self._writer.write_bit(bool(length_enc & 2))
-            self._writer.write_bit(bool(length_enc & 1))
+            self._writer.write_bits(length_enc, 5)
             self._writer.end_operation()
             return
 
@@ -300,8 +629,7 @@ class LZEncoder:
             # Cap length to avoid 0xFF which triggers literal run
             actual_length = min(length, 0x1A + 254)  # Max 280
 
-            self._writer.write_bit(True)  # 1
-            self._writer.write_bit(True)  # 1
+            self._writer.write_bits(0b11, 2)
             # hi = (0<<5) | (offset>>8), meaning length field is 0
             hi = (offset_enc >> 8) & 0x1F
             lo = offset_enc & 0xFF
@@ -317,8 +645,7 @@ class LZEncoder:
         # Fallback to case 1 with truncated length
         if offset_enc <= 8191:
             length = min(length, 9)
-            self._writer.write_bit(True)
-            self._writer.write_bit(True)
+            self._writer.write_bits(0b11, 2)
             length_enc = length - 2
             hi = (length_enc << 5) | ((offset_enc >> 8) & 0x1F)
             lo = offset_enc & 0xFF
@@ -337,28 +664,317 @@ class LZEncoder:
         :param data: Uncompressed data.
         :return: LZ77 compressed data.
         """
-        self._writer = LZInterleavedWriter()
+        return bytes(self.encode_buffer(data))
+
+    def encode_buffer(
+        self,
+        data: bytes,
+        output: Optional[bytearray] = None,
+        executor: Optional[Executor] = None,
+    ) -> bytearray:
+        """
+        Compress data using LZ77 into a buffer.
+
+        Same as encode, but returns the writer's buffer without the final
+        bytes copy, for encoders that process the LZ77 output further.
+
+        With an executor, data of at least two PARALLEL_CHUNK_SIZE chunks is
+        parsed chunk by chunk in the executor. Each chunk still matches
+        against the window before it, so only matches crossing a chunk end
+        are lost, and the chunks are written as one stream.
+
+        :param data: Uncompressed data (any bytes-like object).
+        :param output: Buffer to append to (defaults to a new one).
+        :param executor: Optional executor (process pool) to parse chunks in.
+        :return: The buffer, with the LZ77 compressed data appended.
+        """
+        # Take one immutable bytes view of the input for the whole encode:
+        # indexing bytes returns cached ints and slice compares are memcmp,
+        # both slower through memoryview, and the hash index is keyed on it
+        if type(data) is not bytes:
+            data = bytes(data)
+
+        chunk_size = self.PARALLEL_CHUNK_SIZE
+        if executor is None or len(data) < 2 * chunk_size:
+            ops_list = [self._parse(data)]
+        else:
+            starts = range(0, len(data), chunk_size)
+            bases = [max(start - self.WINDOW_SIZE, 0) for start in starts]
+            ops_list = executor.map(
+                _parse_lz_chunk,
+                [self.level] * len(bases),
+                [data[base : start + chunk_size] for base, start in zip(bases, starts)],
+                [start - base for base, start in zip(bases, starts)],
+            )
+
+        self._writer = LZInterleavedWriter(output)
         pos = 0
+        for ops in ops_list:
+            pos = self._encode_ops(data, ops, pos)
+        writer = self._writer
+        self._writer = None
+        return writer.finish_buffer()
+
+    def _parse(self, data: bytes, start: int = 0) -> List[int]:
+        """
+        Choose the literals and back-references that encode data[start:].
+
+        Bytes before start are only used as the window to match against.
 
-        while pos < len(data):
-            offset, length = self._find_match(data, pos)
-
-            if length >= self.MIN_MATCH:
-                # Encode in chunks if match is very long (max 280 per chunk)
-                while length >= self.MIN_MATCH:
-                    chunk = min(length, 280)
-                    self._encode_backref(offset, chunk)
-                    pos += chunk
-                    length -= chunk
-                    # For subsequent chunks, offset stays same (relative to NEW position)
-                    # Actually we need to re-find match for correct offset
-                    if length >= self.MIN_MATCH:
-                        offset, length = self._find_match(data, pos)
+        :param data: Data to parse.
+        :param start: Position to start encoding from.
+        :return: Flat list of (offset, length) ops, offset 0 for literals.
+        """
+        self._reset_index(data)
+        ops: List[int] = []
+        add_op = ops.extend
+        lazy = self._lazy
+        skip_ahead = self.level < 9
+        # Bound methods and constants used for every position
+        find_match = self._find_match
+        min_match = self.MIN_MATCH
+        max_run_search = self.MAX_MATCH_MED
+        skip_shift = self.SKIP_SHIFT
+        skip_tail = self.SKIP_INDEXED_TAIL
+        misses = 0
+        pos = start
+        # Literals are collected from literal_start and added before the
+        # next back-reference, so they can be emitted as one raw run
+        literal_start = start
+        data_len = len(data)
+        # Match at pos found while looking ahead from the previous byte
+        next_match = None
+
+        def add_match(offset: int, length: int, pos: int) -> int:
+            # A match reaching the 280-byte limit of one back-reference may
+            # go on: it is measured once and copied in 280-byte chunks from
+            # the same offset. The rest is searched again like any position,
+            # since a match at another offset may continue past it
+            if length < 280:
+                add_op((offset, length))
+                return pos + length
+            length = _match_length(data, pos - offset, pos, data_len - pos)
+            while length >= 280:
+                add_op((offset, 280))
+                pos += 280
+                length -= 280
+            # The copied bytes repeat indexed ones, so below level 9 only the
+            # last few are indexed, as after skipped literals
+            if skip_ahead and self._indexed < pos - skip_tail:
+                self._indexed = pos - skip_tail
+            return pos
+
+        while pos < data_len:
+            if next_match is not None:
+                offset, length = next_match
+                next_match = None
+            else:
+                # Runs of the previous byte are copied from offset 1 (the copy
+                # overlaps itself) without searching the window, as zlib's RLE
+                # strategy does for padding
+                if pos and data[pos] == data[pos - 1]:
+                    length = _match_length(data, pos - 1, pos, min(data_len - pos, 280))
+                    if length > max_run_search:
+                        # The run may continue as an earlier copy of the data
+                        offset, length = self._extend_match(data, pos, 1, length)
+                        if literal_start < pos:
+                            add_op((0, pos - literal_start))
+                        pos = add_match(offset, length, pos)
+                        literal_start = pos
+                        continue
+
+                offset, length = find_match(data, pos)
+
+            # Lazy matching: if the next byte starts a longer match, emit
+            # this byte as a literal and take that match instead
+            if lazy and min_match <= length < 280:
+                following = find_match(data, pos + 1)
+                if following[1] > length:
+                    pos += 1
+                    next_match = following
+                    continue
+
+            if length >= min_match:
+                misses = 0
+                if literal_start < pos:
+                    add_op((0, pos - literal_start))
+                pos = add_match(offset, length, pos)
+                literal_start = pos
             else:
-                self._encode_literal(data[pos])
                 pos += 1
+                if skip_ahead:
+                    # Incompressible data: take more literals without searching
+                    # or indexing them (lz4 does not insert skipped positions
+                    # either), indexing is most of the cost of a miss. The
+                    # last few are still indexed since their prefixes run
+                    # into the data that follows
+                    misses += 1
+                    skip = misses >> skip_shift
+                    if skip:
+                        pos = min(pos + skip, data_len)
+                        if self._indexed < pos - skip_tail:
+                            self._indexed = pos - skip_tail
+
+        if literal_start < data_len:
+            add_op((0, data_len - literal_start))
+
+        self._release_index()
+        return ops
+
+    def _encode_ops(self, data: bytes, ops: Sequence[int], pos: int) -> int:
+        """
+        Write parsed ops with the current writer.
 
-        return self._writer.finish()
+        :param data: Full input data.
+        :param ops: Flat (offset, length) ops from _parse, offset 0 for literals.
+        :param pos: Position in data of the first op.
+        :return: Position after the last op.
+        """
+        encode_literals = self._encode_literals
+        encode_backref = self._encode_backref
+        write_bits = self._writer.write_bits
+        write_data_byte = self._writer.write_data_byte
+        op_iter = iter(ops)
+        for offset, length in zip(op_iter, op_iter):
+            if not offset:
+                encode_literals(data, pos, pos + length)
+            elif length <= 6 and offset <= 256:
+                # Case 0, the most common back-reference, written inline
+                write_bits(0b1000 | (length - 3), 4)
+                write_data_byte(offset - 1)
+            else:
+                encode_backref(offset, length)
+            pos += length
+        return pos
+
+
+def _parse_lz_chunk(level: int, data: bytes, start: int) -> List[int]:
+    """
+    Parse one chunk for LZEncoder.encode_buffer (runs in worker processes).
+
+    :param level: Compression level.
+    :param data: Chunk preceded by its window.
+    :param start: Position of the chunk in data.
+    :return: Flat (offset, length) ops of the chunk.
+    """
+    return LZEncoder(level)._parse(data, start)
+
+
+# Sample size, and distinct values in it up to which they are counted with
+# one bytes.count per value
+_COUNT_SAMPLE = 1024
+_COUNT_SAMPLE_VALUES = 32
+
+
+def _byte_frequencies(data: bytes) -> List[int]:
+    """
+    Count how many times each byte value occurs in data.
+
+    When a sample of the data uses few distinct values (padding, index
+    buffers), each of them is counted with one C-level bytes.count pass.
+    The bytes left once those values are deleted (bytes.translate) are
+    counted in a loop, as is all data with a wide alphabet.
+
+    :param data: Input data (any bytes-like object).
+    :return: 256 counts indexed by byte value.
+    """
+    data = bytes(data)
+    freq = [0] * 256
+    common = set(data[:_COUNT_SAMPLE])
+    if len(common) <= _COUNT_SAMPLE_VALUES:
+        for byte in common:
+            freq[byte] = data.count(byte)
+        data = data.translate(None, bytes(common))
+
+    for byte in data:
+        freq[byte] += 1
+    return freq
+
+
+def _limited_code_lengths(freq: List[int], max_length: int) -> Dict[int, int]:
+    """
+    Compute optimal code lengths of at most max_length bits (package-merge).
+
+    Only needed when the Huffman tree is deeper than max_length, which
+    takes very skewed frequencies, so packages simply hold their symbols.
+
+    :param freq: Count of each byte value.
+    :param max_length: Longest allowed code, 2 ** max_length >= symbol count.
+    :return: Code length by byte value, for bytes with a nonzero count.
+    """
+    leaves = sorted((count, (byte,)) for byte, count in enumerate(freq) if count > 0)
+    items = leaves
+    for _ in range(max_length - 1):
+        packages = [
+            (items[i][0] + items[i + 1][0], items[i][1] + items[i + 1][1])
+            for i in range(0, len(items) - 1, 2)
+        ]
+        items = list(heapq.merge(leaves, packages, key=itemgetter(0)))
+
+    lengths = dict.fromkeys((byte for _count, (byte,) in leaves), 0)
+    for _weight, symbols in items[: 2 * len(leaves) - 2]:
+        for byte in symbols:
+            lengths[byte] += 1
+    return lengths
+
+
+def _canonical_codes(lengths: Dict[int, int]) -> Dict[int, Tuple[int, int]]:
+    """
+    Assign canonical codes from code lengths (deflate ordering).
+
+    Codes are consecutive integers in (length, byte) order, so the codes
+    only depend on the lengths.
+
+    :param lengths: Code length by byte value.
+    :return: (code, bit length) by byte value.
+    """
+    codes = {}
+    code = 0
+    previous_length = 0
+    for length, byte in sorted((length, byte) for byte, length in lengths.items()):
+        code <<= length - previous_length
+        codes[byte] = (code, length)
+        code += 1
+        previous_length = length
+    return codes
+
+
+def _canonical_tree(codes: Dict[int, Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Build the decoding tree of a complete prefix code.
+
+    Internal nodes are numbered from 0x100 in post-order, so the root is
+    the last node as the decoder requires.
+
+    :param codes: (code, bit length) by byte value.
+    :return: (left, right) children of each internal node.
+    """
+    root: list = [None, None]
+    for byte, (code, length) in codes.items():
+        node = root
+        for shift in range(length - 1, 0, -1):
+            bit = (code >> shift) & 1
+            if node[bit] is None:
+                node[bit] = [None, None]
+            node = node[bit]
+        node[code & 1] = byte
+
+    tree_nodes: List[Tuple[int, int]] = []
+
+    def number(node: list) -> int:
+        # Depth is bounded by the code length limit
+        left, right = node
+        left_id = left if isinstance(left, int) else number(left)
+        right_id = right if isinstance(right, int) else number(right)
+        tree_nodes.append((left_id, right_id))
+        return 0x100 + len(tree_nodes) - 1
+
+    number(root)
+    return tree_nodes
+
+
+# Code table entries of bytes missing from a Huffman tree: their 8-bit value
+_FALLBACK_CODES = tuple((byte, 8) for byte in range(256))
 
 
 class HuffmanEncoder:
@@ -369,9 +985,15 @@ class HuffmanEncoder:
     The tree is stored in a format compatible with the decoder.
     """
 
+    # Longest code emitted, as in deflate
+    MAX_CODE_LENGTH = 15
+    # Input size from which two bytes are coded per table lookup
+    PAIR_CODES_MIN_SIZE = 1 << 16
+
     def __init__(self):
         self._codes: dict = {}
         self._code_lengths: dict = {}
+        self._coded_bits = 0
 
     def _build_tree(self, data: bytes) -> List[int]:
         """
@@ -386,85 +1008,63 @@ class HuffmanEncoder:
         :return: Huffman table as list of int16 values.
         """
         # Count frequencies
-        freq = [0] * 256
-        for byte in data:
-            freq[byte] += 1
+        freq = _byte_frequencies(data)
 
         # Handle empty or single-byte data
         non_zero_count = sum(1 for f in freq if f > 0)
         if non_zero_count == 0:
             # Empty data - create minimal tree
             self._codes = {0: (0, 1)}  # 0 -> bit 0, length 1
+            self._coded_bits = 0
             return [0x100, 0, 0]  # Minimal tree pointing to byte 0
 
         if non_zero_count == 1:
             # Single byte value - create minimal tree
             byte_val = next(i for i, f in enumerate(freq) if f > 0)
             self._codes = {byte_val: (0, 1)}
+            self._coded_bits = freq[byte_val]
             return [0x100, byte_val, byte_val]
 
-        # Build priority queue (min-heap simulation with sorted list)
-        # Each entry is (frequency, node_id, left, right)
-        # Leaf nodes have left=right=byte_value
-        nodes = []
-        node_id = 0
-        for byte, count in enumerate(freq):
-            if count > 0:
-                nodes.append((count, node_id, byte, byte))  # Leaf node
-                node_id += 1
-
-        nodes.sort()
+        # Build priority queue as a binary heap of (frequency, rank, node).
+        # node is the byte value for leaves and the internal node ID
+        # otherwise. Ties pop the newest internal node first, then leaves in
+        # byte order (rank is -internal_id for internal nodes).
+        nodes = [(count, byte, byte) for byte, count in enumerate(freq) if count > 0]
+        heapq.heapify(nodes)
 
         # Build tree by combining lowest frequency nodes
         tree_nodes = []  # List of (left, right) for internal nodes
-        leaf_to_code = {}  # byte -> node position in tree
 
         while len(nodes) > 1:
             # Pop two smallest
-            freq1, id1, left1, right1 = nodes.pop(0)
-            freq2, id2, left2, right2 = nodes.pop(0)
+            freq1, _rank1, node1 = heapq.heappop(nodes)
+            freq2, _rank2, node2 = heapq.heappop(nodes)
 
             # Create internal node
             internal_id = 0x100 + len(tree_nodes)
-            tree_nodes.append((id1 if id1 >= 0x100 else left1, id2 if id2 >= 0x100 else left2))
-
-            # Insert combined node (keep sorted)
-            combined = (freq1 + freq2, internal_id, -1, -1)
-            inserted = False
-            for i, n in enumerate(nodes):
-                if combined[0] <= n[0]:
-                    nodes.insert(i, combined)
-                    inserted = True
-                    break
-            if not inserted:
-                nodes.append(combined)
-
-            # Track leaf assignments
-            if id1 < 0x100:
-                leaf_to_code[left1] = (internal_id, 0)
-            if id2 < 0x100:
-                leaf_to_code[left2] = (internal_id, 1)
+            tree_nodes.append((node1, node2))
+            heapq.heappush(nodes, (freq1 + freq2, -internal_id, internal_id))
 
-        # Build the table for decoder
-        # Format: table_len (int16), then pairs of int16 for each internal node
-        table = []
+        # Code lengths of the Huffman tree, limited to MAX_CODE_LENGTH bits
+        self._generate_codes(tree_nodes, 0x100 + len(tree_nodes) - 1)
+        lengths = {byte: length for byte, (_code, length) in self._codes.items()}
+        if max(lengths.values()) > self.MAX_CODE_LENGTH:
+            lengths = _limited_code_lengths(freq, self.MAX_CODE_LENGTH)
+        self._code_lengths = lengths
+        self._coded_bits = sum(freq[byte] * length for byte, length in lengths.items())
 
-        # Root node index
-        if nodes:
-            root_id = nodes[0][1]
-            table.append(root_id)  # Table length / root pointer
-        else:
-            table.append(0x100)
+        # Canonical codes and the tree that decodes them
+        self._codes = _canonical_codes(lengths)
+        tree_nodes = _canonical_tree(self._codes)
 
-        # Add node data (format expected by decoder)
+        # Build the table for decoder
+        # Format: root node ID (the last internal node, which also gives the
+        # table length), then the (left, right) children of each internal node
         # Decoder navigates: data[node*2 - 0x200 + bit]
-        # We need to build table so decoder can traverse
-        for i, (left, right) in enumerate(tree_nodes):
-            table.append(left if left >= 0x100 else left)  # Left child (0 bit)
-            table.append(right if right >= 0x100 else right)  # Right child (1 bit)
-
-        # Generate bit codes by traversing tree
-        self._generate_codes(tree_nodes, len(tree_nodes) - 1 + 0x100 if tree_nodes else 0)
+        table = [0x100 + len(tree_nodes) - 1]
+        for left, right in tree_nodes:
+            table.append(left)  # Left child (0 bit)
+            table.append(right)  # Right child (1 bit)
 
         return table
 
@@ -480,25 +1080,53 @@ class HuffmanEncoder:
         if not tree_nodes:
             return
 
-        def traverse(node_id: int, code: int, length: int) -> None:
+        # Depth-first walk with an explicit stack (skewed trees can be up
+        # to 255 levels deep), left child first
+        codes = self._codes
+        node_count = len(tree_nodes)
+        stack = [(root, 0, 0)]
+        while stack:
+            node_id, code, length = stack.pop()
             if node_id < 0x100:
                 # Leaf node - this is a byte value
-                self._codes[node_id] = (code, length)
-                return
+                codes[node_id] = (code, length)
+                continue
 
             # Internal node
             idx = node_id - 0x100
-            if 0 <= idx < len(tree_nodes):
+            if idx < node_count:
                 left, right = tree_nodes[idx]
-                traverse(left, code << 1, length + 1)
-                traverse(right, (code << 1) | 1, length + 1)
-
-        traverse(root, 0, 0)
+                code <<= 1
+                length += 1
+                stack.append((right, code | 1, length))
+                stack.append((left, code, length))
 
         # Ensure we have at least one code
         if not self._codes:
             self._codes = {0: (0, 1)}
 
+    def coded_size(self) -> int:
+        """
+        Get the size of the codes of the data the tree was last built for.
+
+        :return: Size in bytes, without the table.
+        """
+        return (self._coded_bits + 7) // 8
+
+    def _code_table(self) -> List[Tuple[int, int]]:
+        """
+        Get the (code, bit length) of every byte value, indexed by byte.
+
+        Bytes missing from the tree (which shouldn't happen) fall back to
+        their 8-bit value.
+
+        :return: List of 256 (code, bit length) pairs.
+        """
+        table = list(_FALLBACK_CODES)
+        for byte, code in self._codes.items():
+            table[byte] = code
+        return table
+
     def encode(self, data: bytes) -> Tuple[bytes, bytes]:
         """
         Encode data using Huffman coding.
@@ -506,24 +1134,77 @@ class HuffmanEncoder:
         :param data: Input data.
         :return: (table_bytes, encoded_data_bytes) tuple.
         """
-        table = self._build_tree(data)
+        table_bytes = self._encode_table(data)
+        encoded = self._encode_codes(data, bytearray())
+        return table_bytes, bytes(encoded)
 
-        # Serialize table
-        table_bytes = b"".join(struct.pack("<h", v) for v in table)
+    def encode_into(self, data: bytes, buffer: bytearray, only_if_smaller: bool = False) -> bool:
+        """
+        Append the Huffman table followed by the encoded data to a buffer.
 
-        # Encode data
-        writer = BitWriter()
-        for byte in data:
-            if byte in self._codes:
-                code, length = self._codes[byte]
-                writer.write_bits(code, length)
-            else:
-                # Fallback for bytes not in tree (shouldn't happen)
-                writer.write_bits(byte, 8)
+        :param data: Input data.
+        :param buffer: Buffer to append to.
+        :param only_if_smaller: Leave the buffer untouched when the table and
+                                codes would not be smaller than data.
+        :return: True if data was encoded, False if it was left out.
+        """
+        table_bytes = self._encode_table(data)
+        if only_if_smaller and len(table_bytes) + self.coded_size() >= len(data):
+            return False
+        buffer += table_bytes
+        self._encode_codes(data, buffer)
+        return True
+
+    def _encode_table(self, data: bytes) -> bytes:
+        """
+        Build the Huffman tree for data and serialize its table.
+
+        :param data: Input data.
+        :return: Table bytes.
+        """
+        table = self._build_tree(data)
+        return struct.pack(f"<{len(table)}h", *table)
+
+    def _encode_codes(self, data: bytes, buffer: bytearray) -> bytearray:
+        """
+        Append the codes of data (tree already built) to a buffer.
 
-        encoded = writer.flush()
+        :param data: Input data.
+        :param buffer: Buffer to append to.
+        :return: The buffer.
+        """
+        codes = self._code_table()
+        writer = BitWriter(buffer)
+        if len(data) >= self.PAIR_CODES_MIN_SIZE:
+            # Read byte pairs as native 16-bit values, halving the lookups
+            even = len(data) & ~1
+            pairs = memoryview(data)[:even].cast("H")
+            writer.write_codes(pairs, self._pair_code_table(codes))
+            data = data[even:]
+        writer.write_codes(data, codes)
+        return writer.flush()
+
+    @staticmethod
+    def _pair_code_table(codes: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Combine a code table into one for byte pairs read as 16-bit values.
 
-        return table_bytes, encoded
+        :param codes: (code, bit length) of every byte value.
+        :return: List of 65536 (code, bit length) pairs, indexed by the
+                 native-endian value of the byte pair.
+        """
+        if sys.byteorder == "little":
+            # Low byte first: index = second << 8 | first
+            return [
+                ((first << second_length) | second, first_length + second_length)
+                for second, second_length in codes
+                for first, first_length in codes
+            ]
+        return [
+            ((first << second_length) | second, first_length + second_length)
+            for first, first_length in codes
+            for second, second_length in codes
+        ]
 
 
 class HFIEncoder:
@@ -533,8 +1214,13 @@ class HFIEncoder:
     Applies LZ77 first, then Huffman encodes the result.
     """
 
-    def __init__(self):
-        self._lz_encoder = LZEncoder()
+    def __init__(self, level: int = LZEncoder.DEFAULT_LEVEL):
+        """
+        Create an encoder.
+
+        :param level: LZ77 compression level, 1 (greedy parsing) to 9.
+        """
+        self._lz_encoder = LZEncoder(level)
         self._huffman_encoder = HuffmanEncoder()
 
     def encode(self, data: bytes) -> bytes:
@@ -544,16 +1230,51 @@ class HFIEncoder:
         :param data: Uncompressed data.
         :return: Compressed data with Huffman table prefix.
         """
-        # LZ77 pass
-        lz_compressed = self._lz_encoder.encode(data)
+        return bytes(self.encode_buffer(data))
+
+    def encode_buffer(
+        self,
+        data: bytes,
+        output: Optional[bytearray] = None,
+        executor: Optional[Executor] = None,
+    ) -> bytearray:
+        """
+        Encode data using LZ77 followed by Huffman coding into a buffer.
 
-        # Huffman pass on LZ output
-        table_bytes, huffman_data = self._huffman_encoder.encode(lz_compressed)
+        :param data: Uncompressed data.
+        :param output: Buffer to append to (defaults to a new one).
+        :param executor: Optional executor to run the LZ77 parse in chunks.
+        :return: The buffer, with the table and Huffman coded data appended.
+        """
+        # LZ77 pass, the intermediate buffer is only read by the Huffman pass
+        lz_compressed = self._lz_encoder.encode_buffer(data, executor=executor)
 
-        # Combine: table (starting with root node ID) + huffman data
+        # Huffman pass on LZ output, written after the table
         # The decoder expects: [root_id, node_data...] + encoded_data
-        # table_bytes already has this format from _build_tree
-        return table_bytes + huffman_data
+        if output is None:
+            output = bytearray()
+        self._huffman_encoder.encode_into(lz_compressed, output)
+        return output
+
+    def encode_into(
+        self,
+        data: bytes,
+        output: bytearray,
+        executor: Optional[Executor] = None,
+    ) -> bool:
+        """
+        Append data coded as HFI, or as LZ if Huffman coding would not shrink it.
+
+        :param data: Uncompressed data.
+        :param output: Buffer to append to.
+        :param executor: Optional executor to run the LZ77 parse in chunks.
+        :return: True if the data was Huffman coded, False if stored as LZ.
+        """
+        lz_compressed = self._lz_encoder.encode_buffer(data, executor=executor)
+        if self._huffman_encoder.encode_into(lz_compressed, output, only_if_smaller=True):
+            return True
+        output += lz_compressed
+        return False
 
 
 class HFIRWEncoder:
@@ -571,21 +1292,51 @@ class HFIRWEncoder:
         :param data: Uncompressed data.
         :return: Compressed data with Huffman table prefix.
         """
-        table_bytes, huffman_data = self._huffman_encoder.encode(data)
+        return bytes(self.encode_buffer(data))
 
-        # Combine: table (starting with root node ID) + huffman data
-        return table_bytes + huffman_data
+    def encode_buffer(self, data: bytes, output: Optional[bytearray] = None) -> bytearray:
+        """
+        Encode data using Huffman coding only into a buffer.
+
+        :param data: Uncompressed data.
+        :param output: Buffer to append to (defaults to a new one).
+        :return: The buffer, with the table and Huffman coded data appended.
+        """
+        # Table (starting with root node ID) + huffman data
+        if output is None:
+            output = bytearray()
+        self._huffman_encoder.encode_into(data, output)
+        return output
+
+    def encode_into(self, data: bytes, output: bytearray) -> bool:
+        """
+        Append data Huffman coded, or unchanged if coding would not shrink it.
+
+        :param data: Uncompressed data.
+        :param output: Buffer to append to.
+        :return: True if the data was Huffman coded, False if stored raw.
+        """
+        if self._huffman_encoder.encode_into(data, output, only_if_smaller=True):
+            return True
+        output += data
+        return False
 
 
 def compress_jkr(
     data: bytes,
     compression_type: int = CompressionType.HFI,
+    executor: Optional[Executor] = None,
 ) -> bytes:
     """
     Compress data to JKR/JPK format.
 
+    When Huffman coding would not make the data smaller, HFI data is stored
+    as LZ and HFIRW data as RW, which the header records.
+
     :param data: Uncompressed data.
     :param compression_type: Compression type (RW, HFIRW, LZ, or HFI).
+    :param executor: Optional executor (process pool) to run the LZ77 parse
+                     of large data in chunks, for LZ and HFI.
     :return: Complete JKR file data including header.
     """
     header = JKRHeaderBuilder(
@@ -595,23 +1346,33 @@ def compress_jkr(
 
     if compression_type == CompressionType.RW or compression_type == CompressionType.NONE:
         # Raw - no compression
-        compressed = data
+        return b"".join((header.to_bytes(), data))
+
+    if compression_type == CompressionType.LZ:
+        # LZ77 only, appended to the buffer holding the header
+        output = bytearray(header.to_bytes())
+        LZEncoder().encode_buffer(data, output, executor)
+        return bytes(output)
+
+    # Huffman coding would not shrink near-uniform data (already compressed
+    # textures or audio): it is then stored without that pass
+    output = bytearray(header.to_bytes())
+    if compression_type == CompressionType.HFI:
+        # Huffman + LZ77
+        coded = HFIEncoder().encode_into(data, output, executor)
+        stored_type = CompressionType.LZ
     elif compression_type == CompressionType.HFIRW:
         # Huffman only
-        encoder = HFIRWEncoder()
-        compressed = encoder.encode(data)
-    elif compression_type == CompressionType.LZ:
-        # LZ77 only
-        encoder = LZEncoder()
-        compressed = encoder.encode(data)
-    elif compression_type == CompressionType.HFI:
-        # Huffman + LZ77
-        encoder = HFIEncoder()
-        compressed = encoder.encode(data)
+        coded = HFIRWEncoder().encode_into(data, output)
+        stored_type = CompressionType.RW
     else:
         raise ValueError(f"Unknown compression type: {compression_type}")
 
-    return header.to_bytes() + compressed
+    if not coded:
+        header.compression_type = stored_type
+        header_bytes = header.to_bytes()
+        output[:len(header_bytes)] = header_bytes
+    return bytes(output)
 
 
 def compress_jkr_hfi(data: bytes) -> bytes:
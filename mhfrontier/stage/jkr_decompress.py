@@ -15,7 +15,7 @@ import struct
 from dataclasses import dataclass
 from enum import IntEnum
 from io import BytesIO
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Union
 
 
 class CompressionType(IntEnum):
@@ -31,10 +31,16 @@ class CompressionType(IntEnum):
 # Note: Same value as FileMagic.JKR in stage_container.py (kept separate to avoid circular import)
 JKR_MAGIC = 0x1A524B4A
 
+_MAGIC = struct.Struct("<I")
+_HEADER = struct.Struct("<IHHII")
+_TABLE_LEN = struct.Struct("<h")
+
 
 @dataclass
 class JKRHeader:
     """JKR file header structure."""
+    __slots__ = ("magic", "version", "compression_type", "data_offset", "decompressed_size")
+
     magic: int              # 4 bytes: 0x1A524B4A ("JKR\x1A")
     version: int            # 2 bytes: usually 0x108
     compression_type: int   # 2 bytes: compression type enum
@@ -52,9 +58,7 @@ class JKRHeader:
         if len(data) < 16:
             return None
 
-        magic, version, compression_type, data_offset, decompressed_size = struct.unpack(
-            "<IHHII", data[:16]
-        )
+        magic, version, compression_type, data_offset, decompressed_size = _HEADER.unpack_from(data)
 
         if magic != JKR_MAGIC:
             return None
@@ -75,34 +79,31 @@ class LZDecoder:
     Ported from ReFrontier JPKDecodeLz.cs
     """
 
-    def __init__(self):
-        self._shift_index = 0
-        self._flag = 0
-
-    def _read_byte(self, stream: BytesIO) -> int:
-        """Read a single byte from stream."""
-        byte = stream.read(1)
-        if not byte:
-            raise EOFError("Reached end of file too early!")
-        return byte[0]
-
-    def _jpk_bit_lz(self, stream: BytesIO) -> bool:
-        """Return the value of the next bit from stream."""
-        if self._shift_index <= 0:
-            self._shift_index = 7
-            self._flag = self._read_byte(stream)
-        else:
-            self._shift_index -= 1
-        return ((self._flag >> self._shift_index) & 1) == 1
-
     @staticmethod
     def _jpk_copy_lz(buffer: bytearray, offset: int, length: int, index: int) -> int:
         """
         Copy length bytes to buffer at position index.
         Bytes are copied from position index - offset - 1.
+
+        Copies are done with slices; when the source overlaps the
+        destination, the repeating pattern is tiled instead.
+
+        :raises ValueError: If the copy runs past the end of buffer.
         """
-        for i in range(length):
-            buffer[index + i] = buffer[index + i - offset - 1]
+        start = index - offset - 1
+        end = index + length
+        if end > len(buffer):
+            raise ValueError("LZ back-reference runs past the end of the output")
+        if start < 0:
+            # Malformed reference: keep the byte-wise behaviour
+            for i in range(length):
+                buffer[index + i] = buffer[index + i - offset - 1]
+            return length
+        if length <= offset + 1:
+            buffer[index:end] = buffer[start:start + length]
+        else:
+            pattern = buffer[start:index]
+            buffer[index:end] = (pattern * (length // (offset + 1) + 1))[:length]
         return length
 
     def decode(self, in_stream: BytesIO, out_size: int) -> bytes:
@@ -113,127 +114,260 @@ class LZDecoder:
         :param out_size: Expected output size.
         :return: Decompressed data.
         """
+        return self.decode_buffer(in_stream.getvalue(), in_stream.tell(), out_size)
+
+    @staticmethod
+    def decode_buffer(src: bytes, pos: int, out_size: int) -> bytes:
+        """
+        Decompress LZ77 data from a buffer.
+
+        The input is walked with an integer index, with flag bits handled
+        inline instead of through method calls.
+
+        :param src: Buffer holding the compressed stream.
+        :param pos: Offset of the stream in src.
+        :param out_size: Expected output size.
+        :return: Decompressed data, zero-filled if the input runs out.
+        :raises ValueError: If the data would be written past out_size.
+        """
+        copy_lz = LZDecoder._jpk_copy_lz
         out_buffer = bytearray(out_size)
         out_index = 0
+        flag = 0
+        mask = 0
 
-        while out_index < out_size:
-            try:
-                if not self._jpk_bit_lz(in_stream):
-                    out_buffer[out_index] = self._read_byte(in_stream)
+        try:
+            while out_index < out_size:
+                mask >>= 1
+                if not mask:
+                    flag = src[pos]
+                    pos += 1
+                    mask = 0x80
+                if not flag & mask:
+                    out_buffer[out_index] = src[pos]
+                    pos += 1
                     out_index += 1
                     continue
 
-                if not self._jpk_bit_lz(in_stream):
+                mask >>= 1
+                if not mask:
+                    flag = src[pos]
+                    pos += 1
+                    mask = 0x80
+                if not flag & mask:
                     # Case 0: short back-reference
-                    length = (2 if self._jpk_bit_lz(in_stream) else 0) + (1 if self._jpk_bit_lz(in_stream) else 0)
-                    offset = self._read_byte(in_stream)
-                    out_index += self._jpk_copy_lz(out_buffer, offset, length + 3, out_index)
+                    length = 3
+                    for weight in (2, 1):
+                        mask >>= 1
+                        if not mask:
+                            flag = src[pos]
+                            pos += 1
+                            mask = 0x80
+                        if flag & mask:
+                            length += weight
+                    offset = src[pos]
+                    pos += 1
+                    out_index += copy_lz(out_buffer, offset, length, out_index)
                     continue
 
-                hi = self._read_byte(in_stream)
-                lo = self._read_byte(in_stream)
-                length = (hi & 0xE0) >> 5
+                hi = src[pos]
+                pos += 1
+                lo = src[pos]
+                pos += 1
+                length = hi >> 5
                 offset = ((hi & 0x1F) << 8) | lo
 
-                if length != 0:
+                if length:
                     # Case 1: use length directly
-                    out_index += self._jpk_copy_lz(out_buffer, offset, length + 2, out_index)
+                    out_index += copy_lz(out_buffer, offset, length + 2, out_index)
                     continue
 
-                if not self._jpk_bit_lz(in_stream):
+                mask >>= 1
+                if not mask:
+                    flag = src[pos]
+                    pos += 1
+                    mask = 0x80
+                if not flag & mask:
                     # Case 2: compute bytes to copy length
-                    length = 0
-                    for i in range(3, -1, -1):
-                        if self._jpk_bit_lz(in_stream):
-                            length += 1 << i
-                    out_index += self._jpk_copy_lz(out_buffer, offset, length + 2 + 8, out_index)
+                    length = 10
+                    for weight in (8, 4, 2, 1):
+                        mask >>= 1
+                        if not mask:
+                            flag = src[pos]
+                            pos += 1
+                            mask = 0x80
+                        if flag & mask:
+                            length += weight
+                    out_index += copy_lz(out_buffer, offset, length, out_index)
                     continue
 
-                temp = self._read_byte(in_stream)
+                temp = src[pos]
+                pos += 1
                 if temp == 0xFF:
                     # Case 3: literal run
-                    for _ in range(offset + 0x1B):
-                        out_buffer[out_index] = self._read_byte(in_stream)
+                    length = offset + 0x1B
+                    if out_index + length > out_size:
+                        raise ValueError("LZ literal run runs past the end of the output")
+                    for _ in range(length):
+                        out_buffer[out_index] = src[pos]
+                        pos += 1
                         out_index += 1
                     continue
 
                 # Case 4: long back-reference
-                out_index += self._jpk_copy_lz(out_buffer, offset, temp + 0x1A, out_index)
-
-            except EOFError:
-                break
+                out_index += copy_lz(out_buffer, offset, temp + 0x1A, out_index)
+        except IndexError:
+            # Only running out of input ends the stream early
+            if pos < len(src):
+                raise
 
         return bytes(out_buffer)
 
 
-class HFIDecoder(LZDecoder):
+class HuffmanReader:
     """
-    Huffman + LZ77 decompression.
+    Huffman byte reader for the JKR Huffman stages.
 
-    Ported from ReFrontier JPKDecodeHFI.cs
-    Uses Huffman decoding for byte reading on top of LZ77.
+    The tree is stored as int16 pairs: node n >= 0x100 has its children at
+    table[n * 2 - 0x200] (bit 0) and table[n * 2 - 0x1FF] (bit 1), values
+    below 0x100 are leaves. Codes of up to LOOKUP_BITS bits are decoded with
+    one lookup in a flat table, longer codes continue walking the tree.
     """
 
-    def __init__(self):
-        super().__init__()
-        self._flag_hf = 0
-        self._flag_shift = 0
-        self._hf_table_offset = 0
-        self._hf_data_offset = 0
-        self._hf_table_len = 0
-        self._stream = None
-        self._use_huffman = False
-
-    def _read_byte(self, stream: BytesIO) -> int:
+    LOOKUP_BITS = 10
+
+    def __init__(self, src: bytes, table_offset: int, table_len: int):
+        """
+        Load the Huffman table from src.
+
+        :param src: Whole JKR file data.
+        :param table_offset: Offset of the first table entry in src.
+        :param table_len: Table length field, also the root node value.
+        """
+        self._src = src
+        self._root = table_len
+        self._data_offset = table_offset + table_len * 4 - 0x3FC
+        count = max(0, min(self._data_offset, len(src)) - table_offset) // 2
+        self._tree = struct.unpack_from(f"<{count}h", src, table_offset)
+        self._lookup = self._build_lookup()
+        self._bit_buf = 0
+        self._bit_count = 0
+
+    def _build_lookup(self) -> List[int]:
+        """
+        Build the flat lookup table.
+
+        Each entry packs (value << 4) | bits consumed, where value is a leaf
+        or, for codes longer than LOOKUP_BITS, the node to continue from.
+
+        :return: Lookup table indexed by the next LOOKUP_BITS bits.
         """
-        Read a byte - uses Huffman decoding after initialization.
+        lookup_bits = self.LOOKUP_BITS
+        tree = self._tree
+        lookup = [0] * (1 << lookup_bits)
+        stack = [(self._root, 0, 0)]
+        while stack:
+            node, code, depth = stack.pop()
+            if node < 0x100 or depth == lookup_bits:
+                span = 1 << (lookup_bits - depth)
+                start = code * span
+                lookup[start:start + span] = [(node << 4) | depth] * span
+                continue
+            base = node * 2 - 0x200
+            stack.append((tree[base], code << 1, depth + 1))
+            stack.append((tree[base + 1], (code << 1) | 1, depth + 1))
+        return lookup
+
+    def read_bytes(self, count: Optional[int] = None) -> bytes:
+        """
+        Decode a run of bytes.
 
-        Overrides LZDecoder._read_byte to use Huffman table lookup.
+        :param count: Number of bytes to decode, or None to decode until the
+            Huffman data runs out.
+        :return: Decoded bytes.
+        :raises EOFError: When fewer than count bytes could be decoded.
         """
-        if not self._use_huffman:
-            return super()._read_byte(stream)
-
-        # JpkGetHf implementation
-        data = self._hf_table_len
-
-        while data >= 0x100:
-            self._flag_shift -= 1
-            if self._flag_shift < 0:
-                self._flag_shift = 7
-                stream.seek(self._hf_data_offset)
-                self._hf_data_offset += 1
-                byte_read = stream.read(1)
-                if not byte_read:
+        src = self._src
+        end = len(src)
+        pos = self._data_offset
+        tree = self._tree
+        lookup = self._lookup
+        lookup_bits = self.LOOKUP_BITS
+        lookup_mask = (1 << lookup_bits) - 1
+        bit_buf = self._bit_buf
+        bit_count = self._bit_count
+        until_end = count is None
+        if until_end:
+            # Every code but a lone root leaf uses at least one bit
+            count = bit_count + (end - pos) * 8
+        out = bytearray()
+        append = out.append
+
+        try:
+            for _ in range(count):
+                if bit_count < lookup_bits and pos < end:
+                    # Append up to 48 bits, keeping only the unread ones
+                    chunk = src[pos:pos + 6]
+                    pos += len(chunk)
+                    bit_buf &= (1 << bit_count) - 1
+                    bit_buf = (bit_buf << (len(chunk) * 8)) | int.from_bytes(chunk, "big")
+                    bit_count += len(chunk) * 8
+
+                # Peek LOOKUP_BITS bits, padding with zeros past the end of the data
+                if bit_count >= lookup_bits:
+                    entry = lookup[(bit_buf >> (bit_count - lookup_bits)) & lookup_mask]
+                else:
+                    entry = lookup[(bit_buf << (lookup_bits - bit_count)) & lookup_mask]
+                length = entry & 0xF
+                if length > bit_count:
                     raise EOFError("Reached end of file too early in Huffman decode!")
-                self._flag_hf = byte_read[0]
+                bit_count -= length
+
+                data = entry >> 4
+                while data >= 0x100:
+                    # Code longer than LOOKUP_BITS: walk the rest of the tree
+                    if not bit_count:
+                        if pos >= end:
+                            raise EOFError("Reached end of file too early in Huffman decode!")
+                        bit_buf = src[pos]
+                        pos += 1
+                        bit_count = 8
+                    bit_count -= 1
+                    data = tree[data * 2 - 0x200 + ((bit_buf >> bit_count) & 0x1)]
+                append(data & 0xFF)
+        except EOFError:
+            if not until_end:
+                raise
+        finally:
+            self._data_offset = pos
+            self._bit_buf = bit_buf
+            self._bit_count = bit_count
 
-            bit = (self._flag_hf >> self._flag_shift) & 0x1
-            stream.seek((data * 2 - 0x200 + bit) * 2 + self._hf_table_offset)
-            data = struct.unpack("<h", stream.read(2))[0]
+        return bytes(out)
 
-        return data & 0xFF
 
-    def decode(self, in_stream: BytesIO, out_size: int) -> bytes:
+class HFIDecoder(LZDecoder):
+    """
+    Huffman + LZ77 decompression.
+
+    Ported from ReFrontier JPKDecodeHFI.cs
+    The Huffman layer is decoded in one pass, then the LZ77 stream it
+    produced is decoded by the LZDecoder loop.
+    """
+
+    @staticmethod
+    def decode_buffer(src: bytes, pos: int, out_size: int) -> bytes:
         """
-        Decompress Huffman + LZ77 data.
+        Decompress Huffman + LZ77 data from a buffer.
 
-        :param in_stream: Input stream positioned at compressed data.
+        :param src: Buffer holding the compressed stream.
+        :param pos: Offset of the Huffman table length in src.
         :param out_size: Expected output size.
         :return: Decompressed data.
         """
-        # Read Huffman table length
-        self._hf_table_len = struct.unpack("<h", in_stream.read(2))[0]
-        self._hf_table_offset = in_stream.tell()
-        self._hf_data_offset = self._hf_table_offset + self._hf_table_len * 4 - 0x3FC
-        self._stream = in_stream
-
-        # Enable Huffman byte reading
-        self._use_huffman = True
-
-        try:
-            return super().decode(in_stream, out_size)
-        finally:
-            self._use_huffman = False
+        table_len = _TABLE_LEN.unpack_from(src, pos)[0]
+        huffman = HuffmanReader(src, pos + _TABLE_LEN.size, table_len)
+        return LZDecoder.decode_buffer(huffman.read_bytes(), 0, out_size)
 
 
 class RWDecoder:
@@ -243,6 +377,11 @@ class RWDecoder:
         """Read raw bytes."""
         return in_stream.read(out_size)
 
+    @staticmethod
+    def decode_buffer(src: bytes, pos: int, out_size: int) -> memoryview:
+        """Return a view of the raw bytes in the buffer, without copying."""
+        return memoryview(src)[pos:pos + out_size]
+
 
 class HFIRWDecoder:
     """
@@ -251,75 +390,53 @@ class HFIRWDecoder:
     Ported from ReFrontier JPKDecodeHFIRW.cs
     """
 
-    def __init__(self):
-        self._flag_hf = 0
-        self._flag_shift = 0
-        self._hf_table_offset = 0
-        self._hf_data_offset = 0
-        self._hf_table_len = 0
-
-    def _read_byte_hf(self, stream: BytesIO) -> int:
-        """Read a byte using Huffman decoding."""
-        data = self._hf_table_len
-
-        while data >= 0x100:
-            self._flag_shift -= 1
-            if self._flag_shift < 0:
-                self._flag_shift = 7
-                stream.seek(self._hf_data_offset)
-                self._hf_data_offset += 1
-                self._flag_hf = stream.read(1)[0]
-
-            bit = (self._flag_hf >> self._flag_shift) & 0x1
-            stream.seek((data * 2 - 0x200 + bit) * 2 + self._hf_table_offset)
-            data = struct.unpack("<h", stream.read(2))[0]
-
-        return data & 0xFF
-
     def decode(self, in_stream: BytesIO, out_size: int) -> bytes:
         """Decompress using Huffman only."""
-        # Read Huffman table length
-        self._hf_table_len = struct.unpack("<h", in_stream.read(2))[0]
-        self._hf_table_offset = in_stream.tell()
-        self._hf_data_offset = self._hf_table_offset + self._hf_table_len * 4 - 0x3FC
+        return self.decode_buffer(in_stream.getvalue(), in_stream.tell(), out_size)
 
-        out_buffer = bytearray(out_size)
-        for i in range(out_size):
-            out_buffer[i] = self._read_byte_hf(in_stream)
+    @staticmethod
+    def decode_buffer(src: bytes, pos: int, out_size: int) -> bytes:
+        """
+        Decompress Huffman-only data from a buffer.
 
-        return bytes(out_buffer)
+        :param src: Buffer holding the compressed stream.
+        :param pos: Offset of the Huffman table length in src.
+        :param out_size: Expected output size.
+        :return: Decompressed data.
+        """
+        table_len = _TABLE_LEN.unpack_from(src, pos)[0]
+        huffman = HuffmanReader(src, pos + _TABLE_LEN.size, table_len)
+        return huffman.read_bytes(out_size)
+
+
+# Buffer decoder by compression type; decoders keep no state between calls
+_DECODERS: Dict[int, Callable[[bytes, int, int], Union[bytes, memoryview]]] = {
+    CompressionType.RW: RWDecoder.decode_buffer,
+    CompressionType.NONE: RWDecoder.decode_buffer,  # Same as RW
+    CompressionType.HFIRW: HFIRWDecoder.decode_buffer,
+    CompressionType.LZ: LZDecoder.decode_buffer,
+    CompressionType.HFI: HFIDecoder.decode_buffer,
+}
 
 
-def decompress_jkr(data: bytes) -> Optional[bytes]:
+def decompress_jkr(data: bytes) -> Optional[Union[bytes, memoryview]]:
     """
     Decompress JKR/JPK compressed data.
 
+    Uncompressed (RW) data is returned as a memoryview into data rather
+    than copied.
+
     :param data: Raw JKR file data.
     :return: Decompressed data, or None if not a valid JKR file.
+    :raises ValueError: If the compression type is unknown.
     """
     header = JKRHeader.from_bytes(data)
     if header is None:
         return None
 
-    stream = BytesIO(data)
-    stream.seek(header.data_offset)
-
-    compression_type = CompressionType(header.compression_type)
-
-    if compression_type == CompressionType.RW:
-        decoder = RWDecoder()
-    elif compression_type == CompressionType.NONE:
-        decoder = RWDecoder()  # Same as RW
-    elif compression_type == CompressionType.HFIRW:
-        decoder = HFIRWDecoder()
-    elif compression_type == CompressionType.LZ:
-        decoder = LZDecoder()
-    elif compression_type == CompressionType.HFI:
-        decoder = HFIDecoder()
-    else:
-        raise NotImplementedError(f"JPK compression type {header.compression_type} not supported")
-
-    return decoder.decode(stream, header.decompressed_size)
+    # Unknown types raise ValueError from the enum lookup
+    decode = _DECODERS[CompressionType(header.compression_type)]
+    return decode(data, header.data_offset, header.decompressed_size)
 
 
 def is_jkr_file(data: bytes) -> bool:
@@ -331,5 +448,4 @@ def is_jkr_file(data: bytes) -> bool:
     """
     if len(data) < 4:
         return False
-    magic = struct.unpack("<I", data[:4])[0]
-    return magic == JKR_MAGIC
+    return _MAGIC.unpack_from(data)[0] == JKR_MAGIC
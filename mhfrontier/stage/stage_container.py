@@ -13,11 +13,16 @@ Ported from ReFrontier Unpack.cs by Houmgaor.
 import struct
 from dataclasses import dataclass
 from enum import IntEnum
-from io import BytesIO
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from .jkr_decompress import is_jkr_file
 
+_MAGIC = struct.Struct("<I")
+_SHORT_ENTRY = struct.Struct("<II")
+_LONG_ENTRY = struct.Struct("<III")
+# Second header int and the 8 bytes after it, checked by is_stage_container
+_HEADER_CHECK = struct.Struct("<4xIQ")
+
 
 class FileMagic(IntEnum):
     """
@@ -57,11 +62,13 @@ MAGIC_TO_SEGMENT: Dict[int, SegmentType] = {
 @dataclass
 class StageSegment:
     """A segment within a stage container."""
+    __slots__ = ("index", "offset", "size", "unknown", "data", "segment_type")
+
     index: int
     offset: int
     size: int
     unknown: int  # Only used for segments 4+
-    data: bytes
+    data: Union[bytes, memoryview]  # View into the container data when parsed
     segment_type: SegmentType
 
     @property
@@ -78,7 +85,7 @@ class StageSegment:
         return extensions.get(self.segment_type, "bin")
 
 
-def detect_segment_type(data: bytes) -> SegmentType:
+def detect_segment_type(data: Union[bytes, memoryview]) -> SegmentType:
     """
     Detect segment type from magic bytes.
 
@@ -88,68 +95,44 @@ def detect_segment_type(data: bytes) -> SegmentType:
     if len(data) < 4:
         return SegmentType.UNKNOWN
 
-    magic = struct.unpack("<I", data[:4])[0]
-    return MAGIC_TO_SEGMENT.get(magic, SegmentType.UNKNOWN)
+    return MAGIC_TO_SEGMENT.get(_MAGIC.unpack_from(data)[0], SegmentType.UNKNOWN)
 
 
 def parse_stage_container(data: bytes) -> List[StageSegment]:
     """
     Parse a stage container file.
 
+    Segment data are memoryview slices of data, so payloads are not copied.
+
     :param data: Raw stage container data.
     :return: List of parsed segments.
     """
     segments = []
-    stream = BytesIO(data)
-
-    # Parse first 3 segments (8 bytes each: offset + size)
-    for i in range(3):
-        stream.seek(i * 8)
-        offset, size = struct.unpack("<II", stream.read(8))
-
-        if size == 0:
-            continue
-
-        # Read segment data
-        stream.seek(offset)
-        segment_data = stream.read(size)
-
-        segment_type = detect_segment_type(segment_data)
+    view = memoryview(data)
 
-        segments.append(StageSegment(
-            index=i,
-            offset=offset,
-            size=size,
-            unknown=0,
-            data=segment_data,
-            segment_type=segment_type,
-        ))
+    # First 3 segments (8 bytes each: offset + size), then the remaining
+    # segments header (count + unknown)
+    entries = [(offset, size, 0) for offset, size in _SHORT_ENTRY.iter_unpack(data[:24])]
+    rest_count, unk_header = _SHORT_ENTRY.unpack_from(data, 24)
 
-    # Parse remaining segments header
-    stream.seek(3 * 8)  # After first 3 segment entries
-    rest_count, unk_header = struct.unpack("<II", stream.read(8))
-
-    # Parse remaining segments (12 bytes each: offset + size + unknown)
-    for i in range(rest_count):
-        stream.seek(3 * 8 + 8 + i * 12)  # 3*8 = first entries, 8 = header
-        offset, size, unknown = struct.unpack("<III", stream.read(12))
+    # Remaining segments (12 bytes each: offset + size + unknown)
+    table_end = 32 + rest_count * _LONG_ENTRY.size
+    if len(data) < table_end:
+        raise struct.error("Stage container segment table is truncated")
+    entries.extend(_LONG_ENTRY.iter_unpack(data[32:table_end]))
 
+    for index, (offset, size, unknown) in enumerate(entries):
         if size == 0:
             continue
 
-        # Read segment data
-        stream.seek(offset)
-        segment_data = stream.read(size)
-
-        segment_type = detect_segment_type(segment_data)
-
+        segment_data = view[offset:offset + size]
         segments.append(StageSegment(
-            index=3 + i,
+            index=index,
             offset=offset,
             size=size,
             unknown=unknown,
             data=segment_data,
-            segment_type=segment_type,
+            segment_type=detect_segment_type(segment_data),
         ))
 
     return segments
@@ -169,17 +152,11 @@ def is_stage_container(data: bytes) -> bool:
     if len(data) < 24:
         return False
 
-    try:
-        # Read potential header values
-        stream = BytesIO(data)
-        stream.seek(4)  # Skip first offset
-        check_unk = struct.unpack("<I", stream.read(4))[0]
-        check_zero = struct.unpack("<Q", stream.read(8))[0]
+    # Skip the first offset, then read the potential header values
+    check_unk, check_zero = _HEADER_CHECK.unpack_from(data)
 
-        # Heuristic check from ReFrontier
-        return check_unk < 9999 and check_zero == 0
-    except Exception:
-        return False
+    # Heuristic check from ReFrontier
+    return check_unk < 9999 and check_zero == 0
 
 
 def get_fmod_segments(segments: List[StageSegment]) -> List[StageSegment]:
@@ -20,6 +20,13 @@ from typing import List, Optional
 
 from .stage_container import SegmentType, StageSegment
 
+# Segment table entries: (offset, size) and (offset, size, unknown)
+_SHORT_ENTRY = struct.Struct("<II")
+_LONG_ENTRY = struct.Struct("<III")
+
+# Zero padding aligning segment data to 4 bytes, by padding length
+_PADDING = (b"", b"\x00", b"\x00" * 2, b"\x00" * 3)
+
 
 @dataclass
 class StageSegmentBuilder:
@@ -44,15 +51,28 @@ def build_stage_container(segments: List[StageSegmentBuilder]) -> bytes:
     :param segments: List of segment builders with data.
     :return: Complete stage container bytes.
     """
+    return b"".join(build_stage_container_parts(segments))
+
+
+def build_stage_container_parts(segments: List[StageSegmentBuilder]) -> List[bytes]:
+    """
+    Build a stage container (.pac) file as a list of byte chunks.
+
+    Concatenating the chunks gives the container. Callers writing to a file
+    can pass them to writelines() so segment data is never copied into one
+    buffer.
+
+    :param segments: List of segment builders with data.
+    :return: Container header, segment data and padding chunks, in file order.
+    """
     if not segments:
         # Empty container - return minimal valid structure
-        return b"\x00" * 32
+        return [b"\x00" * 32]
 
     # Calculate header size
     # First 3 segments: 8 bytes each = 24 bytes
     # Header for rest: 8 bytes (count + unknown)
     # Remaining segments: 12 bytes each
-    first_segment_count = min(len(segments), 3)
     rest_segment_count = max(0, len(segments) - 3)
 
     header_size = 24 + 8 + (rest_segment_count * 12)
@@ -60,67 +80,33 @@ def build_stage_container(segments: List[StageSegmentBuilder]) -> bytes:
     # Align data start to 16-byte boundary (common in game files)
     data_start = (header_size + 15) & ~15
 
-    # Calculate segment offsets
-    segment_entries = []
+    # Build header and data chunks in one pass over the segments
+    header = bytearray(data_start)
+    data_parts = []
     current_offset = data_start
 
     for i, seg in enumerate(segments):
         size = len(seg.data)
-        unknown = seg.unknown if i >= 3 else 0
-
-        segment_entries.append({
-            "offset": current_offset,
-            "size": size,
-            "unknown": unknown,
-        })
-
-        # Align each segment to 4-byte boundary
-        current_offset += (size + 3) & ~3
-
-    # Build header
-    header_parts = []
-
-    # First 3 segment entries (8 bytes each)
-    for i in range(3):
-        if i < len(segment_entries):
-            entry = segment_entries[i]
-            header_parts.append(struct.pack("<II", entry["offset"], entry["size"]))
+        if i < 3:
+            # First 3 segment entries (8 bytes each)
+            _SHORT_ENTRY.pack_into(header, i * 8, current_offset, size)
         else:
-            # Empty entry
-            header_parts.append(struct.pack("<II", 0, 0))
-
-    # Rest segments header (count + unknown)
-    header_parts.append(struct.pack("<II", rest_segment_count, 0))
-
-    # Remaining segment entries (12 bytes each)
-    for i in range(3, len(segment_entries)):
-        entry = segment_entries[i]
-        header_parts.append(struct.pack(
-            "<III",
-            entry["offset"],
-            entry["size"],
-            entry["unknown"],
-        ))
+            # Remaining segment entries (12 bytes each)
+            _LONG_ENTRY.pack_into(
+                header, 32 + (i - 3) * 12, current_offset, size, seg.unknown
+            )
 
-    header = b"".join(header_parts)
-
-    # Pad header to data start
-    padding_size = data_start - len(header)
-    if padding_size > 0:
-        header += b"\x00" * padding_size
-
-    # Build data section
-    data_parts = []
-    for i, seg in enumerate(segments):
         data_parts.append(seg.data)
-        # Add padding to align next segment
-        remainder = len(seg.data) % 4
-        if remainder != 0:
-            data_parts.append(b"\x00" * (4 - remainder))
+        # Align each segment to 4-byte boundary
+        padding = -size & 3
+        if padding:
+            data_parts.append(_PADDING[padding])
+        current_offset += size + padding
 
-    data = b"".join(data_parts)
+    # Rest segments header (count + unknown); missing first entries stay zero
+    _SHORT_ENTRY.pack_into(header, 24, rest_segment_count, 0)
 
-    return header + data
+    return [bytes(header)] + data_parts
 
 
 def segments_to_builders(segments: List[StageSegment]) -> List[StageSegmentBuilder]:
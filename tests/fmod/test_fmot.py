@@ -4,6 +4,7 @@
 import struct
 import unittest
 from dataclasses import dataclass
+from unittest.mock import patch
 
 from mhfrontier.blender.mock_impl import (
     MockAnimationBuilder,
@@ -23,6 +24,17 @@ from mhfrontier.fmod.fmot import (
 from mhfrontier.importers import motion as motion_importer
 
 
+def _build_animation(keyframes):
+    """Build an animation block with one bone and a POSITION_X channel."""
+    body = struct.pack("<II", 0x80000038, 0) + struct.pack(
+        "<IHH", fmot.BLOCK_KEYFRAME_TYPE | ChannelType.POSITION_X, len(keyframes), 0
+    )
+    for frame, value in keyframes:
+        body += struct.pack("<hhhH", 0, 0, value, frame)
+    header = struct.pack("<IIII", fmot.BLOCK_ANIMATION_HEADER, 1, 16 + len(body), 0)
+    return header + body
+
+
 class TestKeyframeDataClass(unittest.TestCase):
     """Test Keyframe data class."""
 
@@ -138,6 +150,57 @@ class TestLoadMotionFromBytes(unittest.TestCase):
 
         self.assertEqual(len(motion.bone_animations), 0)
 
+    def test_memoryview_slice(self):
+        """Test parsing an animation from a memoryview slice of a larger buffer."""
+        anim = _build_animation([(0, 10), (30, 20)])
+        container = b"\xff" * 8 + anim + b"\xff" * 8
+
+        view = memoryview(container)[8 : 8 + len(anim)]
+        motion = fmot.load_motion_from_bytes(view)
+
+        self.assertEqual(motion, fmot.load_motion_from_bytes(anim))
+        self.assertEqual(motion.frame_count, 31)
+        channel = motion.bone_animations[0].channels[ChannelType.POSITION_X]
+        self.assertEqual([kf.value for kf in channel.keyframes], [10.0, 20.0])
+
+
+class TestFindBinAnimationBlocks(unittest.TestCase):
+    """Test scanning .bin containers for animation blocks."""
+
+    def _header(self, size):
+        return struct.pack("<IIII", fmot.BLOCK_ANIMATION_HEADER, 1, size, 0)
+
+    def test_empty_data(self):
+        """Test empty data has no blocks."""
+        self.assertEqual(fmot.find_bin_animation_blocks(b""), [])
+
+    def test_finds_aligned_headers(self):
+        """Test headers are found at 4-byte aligned offsets with their sizes."""
+        data = b"\x00" * 8 + self._header(32) + b"\x00" * 16 + self._header(24)
+        data += b"\x00" * 16
+
+        blocks = fmot.find_bin_animation_blocks(data)
+
+        self.assertEqual(blocks, [(8, 32), (40, 24)])
+
+    def test_ignores_unaligned_headers(self):
+        """Test headers at unaligned offsets are skipped."""
+        data = b"\x00\x00" + self._header(32) + b"\x00" * 30
+
+        self.assertEqual(fmot.find_bin_animation_blocks(data), [])
+
+    def test_rejects_oversized_blocks(self):
+        """Test blocks whose declared size runs past the data are skipped."""
+        data = self._header(16) + self._header(1000) + b"\x00" * 16
+
+        self.assertEqual(fmot.find_bin_animation_blocks(data), [(0, 16)])
+
+    def test_ignores_truncated_trailing_header(self):
+        """Test a header without a full 16 bytes after it is skipped."""
+        data = b"\x00" * 4 + self._header(32)
+
+        self.assertEqual(fmot.find_bin_animation_blocks(data), [])
+
 
 class TestChannelToPropertyInfo(unittest.TestCase):
     """Test channel type to Blender property mapping."""
@@ -275,6 +338,24 @@ class TestMockAnimationBuilder(unittest.TestCase):
         self.assertEqual(kf.handle_left, (9.0, 5.0))
         self.assertEqual(kf.handle_right, (11.0, 6.0))
 
+    def test_add_keyframes_batch(self):
+        """Test adding keyframes in one batch with optional handles."""
+        builder = MockAnimationBuilder()
+        action = builder.create_action("TestAction")
+        fcurve = builder.create_fcurve(action, "location", 0)
+
+        builder.add_keyframes(
+            fcurve,
+            [(0.0, 1.0), (10.0, 2.0)],
+            handles=[None, ((9.0, 1.5), (11.0, 2.5))],
+        )
+
+        points = fcurve.keyframe_points
+        self.assertEqual([(kf.frame, kf.value) for kf in points], [(0.0, 1.0), (10.0, 2.0)])
+        self.assertIsNone(points[0].handle_left)
+        self.assertEqual(points[1].handle_left, (9.0, 1.5))
+        self.assertEqual(points[1].handle_right, (11.0, 2.5))
+
     def test_set_frame_range(self):
         """Test setting action frame range."""
         builder = MockAnimationBuilder()
@@ -346,6 +427,49 @@ class TestImportMotionWithMock(unittest.TestCase):
         self.assertEqual(len(action.fcurves[0].keyframe_points), 2)
 
 
+class TestImportAllMotions(unittest.TestCase):
+    """Test importing every animation of a .bin container."""
+
+    def test_actions_created_in_block_order(self):
+        """Test one action per block, named by index and created in order."""
+        builders = get_mock_builders()
+        armature = MockObject(name="Armature")
+        data = _build_animation([(0, 1), (10, 2)]) + _build_animation([(0, 3), (20, 4)])
+        blocks = fmot.find_bin_animation_blocks(data + b"\x00" * 16)
+
+        actions = motion_importer.import_all_motions_from_bytes(
+            data, blocks, armature, "walk", builders
+        )
+
+        self.assertEqual([a.name for a in actions], ["walk_anim_0", "walk_anim_1"])
+        self.assertEqual([a.frame_end for a in actions], [10, 20])
+        self.assertIs(builders.animation.assigned_actions["Armature"], actions[0])
+
+    def test_malformed_block_skipped(self):
+        """Test a block that fails to parse does not stop the others."""
+        builders = get_mock_builders()
+        armature = MockObject(name="Armature")
+        data = _build_animation([(0, 1), (10, 2)]) + _build_animation([(0, 3), (20, 4)])
+        blocks = fmot.find_bin_animation_blocks(data + b"\x00" * 16)
+        load = fmot.load_motion_from_bytes
+        calls = []
+
+        def load_motion(view):
+            # The first block is malformed
+            calls.append(view)
+            if len(calls) == 1:
+                raise struct.error("unpack requires a buffer of 4 bytes")
+            return load(view)
+
+        with patch.object(fmot, "load_motion_from_bytes", side_effect=load_motion):
+            actions = motion_importer.import_all_motions_from_bytes(
+                data, blocks, armature, "walk", builders
+            )
+
+        self.assertEqual([a.name for a in actions], ["walk_anim_1"])
+        self.assertIs(builders.animation.assigned_actions["Armature"], actions[0])
+
+
 class TestBezierHandleCalculation(unittest.TestCase):
     """Test Bezier handle calculation."""
 
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for fskl skeleton export and block building."""
+
+import struct
+import unittest
+
+from mhfrontier.export.blender_extractor import ExtractedBone, SkeletonExtractor
+from mhfrontier.export.block_builder import BlockBuilder, HEADER_SIZE
+from mhfrontier.export.fskl_export import build_fskl_file, serialize_bone_block
+from mhfrontier.fmod.fblock import BlockType
+
+
+class TestBlockBuilder(unittest.TestCase):
+    """Test block serialization."""
+
+    def test_nested_sizes(self):
+        """Test header sizes include all nested content."""
+        inner = BlockBuilder(0x10).set_raw_data(b"\x01\x02\x03\x04")
+        middle = BlockBuilder(0x20).add_child(inner)
+        outer = BlockBuilder(0x30).add_child(middle).add_raw_data(b"\xff\xff")
+
+        data = outer.serialize()
+
+        self.assertEqual(len(data), outer.total_size())
+        self.assertEqual(struct.unpack_from("<III", data, 0), (0x30, 1, 3 * HEADER_SIZE + 6))
+        self.assertEqual(struct.unpack_from("<III", data, 12), (0x20, 1, 2 * HEADER_SIZE + 4))
+        self.assertEqual(struct.unpack_from("<III", data, 24), (0x10, 0, HEADER_SIZE + 4))
+        self.assertEqual(data[36:], b"\x01\x02\x03\x04\xff\xff")
+
+    def test_serialize_header_matches(self):
+        """Test the standalone header matches the serialized one."""
+        block = BlockBuilder(0x40, count=7).set_raw_data(b"abcd")
+
+        self.assertEqual(block.serialize()[:HEADER_SIZE], block.serialize_header())
+
+
+class TestSerializeBoneBlock(unittest.TestCase):
+    """Test bone block serialization."""
+
+    def test_field_layout(self):
+        """Test fields are written in FSKL order with a zeroed tail."""
+        bone = ExtractedBone(
+            node_id=3,
+            parent_id=1,
+            left_child=-1,
+            right_sibling=4,
+            scale=(1.0, 2.0, 3.0, 4.0),
+            rotation=(0.0, 0.5, 0.0, 1.0),
+            position=(10.0, 20.0, 30.0, 1.0),
+            chain_id=2,
+        )
+
+        data = serialize_bone_block(bone)
+
+        self.assertEqual(struct.unpack_from("<iiii", data, 0), (3, 1, -1, 4))
+        self.assertEqual(struct.unpack_from("<4f", data, 16), (1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(struct.unpack_from("<4f", data, 32), (0.0, 0.5, 0.0, 1.0))
+        self.assertEqual(struct.unpack_from("<4f", data, 48), (10.0, 20.0, 30.0, 1.0))
+        self.assertEqual(struct.unpack_from("<II", data, 64), (0xFFFFFFFF, 2))
+        self.assertEqual(data[72:], bytes(184))
+
+
+class TestBuildFsklFile(unittest.TestCase):
+    """Test complete FSKL file building."""
+
+    def test_bones_sorted_by_node_id(self):
+        """Test bone blocks are written in node id order after the metadata."""
+        bones = [ExtractedBone(node_id=1, parent_id=0), ExtractedBone(node_id=0, parent_id=-1)]
+
+        data = build_fskl_file(bones)
+
+        block_type, count, size = struct.unpack_from("<III", data, 0)
+        self.assertEqual((block_type, count, size), (BlockType.SKELETON, 3, len(data)))
+        first_bone = HEADER_SIZE + HEADER_SIZE + 8
+        self.assertEqual(struct.unpack_from("<I", data, first_bone)[0], BlockType.BONE)
+        self.assertEqual(struct.unpack_from("<i", data, first_bone + HEADER_SIZE)[0], 0)
+
+
+class _Empty:
+    """Empty object stand-in with custom properties and children."""
+
+    def __init__(self, name, parent=None, props=None, position=(0.0, 0.0, 0.0)):
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self._props = props or {}
+        x, y, z = position
+        self.matrix_local = [[1, 0, 0, x], [0, 1, 0, y], [0, 0, 1, z], [0, 0, 0, 1]]
+        if parent is not None:
+            parent.children.append(self)
+
+    def __contains__(self, key):
+        return key in self._props
+
+    def __getitem__(self, key):
+        return self._props[key]
+
+
+class TestSkeletonExtractor(unittest.TestCase):
+    """Test skeleton extraction from empty hierarchies."""
+
+    def setUp(self):
+        """Build Root -> Bone.000 -> (Bone.001 -> Bone.003, Bone.002)."""
+        self.root = _Empty("Root")
+        bone0 = _Empty("Bone.000", self.root)
+        bone1 = _Empty("Bone.001", bone0, position=(1.0, 2.0, 3.0))
+        _Empty("Bone.002", bone0)
+        _Empty("Bone.003", bone1)
+
+    def test_flatten_hierarchy(self):
+        """Test parents come before children with matching parent indices."""
+        objects, parents = SkeletonExtractor.flatten_hierarchy(self.root)
+
+        self.assertEqual(
+            [obj.name for obj in objects],
+            ["Root", "Bone.000", "Bone.001", "Bone.003", "Bone.002"],
+        )
+        self.assertEqual(parents, [-1, 0, 1, 2, 1])
+
+    def test_extract_tree_links(self):
+        """Test parent, first child and sibling links of extracted bones."""
+        bones = SkeletonExtractor().extract_from_empties(self.root)
+        links = {b.node_id: (b.parent_id, b.left_child, b.right_sibling) for b in bones}
+
+        self.assertEqual(
+            links,
+            {0: (-1, 1, -1), 1: (0, 3, 2), 2: (0, -1, -1), 3: (1, -1, -1)},
+        )
+
+    def test_children_of_bones_are_bones(self):
+        """Test unnamed children of a bone get sequential ids."""
+        _Empty("helper", self.root.children[0].children[1])
+
+        bones = SkeletonExtractor().extract_from_empties(self.root)
+
+        self.assertEqual(bones[-1].node_id, 4)
+        self.assertEqual(bones[-1].parent_id, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
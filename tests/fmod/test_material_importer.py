@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for material_importer using mock builders."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mhfrontier.blender.builders import get_mock_builders
+from mhfrontier.importers import material as material_importer
+
+
+class TestImportTextures(unittest.TestCase):
+    """Test the import_textures function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.builders = get_mock_builders()
+        self.texture_files = ["/tex/a.png", "/tex/b.png"]
+        self.materials = [
+            SimpleNamespace(diffuse_id=0, normal_id=None, specular_id=None),
+            SimpleNamespace(diffuse_id=0, normal_id=1, specular_id=None),
+        ]
+        self.blender_materials = {
+            0: self.builders.material.create_material("Mat0"),
+            1: self.builders.material.create_material("Mat1"),
+        }
+
+    def test_texture_search_runs_once(self):
+        """Test the texture directory scan is shared by all materials."""
+        with patch.object(
+            material_importer, "find_all_textures", return_value=self.texture_files
+        ) as find_mock:
+            material_importer.import_textures(
+                self.materials, "/tex/model.fmod", self.blender_materials, self.builders
+            )
+
+        find_mock.assert_called_once_with("/tex/model.fmod")
+
+    def test_shared_texture_loaded_once(self):
+        """Test a texture used by several materials is only loaded once."""
+        with patch.object(
+            material_importer, "find_all_textures", return_value=self.texture_files
+        ):
+            material_importer.import_textures(
+                self.materials, "/tex/model.fmod", self.blender_materials, self.builders
+            )
+
+        loaded = [image.filepath for image in self.builders.image.loaded_images]
+        self.assertEqual(loaded, ["/tex/a.png", "/tex/b.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
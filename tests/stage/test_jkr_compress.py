@@ -1,19 +1,26 @@
 """Unit tests for jkr_compress module."""
 
+import random
 import struct
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 from mhfrontier.stage.jkr_compress import (
     BitWriter,
     JKRHeaderBuilder,
     LZEncoder,
+    LZInterleavedWriter,
     HuffmanEncoder,
     HFIEncoder,
     HFIRWEncoder,
     compress_jkr,
     compress_jkr_hfi,
     compress_jkr_raw,
+    _byte_frequencies,
+    _canonical_codes,
+    _limited_code_lengths,
+    _match_length,
 )
 from mhfrontier.stage.jkr_decompress import (
     JKR_MAGIC,
@@ -104,6 +111,66 @@ class TestBitWriter(unittest.TestCase):
         # 111 + 5 zeros = 11100000 = 0xE0
         self.assertEqual(result, bytes([0xE0]))
 
+    def test_write_bits_across_bytes(self):
+        """Test values spanning byte boundaries keep MSB-first order."""
+        writer = BitWriter()
+        writer.write_bit(True)
+        writer.write_bits(0xABC, 12)
+        self.assertEqual(writer.get_bytes(), bytes([0xD5, 0xE0]))
+        writer.write_bits(0b101, 3)
+        # 1 101010111100 101 = 0xD5 0xE5
+        self.assertEqual(writer.flush(), bytes([0xD5, 0xE5]))
+
+    def test_write_codes_matches_write_bits(self):
+        """Test bulk code writing matches writing each code separately."""
+        codes = [(0b0, 1), (0b10, 2), (0b110, 3), (0x1FFF, 13)]
+        symbols = [0, 3, 1, 2, 3, 3, 0, 1] * 5
+        expected = BitWriter()
+        expected.write_bit(True)
+        for symbol in symbols:
+            expected.write_bits(*codes[symbol])
+        writer = BitWriter()
+        writer.write_bit(True)
+        writer.write_codes(symbols, codes)
+        self.assertEqual(writer.get_bytes(), expected.get_bytes())
+        writer.write_bits(0b11, 2)
+        expected.write_bits(0b11, 2)
+        self.assertEqual(writer.flush(), expected.flush())
+
+    def test_flush_returns_given_buffer(self):
+        """Test flushing appends to the caller's buffer without copying."""
+        buffer = bytearray(b"\x01")
+        writer = BitWriter(buffer)
+        writer.write_bits(0b101, 3)
+        self.assertIs(writer.flush(), buffer)
+        self.assertEqual(buffer, bytearray([0x01, 0xA0]))
+
+
+class TestLZInterleavedWriter(unittest.TestCase):
+    """Test LZInterleavedWriter flag and data interleaving."""
+
+    def test_data_follows_active_flag(self):
+        """Test data bytes go after the flag active when they are written."""
+        writer = LZInterleavedWriter()
+        for _ in range(8):
+            writer.write_bit(True)
+        writer.write_data_byte(0xAA)
+        writer.write_bit(False)
+        writer.write_data_byte(0xBB)
+        self.assertEqual(writer.finish(), bytes([0xFF, 0xAA, 0x00, 0xBB]))
+
+    def test_write_bits_matches_write_bit(self):
+        """Test multi-bit writes split across flags like single bits."""
+        expected = LZInterleavedWriter()
+        writer = LZInterleavedWriter()
+        for value, count in ((0b1, 1), (0b1011, 4), (0b10110, 5), (0b11, 2), (0b0, 3)):
+            for shift in range(count - 1, -1, -1):
+                expected.write_bit(bool((value >> shift) & 1))
+            writer.write_bits(value, count)
+            expected.write_data_byte(count)
+            writer.write_data_byte(count)
+        self.assertEqual(writer.finish(), expected.finish())
+
 
 class TestLZEncoder(unittest.TestCase):
     """Test LZEncoder compression."""
@@ -132,6 +199,70 @@ class TestLZEncoder(unittest.TestCase):
         # Should find ABC at position 0
         self.assertGreater(length, 0)
 
+    def test_find_match_overlapping_run(self):
+        """Test a run matches its own previous byte."""
+        encoder = LZEncoder()
+        offset, length = encoder._find_match(b"AAAAAAA", 1)
+        self.assertEqual((offset, length), (1, 6))
+
+    def test_find_match_prefers_nearest(self):
+        """Test equal-length matches resolve to the shortest offset."""
+        encoder = LZEncoder()
+        data = b"XYZ1XYZ2XYZ"
+        self.assertEqual(encoder._find_match(data, 8), (4, 3))
+
+    def test_find_match_any_position_order(self):
+        """Test lookups give the same result regardless of call order."""
+        data = b"ABCDEFABCDEFGHABCDEFGH"
+        encoder = LZEncoder()
+        later = encoder._find_match(data, 14)
+        earlier = encoder._find_match(data, 6)
+        self.assertEqual(later, LZEncoder()._find_match(data, 14))
+        self.assertEqual(earlier, LZEncoder()._find_match(data, 6))
+        self.assertEqual(later, (8, 8))
+        self.assertEqual(earlier, (6, 6))
+
+    def test_extend_match_continuation(self):
+        """Test a run is extended into an earlier copy that continues it."""
+        data = b"\x00" * 40 + b"QRSTUVWX" + b"\x00" * 40 + b"QRSTUVWX"
+        encoder = LZEncoder()
+        encoder._find_match(data, 58)
+        self.assertEqual(encoder._extend_match(data, 58, 1, 30), (48, 38))
+
+    def test_extend_match_without_index(self):
+        """Test the known match is kept when nothing is indexed yet."""
+        data = b"\x00" * 40 + b"QRSTUVWX" + b"\x00" * 40 + b"QRSTUVWX"
+        self.assertEqual(LZEncoder()._extend_match(data, 58, 1, 30), (1, 30))
+
+    def test_find_match_chain_limit(self):
+        """Test lower levels compare fewer hash chain candidates."""
+        data = b"ABCxyz" + b"ABC-" * 5 + b"ABCxyz"
+        pos = len(data) - 6
+        self.assertEqual(LZEncoder(level=1)._find_match(data, pos), (4, 3))
+        self.assertEqual(LZEncoder(level=9)._find_match(data, pos), (pos, 6))
+
+    def test_find_match_good_match_stops_search(self):
+        """Test the search stops at a match of good_match bytes."""
+        data = b"ABCDEFGH" + b"ABCD-" + b"ABCDEFGH"
+        pos = len(data) - 8
+        self.assertEqual(LZEncoder(level=1)._find_match(data, pos), (5, 4))
+        self.assertEqual(LZEncoder(level=6)._find_match(data, pos), (pos, 8))
+
+    def test_match_length_across_chunks(self):
+        """Test match lengths spanning several compare chunks."""
+        data = bytes(range(50)) * 3 + b"!"
+        self.assertEqual(_match_length(data, 0, 50, 200), 100)
+        self.assertEqual(_match_length(data, 0, 50, 37), 37)
+        self.assertEqual(_match_length(b"A" * 40, 0, 1, 39), 39)
+
+    def test_match_length_long_run(self):
+        """Test long matches stop exactly at the first mismatch or limit."""
+        for mismatch in (1, 3, 4, 5, 17, 100, 279):
+            data = bytearray(b"\x00" * 300)
+            data[1 + mismatch] = 1
+            self.assertEqual(_match_length(bytes(data), 0, 1, 281), mismatch)
+        self.assertEqual(_match_length(b"\x00" * 300, 0, 1, 281), 281)
+
     def test_encode_short_data(self):
         """Test encoding very short data."""
         encoder = LZEncoder()
@@ -153,6 +284,100 @@ class TestLZEncoder(unittest.TestCase):
 class TestHuffmanEncoder(unittest.TestCase):
     """Test HuffmanEncoder compression."""
 
+    def test_byte_frequencies(self):
+        """Test byte counts for narrow and wide alphabets."""
+        narrow = b"\x00" * 5000 + b"ab" * 10
+        freq = _byte_frequencies(narrow)
+        self.assertEqual(len(freq), 256)
+        self.assertEqual((freq[0], freq[ord("a")], freq[ord("b")]), (5000, 10, 10))
+        self.assertEqual(sum(freq), len(narrow))
+
+        wide = bytes(range(256)) * 8 + b"\xff"
+        freq = _byte_frequencies(wide)
+        self.assertEqual(freq[:255], [8] * 255)
+        self.assertEqual(freq[255], 9)
+        self.assertEqual(_byte_frequencies(b""), [0] * 256)
+
+        # Narrow sample followed by values it did not contain
+        mixed = b"\x00" * 2000 + bytes(range(256)) * 3
+        freq = _byte_frequencies(mixed)
+        self.assertEqual(freq[0], 2003)
+        self.assertEqual(freq[1:], [3] * 255)
+
+    def test_code_table_covers_all_bytes(self):
+        """Test the code table has an entry for every byte value."""
+        encoder = HuffmanEncoder()
+        encoder._build_tree(b"ABBCCCC")
+        table = encoder._code_table()
+        self.assertEqual(len(table), 256)
+        self.assertEqual(table[ord("C")], encoder._codes[ord("C")])
+        self.assertEqual(table[0], (0, 8))
+
+    def test_pair_codes_match_single_codes(self):
+        """Test large inputs coded by byte pairs match byte-by-byte coding."""
+        rng = random.Random(3)
+        data = bytes(min(255, int(rng.expovariate(0.05))) for _ in range(70001))
+        encoder = HuffmanEncoder()
+        table_bytes, encoded = encoder.encode(data)
+        self.assertGreaterEqual(len(data), encoder.PAIR_CODES_MIN_SIZE)
+
+        writer = BitWriter()
+        writer.write_codes(data, encoder._code_table())
+        self.assertEqual(encoded, bytes(writer.flush()))
+
+    def test_coded_size_matches_output(self):
+        """Test the predicted code size equals the encoded data size."""
+        rng = random.Random(5)
+        for size, values in ((0, 1), (7, 1), (300, 3), (5000, 256)):
+            data = bytes(rng.randrange(values) for _ in range(size))
+            encoder = HuffmanEncoder()
+            _table, encoded = encoder.encode(data)
+            self.assertEqual(encoder.coded_size(), len(encoded))
+
+    def test_generate_codes_deep_tree(self):
+        """Test codes for a maximally skewed tree of 256 symbols."""
+        # Internal node 0x100 + k holds byte k + 1 and the previous subtree
+        tree_nodes = [(0, 1)] + [(k + 1, 0x100 + k - 1) for k in range(1, 255)]
+        encoder = HuffmanEncoder()
+        encoder._generate_codes(tree_nodes, 0x100 + 254)
+        self.assertEqual(len(encoder._codes), 256)
+        self.assertEqual(encoder._codes[255], (0, 1))
+        self.assertEqual(encoder._codes[1], ((1 << 255) - 1, 255))
+        self.assertEqual(encoder._codes[0], ((1 << 255) - 2, 255))
+
+    def test_canonical_codes(self):
+        """Test canonical codes follow (length, byte) order."""
+        codes = _canonical_codes({ord("A"): 1, ord("B"): 2, ord("C"): 3, ord("D"): 3})
+        self.assertEqual(codes[ord("A")], (0b0, 1))
+        self.assertEqual(codes[ord("B")], (0b10, 2))
+        self.assertEqual(codes[ord("C")], (0b110, 3))
+        self.assertEqual(codes[ord("D")], (0b111, 3))
+
+    def test_limited_code_lengths(self):
+        """Test package-merge keeps lengths in bounds and the code complete."""
+        fibonacci = [1, 1]
+        while len(fibonacci) < 24:
+            fibonacci.append(fibonacci[-1] + fibonacci[-2])
+        freq = fibonacci + [0] * (256 - len(fibonacci))
+        lengths = _limited_code_lengths(freq, 15)
+        self.assertEqual(set(lengths), set(range(24)))
+        self.assertLessEqual(max(lengths.values()), 15)
+        self.assertEqual(sum(2 ** -length for length in lengths.values()), 1)
+
+    def test_skewed_data_code_length_limit(self):
+        """Test skewed data gets codes of at most 15 bits and decodes."""
+        fibonacci = [1, 1]
+        while len(fibonacci) < 20:
+            fibonacci.append(fibonacci[-1] + fibonacci[-2])
+        data = b"".join(bytes([i]) * count for i, count in enumerate(fibonacci))
+        encoder = HuffmanEncoder()
+        table = encoder._build_tree(data)
+        self.assertLessEqual(max(length for _code, length in encoder._codes.values()), 15)
+        # Root is the last internal node and sizes the table
+        self.assertEqual(len(table), 1 + 2 * (table[0] - 0xFF))
+        compressed = compress_jkr(data, CompressionType.HFIRW)
+        self.assertEqual(decompress_jkr(compressed), data)
+
     def test_encode_single_byte_type(self):
         """Test encoding data with single byte value."""
         encoder = HuffmanEncoder()
@@ -204,6 +429,82 @@ class TestCompressJkr(unittest.TestCase):
         self.assertEqual(decompressed, test_data)
 
 
+    def test_compress_returns_bytes(self):
+        """Test every compression type returns immutable bytes."""
+        test_data = b"Bytes result " * 20
+        for compression_type in (
+            CompressionType.RW,
+            CompressionType.HFIRW,
+            CompressionType.LZ,
+            CompressionType.HFI,
+        ):
+            result = compress_jkr(test_data, compression_type)
+            self.assertIs(type(result), bytes)
+            self.assertEqual(decompress_jkr(result), test_data)
+
+    def test_huffman_skipped_when_it_does_not_help(self):
+        """Test near-uniform data is stored without the Huffman pass."""
+        rng = random.Random(4)
+        test_data = bytes(rng.getrandbits(8) for _ in range(20000))
+        for compression_type, stored_type in (
+            (CompressionType.HFI, CompressionType.LZ),
+            (CompressionType.HFIRW, CompressionType.RW),
+        ):
+            result = compress_jkr(test_data, compression_type)
+            self.assertEqual(JKRHeader.from_bytes(result).compression_type, stored_type)
+            self.assertEqual(decompress_jkr(result), test_data)
+
+        skewed = b"AAAAAAAB" * 100
+        result = compress_jkr(skewed, CompressionType.HFIRW)
+        self.assertEqual(JKRHeader.from_bytes(result).compression_type, CompressionType.HFIRW)
+
+    def test_encode_into_reports_huffman_pass(self):
+        """Test encode_into stores the payload when Huffman coding is skipped."""
+        rng = random.Random(4)
+        uniform = bytes(rng.getrandbits(8) for _ in range(2000))
+        output = bytearray(b"HEAD")
+        self.assertFalse(HuffmanEncoder().encode_into(uniform, output, only_if_smaller=True))
+        self.assertEqual(output, b"HEAD")
+
+        self.assertFalse(HFIRWEncoder().encode_into(uniform, output))
+        self.assertEqual(output, b"HEAD" + uniform)
+
+        skewed = b"AAAAAAAB" * 100
+        output = bytearray()
+        self.assertTrue(HFIRWEncoder().encode_into(skewed, output))
+        self.assertEqual(output, HFIRWEncoder().encode(skewed))
+
+    def test_encoders_append_to_output(self):
+        """Test encoders append after the existing content of a buffer."""
+        test_data = b"Shared output " * 20
+        for encoder_class in (LZEncoder, HFIEncoder, HFIRWEncoder):
+            output = bytearray(b"HEAD")
+            result = encoder_class().encode_buffer(test_data, output)
+            self.assertIs(result, output)
+            self.assertEqual(bytes(output), b"HEAD" + encoder_class().encode(test_data))
+
+    def test_chunked_parse_with_executor(self):
+        """Test chunks parsed in an executor form one decodable stream."""
+        rng = random.Random(7)
+        words = [bytes(rng.getrandbits(8) for _ in range(rng.randrange(3, 20))) for _ in range(50)]
+        test_data = b"".join(rng.choice(words) for _ in range(3000))
+        header = JKRHeaderBuilder(
+            compression_type=CompressionType.LZ,
+            decompressed_size=len(test_data),
+        ).to_bytes()
+
+        encoder = LZEncoder()
+        encoder.PARALLEL_CHUNK_SIZE = 4096
+        output = bytearray(header)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = encoder.encode_buffer(test_data, output, executor)
+
+        self.assertIs(result, output)
+        self.assertEqual(decompress_jkr(bytes(output)), test_data)
+        # Matches still reach back across chunk starts
+        self.assertLess(len(output), len(test_data) // 2)
+
+
 class TestRoundTrip(unittest.TestCase):
     """Test round-trip compression and decompression."""
 
@@ -279,6 +580,125 @@ class TestLZEncoderCompression(unittest.TestCase):
         result = encoder.encode(data)
         self.assertIsInstance(result, bytes)
 
+    def test_lz_encode_long_run(self):
+        """Test a long byte run is copied from offset 1 in few back-references."""
+        data = b"XY" + b"\x00" * 1000 + b"Z"
+        result = LZEncoder().encode(data)
+        self.assertLess(len(result), 30)
+        compressed = compress_jkr(data, CompressionType.LZ)
+        self.assertEqual(decompress_jkr(compressed), data)
+
+    def _record_operations(self, encoder, data):
+        """Parse data and return the literal and back-reference operations."""
+        operations = []
+        ops = iter(encoder._parse(data))
+        pos = 0
+        for offset, length in zip(ops, ops):
+            if offset:
+                operations.append(("backref", offset, length))
+            else:
+                operations.extend(("literal", byte) for byte in data[pos : pos + length])
+            pos += length
+        return operations
+
+    def test_lz_lazy_match_defers_to_longer(self):
+        """Test lazy matching emits a literal when the next match is longer."""
+        data = b"ABCxBCDEFGHy" + b"ABCDEFGH"
+        greedy = self._record_operations(LZEncoder(level=1), data)
+        lazy = self._record_operations(LZEncoder(), data)
+        self.assertEqual(greedy[12:], [("backref", 12, 3), ("backref", 9, 5)])
+        self.assertEqual(lazy[12:], [("literal", ord("A")), ("backref", 9, 7)])
+
+    def test_lz_levels_roundtrip(self):
+        """Test every compression level decodes back to the input."""
+        data = b"ABCxBCDEFGHy" * 20 + bytes(range(64)) * 4
+        for level in range(1, 10):
+            compressed = JKRHeaderBuilder(
+                compression_type=CompressionType.LZ,
+                decompressed_size=len(data),
+            ).to_bytes() + LZEncoder(level).encode(data)
+            self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_lz_skip_ahead_on_incompressible_data(self):
+        """Test long runs of misses search fewer positions but still decode."""
+        rng = random.Random(0)
+        data = bytes(rng.getrandbits(8) for _ in range(4000))
+        encoder = LZEncoder()
+        find_match = encoder._find_match
+        searched = []
+
+        def counting_find_match(data, pos):
+            searched.append(pos)
+            return find_match(data, pos)
+
+        encoder._find_match = counting_find_match
+        encoded = encoder.encode(data)
+        self.assertLess(len(searched), len(data) // 2)
+
+        compressed = JKRHeaderBuilder(
+            compression_type=CompressionType.LZ,
+            decompressed_size=len(data),
+        ).to_bytes() + encoded
+        self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_lz_literal_runs(self):
+        """Test incompressible stretches are stored as raw literal runs."""
+        rng = random.Random(1)
+        # Longer than one run can hold
+        data = bytes(rng.getrandbits(8) for _ in range(9000))
+        encoded = LZEncoder().encode(data)
+        # Per-byte literals would need 9 bits per byte
+        self.assertLess(len(encoded), len(data) + 16)
+        for compression_type in (CompressionType.LZ, CompressionType.HFI):
+            compressed = compress_jkr(data, compression_type)
+            self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_lz_literal_run_between_matches(self):
+        """Test a literal run followed by a back-reference decodes."""
+        rng = random.Random(2)
+        noise = bytes(rng.getrandbits(8) for _ in range(40))
+        data = b"ABCDEFGH" + noise + b"ABCDEFGH" + noise[:5]
+        compressed = compress_jkr(data, CompressionType.LZ)
+        self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_lz_long_match_keeps_offset(self):
+        """Test a match longer than one back-reference reuses its offset."""
+        data = bytes(range(100)) * 10
+        operations = self._record_operations(LZEncoder(level=9), data)
+        self.assertEqual(
+            operations[100:],
+            [("backref", 100, 280)] * 3 + [("backref", 100, 60)],
+        )
+
+    def test_lz_invalid_level(self):
+        """Test levels outside 1-9 are rejected."""
+        with self.assertRaises(ValueError):
+            LZEncoder(level=0)
+        with self.assertRaises(ValueError):
+            LZEncoder(level=10)
+
+    def test_lz_encode_buffer_matches_encode(self):
+        """Test the buffer variant returns the same LZ77 data."""
+        data = b"ABCDEFABCDEF" * 10 + b"XYZ"
+        buffer = LZEncoder().encode_buffer(data)
+        self.assertIsInstance(buffer, bytearray)
+        self.assertEqual(bytes(buffer), LZEncoder().encode(data))
+
+    def test_lz_encode_bytes_like_input(self):
+        """Test bytearray and memoryview input encode like bytes."""
+        data = b"ABCDEFABCDEF" * 10 + b"XYZ"
+        expected = LZEncoder().encode(data)
+        self.assertEqual(LZEncoder().encode(bytearray(data)), expected)
+        self.assertEqual(LZEncoder().encode(memoryview(data)), expected)
+
+    def test_huffman_encode_bytes_like_input(self):
+        """Test memoryview input is Huffman coded like bytes."""
+        data = bytes(64) + b"Hello, World! " * 20
+        for compression_type in (CompressionType.HFIRW, CompressionType.HFI):
+            expected = compress_jkr(data, compression_type)
+            self.assertEqual(compress_jkr(memoryview(data), compression_type), expected)
+            self.assertEqual(decompress_jkr(expected), data)
+
     def test_lz_encode_repetitive(self):
         """Test LZ encoding with repetitive data."""
         encoder = LZEncoder()
@@ -306,6 +726,21 @@ class TestHFIEncoder(unittest.TestCase):
         result = encoder.encode(data)
         self.assertIsInstance(result, bytes)
 
+    def test_hfi_truncated_data(self):
+        """Test truncated HFI data decodes a prefix and zero-fills the rest."""
+        data = b"Hello, World! " * 20
+        output = bytearray(JKRHeaderBuilder(
+            compression_type=CompressionType.HFI,
+            decompressed_size=len(data),
+        ).to_bytes())
+        HFIEncoder().encode_buffer(data, output)
+        self.assertEqual(decompress_jkr(bytes(output)), data)
+
+        result = decompress_jkr(bytes(output[:-4]))
+        self.assertEqual(len(result), len(data))
+        self.assertEqual(result[:7], data[:7])
+        self.assertEqual(result[-7:], bytes(7))
+
 
 class TestHFIRWEncoder(unittest.TestCase):
     """Test Huffman-only encoding."""
@@ -325,6 +760,23 @@ class TestHFIRWEncoder(unittest.TestCase):
         result = encoder.encode(data)
         self.assertIsInstance(result, bytes)
 
+    def test_hfirw_long_codes(self):
+        """Test codes longer than the decoder lookup table round-trip."""
+        counts = [1, 1]
+        while len(counts) < 16:
+            counts.append(counts[-1] + counts[-2])
+        data = b"".join(bytes([value]) * count for value, count in enumerate(counts))
+        compressed = compress_jkr(data, CompressionType.HFIRW)
+        self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_hfirw_truncated_data(self):
+        """Test decoding truncated HFIRW data raises EOFError."""
+        data = b"Hello, World! " * 20
+        compressed = compress_jkr(data, CompressionType.HFIRW)
+        self.assertEqual(decompress_jkr(compressed), data)
+        with self.assertRaises(EOFError):
+            decompress_jkr(compressed[:-20])
+
 
 if __name__ == "__main__":
     unittest.main()
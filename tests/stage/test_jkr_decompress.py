@@ -107,6 +107,32 @@ class TestLZDecoder(unittest.TestCase):
         LZDecoder._jpk_copy_lz(buffer, 0, 4, 1)  # Copy with overlap
         self.assertEqual(buffer, bytearray(b"AAAAA"))
 
+    def test_jpk_copy_lz_overlap_pattern(self):
+        """Test overlapping copies repeat a multi-byte pattern."""
+        buffer = bytearray(b"AB\x00\x00\x00\x00\x00\x00")
+        LZDecoder._jpk_copy_lz(buffer, 1, 5, 2)
+        self.assertEqual(buffer, bytearray(b"ABABABA\x00"))
+
+    def test_decode_literals_and_backref(self):
+        """Test decoding literals followed by a short back-reference."""
+        # Flags 0 0 1 0 1 1: two literals, then case 0 with length 6
+        stream = BytesIO(b"\x2c" + b"AB" + b"\x01")
+        result = LZDecoder().decode(stream, 8)
+        self.assertEqual(result, b"ABABABAB")
+
+    def test_decode_truncated(self):
+        """Test truncated input leaves the rest of the output zeroed."""
+        stream = BytesIO(b"\x00" + b"ABC")
+        result = LZDecoder().decode(stream, 5)
+        self.assertEqual(result, b"ABC\x00\x00")
+
+    def test_decode_overrun(self):
+        """Test a back-reference past the output size is rejected."""
+        # Flags 0 1 0 1 1: one literal, then case 0 with length 6
+        stream = BytesIO(b"\x58" + b"A" + b"\x00")
+        with self.assertRaises(ValueError):
+            LZDecoder().decode(stream, 3)
+
 
 class TestDecompressJkr(unittest.TestCase):
     """Test the main decompress_jkr function."""
@@ -133,6 +159,20 @@ class TestDecompressJkr(unittest.TestCase):
         result = decompress_jkr(data)
         self.assertIsNone(result)
 
+    def test_decompress_raw_is_view(self):
+        """Test RW data is returned as a view into the input."""
+        header = struct.pack("<IHHII", JKR_MAGIC, 0x108, CompressionType.RW, 16, 4)
+        data = bytearray(header + b"data")
+        result = decompress_jkr(data)
+        data[16] = ord("D")
+        self.assertEqual(result, b"Data")
+
+    def test_decompress_unknown_type(self):
+        """Test an unknown compression type is rejected."""
+        data = struct.pack("<IHHII", JKR_MAGIC, 0x108, 9, 16, 4) + b"data"
+        with self.assertRaises(ValueError):
+            decompress_jkr(data)
+
     def test_decompress_type_none(self):
         """Test decompressing NONE type (same as RW)."""
         test_payload = b"Another test"
@@ -93,6 +93,11 @@ class TestStageSegment(unittest.TestCase):
         )
         self.assertEqual(segment.extension, "bin")
 
+    def test_no_instance_dict(self):
+        """Test segments use slots instead of a per-instance dict."""
+        segment = StageSegment(0, 0, 0, 0, b"", SegmentType.UNKNOWN)
+        self.assertFalse(hasattr(segment, "__dict__"))
+
 
 class TestIsStageContainer(unittest.TestCase):
     """Test stage container detection heuristic."""
@@ -120,6 +125,31 @@ class TestIsStageContainer(unittest.TestCase):
         self.assertFalse(is_stage_container(data))
 
 
+class TestParseStageContainer(unittest.TestCase):
+    """Test stage container parsing."""
+
+    def test_parse_entries(self):
+        """Test short and long entries are read with their indices."""
+        payload = struct.pack("<I", FileMagic.FMOD) + b"data"
+        header = struct.pack("<IIIIII", 60, 8, 0, 0, 0, 0)
+        header += struct.pack("<II", 2, 0)
+        header += struct.pack("<III", 0, 0, 0) + struct.pack("<III", 68, 4, 7)
+        segments = parse_stage_container(header + b"\x00" * 4 + payload + payload)
+
+        self.assertEqual([s.index for s in segments], [0, 4])
+        self.assertEqual(segments[0].data, payload)
+        self.assertEqual(segments[0].segment_type, SegmentType.FMOD)
+        self.assertEqual(segments[1].data, payload[:4])
+        self.assertEqual(segments[1].unknown, 7)
+        self.assertEqual(segments[1].segment_type, SegmentType.FMOD)
+
+    def test_truncated_table(self):
+        """Test a segment table running past the data is rejected."""
+        data = struct.pack("<IIIIIIII", 0, 0, 0, 0, 0, 0, 5, 0)
+        with self.assertRaises(struct.error):
+            parse_stage_container(data)
+
+
 class TestGetFmodSegments(unittest.TestCase):
     """Test FMOD segment filtering."""
 
@@ -247,5 +277,24 @@ class TestFileMagicEnum(unittest.TestCase):
             self.assertGreater(len(ext), 0)
 
 
+class TestPackageExports(unittest.TestCase):
+    """Test the lazily imported package API."""
+
+    def test_all_names_resolve(self):
+        """Test every name in __all__ resolves to its submodule object."""
+        import mhfrontier.stage as stage
+
+        for name in stage.__all__:
+            self.assertIsNotNone(getattr(stage, name))
+        self.assertIs(stage.SegmentType, SegmentType)
+
+    def test_unknown_name(self):
+        """Test unknown attributes still raise AttributeError."""
+        import mhfrontier.stage as stage
+
+        with self.assertRaises(AttributeError):
+            stage.not_a_name  # noqa: B018
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ import unittest
 from mhfrontier.stage.stage_export import (
     StageSegmentBuilder,
     build_stage_container,
+    build_stage_container_parts,
     segments_to_builders,
     build_segment_from_fmod,
     build_segment_from_texture,
@@ -124,6 +125,19 @@ class TestBuildStageContainer(unittest.TestCase):
         self.assertEqual(len(parsed[0].data), 7)
         self.assertEqual(len(parsed[1].data), 13)
 
+    def test_parts_join_to_container(self):
+        """Test the chunked form concatenates to the container bytes."""
+        segments = [
+            StageSegmentBuilder(data=b"A" * size, unknown=size)
+            for size in (5, 0, 8, 3, 1)
+        ]
+
+        parts = build_stage_container_parts(segments)
+
+        self.assertEqual(b"".join(parts), build_stage_container(segments))
+        # Segment data is passed through, not copied into a buffer
+        self.assertIs(parts[1], segments[0].data)
+
 
 class TestRoundTrip(unittest.TestCase):
     """Test round-trip: parse -> build -> parse."""
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for stage extraction and export orchestration."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from mhfrontier.export.blender_extractor import ExtractedMesh
+from mhfrontier.export.stage_export import (
+    StageExtractor,
+    collect_mesh_objects,
+    compress_segment_data,
+    validate_meshes,
+)
+from mhfrontier.stage.jkr_compress import LZEncoder
+from mhfrontier.stage.jkr_decompress import CompressionType, decompress_jkr
+
+
+def _make_object(name, obj_type="MESH", materials=(), data=None, modifiers=()):
+    """Build a minimal Blender object stand-in."""
+    if data is None:
+        data = _make_mesh_data(materials)
+    return SimpleNamespace(
+        name=name,
+        type=obj_type,
+        data=data,
+        modifiers=list(modifiers),
+        vertex_groups=[],
+    )
+
+
+def _make_mesh_data(materials=()):
+    """Build a mesh datablock stand-in with a stable pointer."""
+    data = SimpleNamespace(materials=list(materials))
+    data.as_pointer = lambda: id(data)
+    return data
+
+
+class _Collection:
+    """Collection stand-in counting walks over all_objects."""
+
+    def __init__(self, objects):
+        self._objects = objects
+        self.walks = 0
+
+    @property
+    def all_objects(self):
+        self.walks += 1
+        return iter(self._objects)
+
+
+class TestStageExtractor(unittest.TestCase):
+    """Test StageExtractor with a stubbed mesh extractor."""
+
+    def setUp(self):
+        """Set up an extractor that does not need Blender meshes."""
+        self.extractor = StageExtractor()
+        self.extractor._mesh_extractor = MagicMock()
+        self.extractor._mesh_extractor.extract.side_effect = (
+            lambda obj, depsgraph: ExtractedMesh(
+                name=obj.name, vertices=[], faces=[], normals=[]
+            )
+        )
+        self.collection = _Collection(
+            [_make_object("a"), _make_object("lamp", "LIGHT"), _make_object("b")]
+        )
+
+    def test_collect_mesh_objects(self):
+        """Test only mesh objects are collected."""
+        names = [obj.name for obj in collect_mesh_objects(self.collection)]
+
+        self.assertEqual(names, ["a", "b"])
+
+    def test_extracts_meshes_only(self):
+        """Test non-mesh objects are skipped."""
+        result = self.extractor.extract_from_collection(self.collection)
+
+        self.assertEqual([mesh.name for mesh in result.meshes], ["a", "b"])
+
+    def test_prefiltered_objects_skip_collection_walk(self):
+        """Test passing the mesh list avoids walking the collection again."""
+        mesh_objects = collect_mesh_objects(self.collection)
+
+        result = self.extractor.extract_from_collection(
+            self.collection, None, mesh_objects
+        )
+
+        self.assertEqual(self.collection.walks, 1)
+        self.assertEqual(len(result.meshes), 2)
+
+    def test_linked_duplicates_extracted_once(self):
+        """Test objects sharing mesh data reuse one extraction."""
+        shared = _make_mesh_data()
+        objects = [
+            _make_object("a", data=shared),
+            _make_object("b", data=shared),
+            _make_object("c"),
+        ]
+
+        result = self.extractor.extract_from_collection(_Collection(objects))
+
+        self.assertEqual(self.extractor._mesh_extractor.extract.call_count, 2)
+        self.assertEqual([mesh.name for mesh in result.meshes], ["a", "b", "c"])
+
+    def test_modified_objects_not_shared(self):
+        """Test objects with modifiers are evaluated individually."""
+        shared = _make_mesh_data()
+        objects = [
+            _make_object("a", data=shared, modifiers=["SUBSURF"]),
+            _make_object("b", data=shared, modifiers=["SUBSURF"]),
+        ]
+
+        self.extractor.extract_from_collection(_Collection(objects), depsgraph=object())
+
+        self.assertEqual(self.extractor._mesh_extractor.extract.call_count, 2)
+
+
+class TestValidateMeshes(unittest.TestCase):
+    """Test the pre-export mesh consistency checks."""
+
+    def _mesh(self, **overrides):
+        """Build a valid single-triangle mesh."""
+        fields = dict(
+            name="tri",
+            vertices=[(0, 0, 0), (1, 0, 0), (0, 1, 0)],
+            faces=[(0, 1, 2)],
+            normals=[(0, 0, 1)] * 3,
+        )
+        fields.update(overrides)
+        return ExtractedMesh(**fields)
+
+    def test_valid_mesh(self):
+        """Test a consistent mesh passes."""
+        validate_meshes([self._mesh(), self._mesh(faces=[])])
+
+    def test_face_index_out_of_range(self):
+        """Test faces referencing missing vertices are rejected."""
+        with self.assertRaises(ValueError):
+            validate_meshes([self._mesh(faces=[(0, 1, 3)])])
+
+    def test_attribute_count_mismatch(self):
+        """Test per-vertex attributes must match the vertex count."""
+        with self.assertRaises(ValueError):
+            validate_meshes([self._mesh(normals=[(0, 0, 1)])])
+        with self.assertRaises(ValueError):
+            validate_meshes([self._mesh(uvs=[(0, 0)] * 2)])
+
+
+class TestCompressSegmentData(unittest.TestCase):
+    """Test JKR compression of exported segment data."""
+
+    def test_small_data_in_process(self):
+        """Test data below two chunks is compressed without a pool."""
+        data = b"small segment " * 10
+        with patch("mhfrontier.export.stage_export.ProcessPoolExecutor") as pool:
+            compressed = compress_segment_data(data, max_workers=2)
+        pool.assert_not_called()
+        self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_in_process_by_default(self):
+        """Test worker processes are only used when requested."""
+        data = bytes(range(256)) * 40 + b"tail" * 500
+        with patch.object(LZEncoder, "PARALLEL_CHUNK_SIZE", 4096), patch(
+            "mhfrontier.export.stage_export.ProcessPoolExecutor"
+        ) as pool:
+            compressed = compress_segment_data(data)
+        pool.assert_not_called()
+        self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_large_data_in_worker_processes(self):
+        """Test chunked compression in worker processes round-trips."""
+        data = bytes(range(256)) * 40 + b"tail" * 500
+        with patch.object(LZEncoder, "PARALLEL_CHUNK_SIZE", 4096):
+            for compression_type in (CompressionType.LZ, CompressionType.HFI):
+                compressed = compress_segment_data(data, compression_type, max_workers=2)
+                self.assertEqual(decompress_jkr(compressed), data)
+
+    def test_pool_failure_falls_back(self):
+        """Test any process pool failure falls back to compressing in-process."""
+        data = bytes(range(256)) * 40 + b"tail" * 500
+        with patch.object(LZEncoder, "PARALLEL_CHUNK_SIZE", 4096), patch(
+            "mhfrontier.export.stage_export.ProcessPoolExecutor",
+            side_effect=AttributeError("Can't pickle local object"),
+        ):
+            compressed = compress_segment_data(data, max_workers=2)
+        self.assertEqual(decompress_jkr(compressed), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
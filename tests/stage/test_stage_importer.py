@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the stage importer using mock builders."""
+
+import struct
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mhfrontier.blender.builders import get_mock_builders
+from mhfrontier.importers import stage as stage_importer
+from mhfrontier.importers import stage_container, stage_directory
+from mhfrontier.stage.jkr_compress import compress_jkr_raw
+from mhfrontier.stage.jkr_decompress import JKR_MAGIC
+from mhfrontier.stage.stage_container import SegmentType, StageSegment
+
+
+def _make_mesh(material_list):
+    """Build a minimal FMesh stand-in with a single triangle."""
+    return SimpleNamespace(
+        vertices=[(0.0, 0.0, 0.0), (100.0, 0.0, 0.0), (50.0, 100.0, 0.0)],
+        faces=[[0, 1, 2]],
+        normals=[[0.0, 0.0, 1.0]] * 3,
+        uvs=[[0.0, 0.0], [1.0, 0.0], [0.5, 1.0]],
+        material_list=material_list,
+        material_map=[material_list[0]],
+        weights=None,
+        bone_remap=None,
+    )
+
+
+class TestImportFmodFromBytes(unittest.TestCase):
+    """Test importing FMOD data from bytes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.builders = get_mock_builders()
+
+    def _import(self, meshes, collection=None):
+        with patch.object(
+            stage_importer.fmod, "load_fmod_file_from_bytes", return_value=(meshes, [])
+        ):
+            return stage_importer.import_fmod_from_bytes(
+                b"", "stage", False, collection, None, self.builders
+            )
+
+    def test_objects_named_per_part(self):
+        """Test each mesh part becomes a named object."""
+        objects = self._import([_make_mesh([0]), _make_mesh([1])])
+
+        self.assertEqual([obj.name for obj in objects], ["stage_Part_000", "stage_Part_001"])
+
+    def test_materials_created_once_per_id(self):
+        """Test shared material ids create a single material."""
+        self._import([_make_mesh([2, 0]), _make_mesh([0, 2]), _make_mesh([11])])
+
+        names = [mat.name for mat in self.builders.material.created_materials]
+        self.assertEqual(
+            names, ["stage_Material-002", "stage_Material-000", "stage_Material-011"]
+        )
+
+    def test_large_material_ids_keep_full_number(self):
+        """Test material ids beyond three digits are not truncated."""
+        self._import([_make_mesh([1234])])
+
+        names = [mat.name for mat in self.builders.material.created_materials]
+        self.assertEqual(names, ["stage_Material-1234"])
+
+    def test_failed_import_leaves_no_unused_materials(self):
+        """Test materials of meshes never reached are not created."""
+        broken = _make_mesh([5])
+        broken.vertices = None
+
+        with self.assertRaises(TypeError):
+            self._import([_make_mesh([0]), broken, _make_mesh([9])])
+
+        names = [mat.name for mat in self.builders.material.created_materials]
+        self.assertNotIn("stage_Material-009", names)
+
+    def test_objects_moved_to_collection(self):
+        """Test imported objects are linked to the requested collection."""
+        collection = self.builders.scene.create_collection("stage")
+
+        objects = self._import([_make_mesh([0])], collection)
+
+        self.assertEqual(collection.objects, objects)
+
+
+class TestLoadJkrFile(unittest.TestCase):
+    """Test reading and decompressing JKR files."""
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _write(self, name, data):
+        path = Path(self.temp_dir.name) / name
+        path.write_bytes(data)
+        return path
+
+    def test_decompresses_jkr(self):
+        """Test a JKR file is returned decompressed."""
+        path = self._write("model.jkr", compress_jkr_raw(b"FMOD payload"))
+
+        self.assertEqual(stage_directory.load_jkr_file(path), b"FMOD payload")
+
+    def test_raw_data_passthrough(self):
+        """Test a file without JKR magic is returned unchanged."""
+        path = self._write("model.jkr", b"not compressed")
+
+        self.assertEqual(stage_directory.load_jkr_file(path), b"not compressed")
+
+
+class TestImportUnpackedStage(unittest.TestCase):
+    """Test scanning an unpacked stage directory."""
+
+    def test_dispatches_by_extension(self):
+        """Test FMOD and JKR files are found, other entries skipped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stage_dir = Path(temp_dir)
+            for name in ("a.fmod", "b.JKR", "c.png"):
+                (stage_dir / name).write_bytes(b"")
+            (stage_dir / "folder.fmod").mkdir()
+
+            calls = []
+            objects = stage_directory.import_unpacked_stage(
+                stage_dir,
+                False,
+                False,
+                lambda path, tex, coll: calls.append(("fmod", path.name)) or [path.name],
+                lambda path, tex, coll: calls.append(("jkr", path.name)) or [path.name],
+                get_mock_builders(),
+            )
+
+        self.assertEqual(calls, [("fmod", "a.fmod"), ("jkr", "b.JKR")])
+        self.assertEqual(objects, ["a.fmod", "b.JKR"])
+
+
+class TestDecompressSegments(unittest.TestCase):
+    """Test decompressing the JKR segments of a stage container."""
+
+    def _segment(self, index, data, segment_type=SegmentType.JKR):
+        return StageSegment(
+            index=index, offset=0, size=len(data), unknown=0,
+            data=data, segment_type=segment_type,
+        )
+
+    def test_single_segment(self):
+        """Test a single JKR segment is decompressed in-process."""
+        segments = [self._segment(0, compress_jkr_raw(b"only"))]
+
+        self.assertEqual(stage_container.decompress_segments(segments), {0: b"only"})
+
+    def test_multiple_segments(self):
+        """Test every JKR segment is decompressed and keyed by index."""
+        segments = [
+            self._segment(0, compress_jkr_raw(b"first")),
+            self._segment(1, b"FMOD", SegmentType.FMOD),
+            self._segment(4, compress_jkr_raw(b"second")),
+            self._segment(5, b"bad"),
+        ]
+
+        with patch.object(stage_container, "PARALLEL_MIN_PAYLOAD", 0):
+            result = stage_container.decompress_segments(segments, max_workers=2)
+
+        self.assertEqual(result, {0: b"first", 4: b"second", 5: None})
+
+    def test_corrupt_segment(self):
+        """Test a segment that fails to decompress does not stop the others."""
+        corrupt = struct.pack("<IHHII", JKR_MAGIC, 0x108, 9, 16, 4) + b"data"
+        segments = [
+            self._segment(0, compress_jkr_raw(b"first")),
+            self._segment(1, corrupt),
+            self._segment(2, compress_jkr_raw(b"third")),
+        ]
+
+        for min_payload in (0, stage_container.PARALLEL_MIN_PAYLOAD):
+            with patch.object(stage_container, "PARALLEL_MIN_PAYLOAD", min_payload):
+                result = stage_container.decompress_segments(segments, max_workers=2)
+
+            self.assertEqual(result, {0: b"first", 1: None, 2: b"third"})
+
+    def test_in_process_by_default(self):
+        """Test worker processes are only used when requested."""
+        segments = [
+            self._segment(0, compress_jkr_raw(b"first")),
+            self._segment(1, compress_jkr_raw(b"second")),
+        ]
+
+        with patch.object(stage_container, "PARALLEL_MIN_PAYLOAD", 0), patch.object(
+            stage_container, "ProcessPoolExecutor"
+        ) as pool:
+            result = stage_container.decompress_segments(segments)
+
+        pool.assert_not_called()
+        self.assertEqual(result, {0: b"first", 1: b"second"})
+
+    def test_small_container_in_process(self):
+        """Test small containers are decompressed without worker processes."""
+        segments = [
+            self._segment(0, compress_jkr_raw(b"first")),
+            self._segment(1, compress_jkr_raw(b"second")),
+        ]
+
+        with patch.object(stage_container, "ProcessPoolExecutor") as pool:
+            result = stage_container.decompress_segments(segments, max_workers=2)
+
+        pool.assert_not_called()
+        self.assertEqual(result, {0: b"first", 1: b"second"})
+
+    def test_memoryview_segments(self):
+        """Test segments viewing the container data go to worker processes."""
+        data = compress_jkr_raw(b"first") + compress_jkr_raw(b"second")
+        view = memoryview(data)
+        segments = [self._segment(0, view[:21]), self._segment(1, view[21:])]
+
+        with patch.object(stage_container, "PARALLEL_MIN_PAYLOAD", 0):
+            result = stage_container.decompress_segments(segments, max_workers=2)
+
+        self.assertEqual(result, {0: b"first", 1: b"second"})
+
+    def test_worker_thread_keeps_order(self):
+        """Test the worker thread yields segments in container order."""
+        segments = [
+            self._segment(0, compress_jkr_raw(b"first")),
+            self._segment(1, b"FMOD", SegmentType.FMOD),
+            self._segment(2, b"bad"),
+            self._segment(3, compress_jkr_raw(b"third")),
+        ]
+
+        result = list(stage_container.iter_decompressed_segments(segments, max_pending=1))
+
+        self.assertEqual(result, [(0, b"first"), (2, None), (3, b"third")])
+
+    def test_worker_thread_stops_when_closed(self):
+        """Test closing the iterator early releases the worker thread."""
+        segments = [
+            self._segment(i, compress_jkr_raw(b"payload")) for i in range(8)
+        ]
+
+        pending = stage_container.iter_decompressed_segments(segments, max_pending=1)
+        self.assertEqual(next(pending), (0, b"payload"))
+        pending.close()
+
+        for thread in threading.enumerate():
+            if thread.name == "jkr-decompress":
+                thread.join(timeout=2)
+                self.assertFalse(thread.is_alive())
+
+
+class TestIterImportSegments(unittest.TestCase):
+    """Test importing container segments one step at a time."""
+
+    def setUp(self):
+        """Set up mock builders and a recording FMOD import function."""
+        self.builders = get_mock_builders()
+        self.imported = []
+
+    def _import_fmod(self, data, name, import_textures, collection):
+        self.imported.append((name, data))
+        return [name]
+
+    def _segment(self, index, data, segment_type):
+        return StageSegment(
+            index=index, offset=0, size=len(data), unknown=0,
+            data=data, segment_type=segment_type,
+        )
+
+    def test_one_step_per_segment(self):
+        """Test each FMOD segment is imported in its own step."""
+        segments = [
+            self._segment(0, compress_jkr_raw(b"FMOD first"), SegmentType.JKR),
+            self._segment(1, b"FMOD second", SegmentType.FMOD),
+        ]
+
+        steps = stage_container.iter_import_segments(
+            segments, "stage", False, False, self._import_fmod, False, self.builders
+        )
+
+        self.assertEqual(next(steps), (1, 2, ["Stage_0000"]))
+        self.assertEqual(self.imported, [("Stage_0000", b"FMOD first")])
+        self.assertEqual(next(steps), (2, 2, ["Stage_0001"]))
+        self.assertEqual(list(steps), [])
+
+    def test_matches_import_segments(self):
+        """Test stepping yields the same objects as a full import."""
+        segments = [
+            self._segment(0, compress_jkr_raw(b"FMOD a"), SegmentType.JKR),
+            self._segment(3, compress_jkr_raw(b"FMOD b"), SegmentType.JKR),
+        ]
+
+        stepped = [
+            obj
+            for _done, _total, objects in stage_container.iter_import_segments(
+                segments, "stage", False, False, self._import_fmod, False, self.builders
+            )
+            for obj in objects
+        ]
+        full = stage_container.import_segments(
+            segments, "stage", False, False, self._import_fmod, False, self.builders
+        )
+
+        self.assertEqual(stepped, full)
+
+
+if __name__ == "__main__":
+    unittest.main()